@@ -5,6 +5,7 @@
 from __future__ import unicode_literals
 
 import configparser
+import importlib
 import os
 import sys
 import types
@@ -56,6 +57,10 @@ with open("sp-constants.csv") as fh:
 # Unwrap decorated methods so Sphinx can inspect their signatures
 import spotify  # noqa
 
+# Import the submodules that pyspotify otherwise imports on first use
+for mod_name in spotify._submodule_names:
+    importlib.import_module("spotify.%s" % mod_name)
+
 for mod_name, mod in vars(spotify).items():
     if not isinstance(mod, types.ModuleType) or mod_name in ("threading",):
         continue
@@ -1,18 +1,30 @@
 from __future__ import unicode_literals
 
+import contextlib
+import importlib
+import sys
 import threading
 
-import pkg_resources
-
-__version__ = pkg_resources.get_distribution("pyspotify").version
-
-
 # Global reentrant lock to be held whenever libspotify functions are called or
 # libspotify owned data is worked on. This is the heart of pyspotify's thread
 # safety.
 _lock = threading.RLock()
 
 
+class _BatchState(threading.local):
+    """Per-thread bookkeeping for :func:`batch` scopes.
+
+    Internal class.
+    """
+
+    depth = 0
+
+
+# Tracks how many :func:`batch` scopes the current thread has entered. While
+# the depth is non-zero, the current thread is known to hold :attr:`_lock`.
+_batch_state = _BatchState()
+
+
 # Reference to the spotify.Session instance. Used to enforce that one and only
 # one session exists in each process.
 _session_instance = None
@@ -62,6 +74,10 @@ def serialized(f):
             # Since we're already shutting down the process, we just abort the
             # call when the lock is gone.
             return
+        if _batch_state.depth:
+            # The current thread already holds the lock for the duration of a
+            # batch() scope, so there is no need to acquire it again.
+            return f(*args, **kwargs)
         with _lock:
             return f(*args, **kwargs)
 
@@ -71,18 +87,155 @@ def serialized(f):
     return wrapper
 
 
+@contextlib.contextmanager
+def batch():
+    """Context manager for running many libspotify calls under a single lock.
+
+    Every call to a function on :attr:`spotify.lib` normally acquires and
+    releases pyspotify's global lock. When reading many attributes of many
+    objects, e.g. when exporting metadata for thousands of tracks, the lock
+    handling can become a significant part of the total run time.
+
+    Within a :func:`batch` block, the lock is acquired once and held until the
+    block exits, and the calls made by the current thread skip the per-call
+    locking::
+
+        >>> with spotify.batch():
+        ...     rows = [(t.name, t.duration, t.popularity) for t in tracks]
+
+    Other threads, including the :class:`~spotify.EventLoop` thread and
+    libspotify's internal threads delivering callbacks, are blocked for as
+    long as the block runs, so keep the blocks short and avoid waiting on
+    anything, e.g. by calling :meth:`~spotify.Track.load`, inside them.
+
+    Batches can be nested.
+    """
+    with _lock:
+        _batch_state.depth += 1
+        try:
+            yield
+        finally:
+            _batch_state.depth -= 1
+
+
 class _SerializedLib(object):
     """CFFI library wrapper to serialize all calls to library functions.
 
+    The library functions are wrapped on first use, so that creating the
+    wrapper doesn't have to walk the full libspotify API.
+
     Internal class.
     """
 
     def __init__(self, lib):
-        for name in dir(lib):
-            attr = getattr(lib, name)
-            if name.startswith("sp_") and callable(attr):
-                attr = serialized(attr)
-            setattr(self, name, attr)
+        self._lib = lib
+
+    def __getattr__(self, name):
+        attr = getattr(self._lib, name)
+        if name.startswith("sp_") and callable(attr):
+            attr = serialized(attr)
+        setattr(self, name, attr)
+        return attr
+
+    def __dir__(self):
+        return dir(self._lib)
+
+
+def _get_version():
+    """Get pyspotify's version number from the installed package metadata.
+
+    Internal function.
+    """
+    try:
+        # Python 3.8+
+        from importlib.metadata import version
+    except ImportError:
+        import pkg_resources
+
+        return pkg_resources.get_distribution("pyspotify").version
+    else:
+        return version("pyspotify")
+
+
+# Mapping from submodules to the public names they contribute to the spotify
+# namespace. The submodules are imported when one of their names is first
+# accessed, so that e.g. reading spotify.ErrorType doesn't import all of
+# pyspotify.
+_submodule_names = {
+    "album": ["Album", "AlbumBrowser", "AlbumType"],
+    "artist": ["Artist", "ArtistBrowser", "ArtistBrowserType"],
+    "audio": [
+        "AudioBufferPool",
+        "AudioBufferStats",
+        "AudioFormat",
+        "Bitrate",
+        "SampleType",
+    ],
+    "compat": [],
+    "config": ["Config"],
+    "connection": ["ConnectionRule", "ConnectionState", "ConnectionType"],
+    "error": ["Error", "ErrorType", "LibError", "Timeout"],
+    "eventloop": ["AsyncioEventLoop", "EventLoop", "PollableEventLoop"],
+    "image": ["Image", "ImageFormat", "ImageSize"],
+    "inbox": ["InboxPostResult"],
+    "link": ["Link", "LinkType"],
+    "offline": ["OfflineSyncStatus"],
+    "player": ["PlayerState"],
+    "playlist": ["Playlist", "PlaylistEvent", "PlaylistOfflineStatus"],
+    "playlist_container": [
+        "PlaylistContainer",
+        "PlaylistContainerEvent",
+        "PlaylistFolder",
+        "PlaylistPlaceholder",
+        "PlaylistType",
+    ],
+    "playlist_track": ["PlaylistTrack"],
+    "playlist_unseen_tracks": ["PlaylistUnseenTracks"],
+    "search": ["Search", "SearchPlaylist", "SearchType"],
+    "session": ["Session", "SessionEvent"],
+    "sink": ["AlsaSink", "NullSink", "PortAudioSink", "TeeSink", "WavSink"],
+    "social": ["ScrobblingState", "SocialProvider"],
+    "stats": [],
+    "toplist": ["Toplist", "ToplistRegion", "ToplistType"],
+    "track": ["Track", "TrackAvailability", "TrackOfflineStatus"],
+    "user": ["User"],
+    "utils": ["LoadAllResult", "iter_load_all", "load_all"],
+    "version": ["get_libspotify_api_version", "get_libspotify_build_id"],
+}
+
+_lazy_names = {
+    name: module_name
+    for module_name, names in _submodule_names.items()
+    for name in names
+}
+
+__all__ = sorted(
+    ["__version__", "batch", "ffi", "lib", "serialized"]
+    + list(_submodule_names)
+    + list(_lazy_names)
+)
+
+
+def __getattr__(name):
+    """Import submodules and the names they define on first access.
+
+    Internal function. Only used on Python 3.7+, see :pep:`562`.
+    """
+    if name == "__version__":
+        value = _get_version()
+    elif name in _submodule_names:
+        return importlib.import_module("spotify.%s" % name)
+    elif name in _lazy_names:
+        module = importlib.import_module("spotify.%s" % _lazy_names[name])
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 _setup_logging()
@@ -91,27 +244,10 @@ from spotify._spotify import ffi, lib  # noqa
 
 lib = _SerializedLib(lib)
 
-from spotify.album import *  # noqa
-from spotify.artist import *  # noqa
-from spotify.audio import *  # noqa
-from spotify.config import *  # noqa
-from spotify.connection import *  # noqa
-from spotify.error import *  # noqa
-from spotify.eventloop import *  # noqa
-from spotify.image import *  # noqa
-from spotify.inbox import *  # noqa
-from spotify.link import *  # noqa
-from spotify.offline import *  # noqa
-from spotify.player import *  # noqa
-from spotify.playlist import *  # noqa
-from spotify.playlist_container import *  # noqa
-from spotify.playlist_track import *  # noqa
-from spotify.playlist_unseen_tracks import *  # noqa
-from spotify.search import *  # noqa
-from spotify.session import *  # noqa
-from spotify.sink import *  # noqa
-from spotify.social import *  # noqa
-from spotify.toplist import *  # noqa
-from spotify.track import *  # noqa
-from spotify.user import *  # noqa
-from spotify.version import *  # noqa
+if sys.version_info < (3, 7):
+    # Module level __getattr__ isn't supported, so import everything now.
+    __version__ = _get_version()
+    for _module_name in sorted(_submodule_names):
+        __getattr__(_module_name)
+    for _name in _lazy_names:
+        __getattr__(_name)
@@ -71,6 +71,19 @@ class Album(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the album's data is
+        loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await album.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @property
     def is_available(self):
         """Whether the album is available in the current region.
@@ -179,6 +192,19 @@ class Album(object):
         """
         return spotify.AlbumBrowser(self._session, album=self, callback=callback)
 
+    def browse_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes with a loaded
+        :class:`AlbumBrowser` for the album.
+
+        The future is completed from the browse request's completion callback,
+        so it can be awaited from a coroutine::
+
+            >>> browser = await album.browse_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return self.browse().load_async(timeout=timeout, loop=loop)
+
 
 class AlbumBrowser(object):
 
@@ -209,6 +235,7 @@ class AlbumBrowser(object):
 
         self._session = session
         self.loaded_event = threading.Event()
+        self.future = utils.create_future()
 
         if sp_albumbrowse is None:
             handle = ffi.new_handle((self._session, self, callback))
@@ -248,6 +275,11 @@ class AlbumBrowser(object):
     """:class:`threading.Event` that is set when the album browser is loaded.
     """
 
+    future = None
+    """:class:`concurrent.futures.Future` that is completed when the album
+    browser is loaded.
+    """
+
     @property
     def is_loaded(self):
         """Whether the album browser's data is loaded."""
@@ -263,6 +295,19 @@ class AlbumBrowser(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the album browser's
+        data is loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await browser.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @property
     def error(self):
         """An :class:`ErrorType` associated with the album browser.
@@ -377,6 +422,8 @@ def _albumbrowse_complete_callback(sp_albumbrowse, handle):
     (session, album_browser, callback) = ffi.from_handle(handle)
     session._callback_handles.remove(handle)
     album_browser.loaded_event.set()
+    utils.complete_future(album_browser)
+    session._change_notifier.notify()
     if callback is not None:
         callback(album_browser)
 
@@ -81,6 +81,19 @@ class Artist(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the artist's data
+        is loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await artist.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @serialized
     def portrait(self, image_size=None, callback=None):
         """The artist's portrait :class:`Image`.
@@ -144,6 +157,20 @@ class Artist(object):
             self._session, artist=self, type=type, callback=callback
         )
 
+    def browse_async(self, type=None, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes with a loaded
+        :class:`ArtistBrowser` for the artist.
+
+        The future is completed from the browse request's completion callback,
+        so it can be awaited from a coroutine::
+
+            >>> browser = await artist.browse_async()
+
+        See :meth:`browse` for details on ``type``, and
+        :func:`spotify.utils.load_async` for details on the future.
+        """
+        return self.browse(type=type).load_async(timeout=timeout, loop=loop)
+
 
 class ArtistBrowser(object):
 
@@ -176,6 +203,7 @@ class ArtistBrowser(object):
 
         self._session = session
         self.loaded_event = threading.Event()
+        self.future = utils.create_future()
 
         if sp_artistbrowse is None:
             if type is None:
@@ -201,6 +229,11 @@ class ArtistBrowser(object):
     """:class:`threading.Event` that is set when the artist browser is loaded.
     """
 
+    future = None
+    """:class:`concurrent.futures.Future` that is completed when the artist
+    browser is loaded.
+    """
+
     def __repr__(self):
         if self.is_loaded:
             return "ArtistBrowser(%r)" % self.artist.link.uri
@@ -234,6 +267,19 @@ class ArtistBrowser(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the artist
+        browser's data is loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await browser.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @property
     def error(self):
         """An :class:`ErrorType` associated with the artist browser.
@@ -435,6 +481,8 @@ def _artistbrowse_complete_callback(sp_artistbrowse, handle):
     (session, artist_browser, callback) = ffi.from_handle(handle)
     session._callback_handles.remove(handle)
     artist_browser.loaded_event.set()
+    utils.complete_future(artist_browser)
+    session._change_notifier.notify()
     if callback is not None:
         callback(artist_browser)
 
@@ -1,10 +1,123 @@
 from __future__ import unicode_literals
 
 import collections
+import threading
 
 from spotify import utils
 
-__all__ = ["AudioBufferStats", "AudioFormat", "Bitrate", "SampleType"]
+__all__ = [
+    "AudioBufferPool",
+    "AudioBufferStats",
+    "AudioFormat",
+    "Bitrate",
+    "SampleType",
+]
+
+
+class AudioBufferPool(object):
+
+    """A pool of reusable buffers for audio frames.
+
+    If a :class:`Session` has a pool set as its
+    :attr:`~spotify.Session.music_delivery_buffer_pool`, audio frames are
+    delivered to the :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` listener in
+    a buffer checked out from the pool, instead of in a new bytestring. The
+    listener owns the buffer, whether it consumes the frames or not. When the
+    listener, or the sink thread it hands the frames to, is done with the
+    buffer, it should give it back with :meth:`release`, so that it can be
+    reused for a later delivery. The bundled sinks do so. Buffers that aren't
+    given back are simply garbage collected.
+
+    The buffers are :class:`memoryview` slices of :class:`bytearray` objects
+    whose sizes are powers of two, so that a buffer can be reused for chunks
+    of any size up to its capacity. Thus, playback soon reaches a steady
+    state where no new buffers are allocated, even when libspotify delivers
+    chunks of varying sizes because the sink only consumed part of the
+    previous one. On Python 2, a :class:`memoryview` doesn't know which
+    buffer it is a slice of, so buffers are never reused.
+
+    Up to ``max_free`` unused buffers are kept in the pool in total. Giving
+    back a buffer that isn't checked out, e.g. a second time, has no effect.
+
+    Buffers can be checked out and given back from any thread.
+
+    Example::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> pool = spotify.AudioBufferPool()
+        >>> session.music_delivery_buffer_pool = pool
+        >>> def on_music_delivery(session, audio_format, frames, num_frames):
+        ...     sink_queue.put(frames)  # The sink calls pool.release(frames)
+        ...     return num_frames
+        ...
+        >>> session.on(spotify.SessionEvent.MUSIC_DELIVERY, on_music_delivery)
+    """
+
+    # The capacity of the smallest buffers, in bytes
+    min_capacity = 4096
+
+    def __init__(self, max_free=64):
+        self.max_free = max_free
+        self.allocated = 0
+        self.reused = 0
+        self._free = {}
+        self._num_free = 0
+        self._checked_out = set()
+        self._lock = threading.Lock()
+
+    allocated = None
+    """The number of buffers the pool has allocated."""
+
+    reused = None
+    """The number of times a buffer has been checked out again."""
+
+    def _capacity(self, size):
+        return max(self.min_capacity, 1 << (size - 1).bit_length())
+
+    def acquire(self, size):
+        """Check out a :class:`memoryview` of ``size`` bytes.
+
+        The contents of the buffer are undefined.
+        """
+        capacity = self._capacity(size)
+        with self._lock:
+            free = self._free.get(capacity)
+            if free:
+                buf = free.pop()
+                self._num_free -= 1
+                self.reused += 1
+            else:
+                buf = bytearray(capacity)
+                self.allocated += 1
+            self._checked_out.add(id(buf))
+        return memoryview(buf)[:size]
+
+    def acquire_frames(self, audio_format, num_frames):
+        """Check out a buffer for ``num_frames`` frames in ``audio_format``."""
+        return self.acquire(audio_format.frame_size() * num_frames)
+
+    def release(self, buf):
+        """Give a buffer checked out with :meth:`acquire` back to the pool.
+
+        The buffer must not be used after it is given back.
+        """
+        buf = getattr(buf, "obj", None)
+        if not isinstance(buf, bytearray):
+            return  # Not from a pool, or on Python 2
+        with self._lock:
+            try:
+                self._checked_out.remove(id(buf))
+            except KeyError:
+                return  # Not checked out from this pool, or already given back
+            if self._num_free >= self.max_free:
+                return
+            self._free.setdefault(len(buf), []).append(buf)
+            self._num_free += 1
+
+    def num_free(self):
+        """The number of unused buffers in the pool."""
+        return self._num_free
 
 
 class AudioBufferStats(
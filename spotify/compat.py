@@ -12,3 +12,9 @@ else:
 
     text_type = str
     binary_type = bytes
+
+try:
+    from concurrent import futures  # noqa
+except ImportError:  # pragma: no cover
+    # Python 2 without the "futures" backport installed
+    futures = None
@@ -19,10 +19,11 @@ class Error(Exception):
 
         Internal method.
         """
-        ignores = set(ignores or [])
-        ignores.add(ErrorType.OK)
-        if error_type not in ignores:
-            raise LibError(error_type)
+        if error_type == ErrorType.OK:
+            return
+        if ignores and error_type in ignores:
+            return
+        raise LibError(error_type)
 
 
 @utils.make_enum("SP_ERROR_")
@@ -56,11 +57,9 @@ class LibError(Error):
         return not self.__eq__(other)
 
 
-for attr in dir(lib):
-    if attr.startswith("SP_ERROR_"):
-        name = attr.replace("SP_ERROR_", "")
-        error_no = getattr(lib, attr)
-        setattr(LibError, name, LibError(error_no))
+for attr, error_no in utils.get_lib_constants("SP_ERROR_"):
+    name = attr.replace("SP_ERROR_", "")
+    setattr(LibError, name, LibError(error_no))
 
 
 class Timeout(Error):
@@ -1,21 +1,25 @@
 from __future__ import unicode_literals
 
+import errno
 import logging
+import os
 import threading
-
-try:
-    # Python 3
-    import queue
-except ImportError:
-    # Python 2
-    import Queue as queue
+import time
 
 import spotify
 
-__all__ = ["EventLoop"]
+__all__ = ["AsyncioEventLoop", "EventLoop", "PollableEventLoop"]
 
 logger = logging.getLogger(__name__)
 
+# Python 2 doesn't have time.monotonic() or time.perf_counter()
+_clock = getattr(time, "monotonic", time.time)
+_perf_clock = getattr(time, "perf_counter", time.time)
+
+
+def _get_ident():
+    return threading.current_thread().ident
+
 
 class EventLoop(threading.Thread):
 
@@ -38,6 +42,9 @@ class EventLoop(threading.Thread):
     :meth:`~threading.Thread.join` to block until the event loop thread has
     finished, just like for any other thread.
 
+    To find out why and how long the event loop is busy, see
+    :func:`spotify.stats.enable_event_loop_metrics`.
+
     .. warning::
 
         If you use :class:`EventLoop` to process the libspotify events, any
@@ -55,7 +62,23 @@ class EventLoop(threading.Thread):
 
         self._session = session
         self._runnable = True
-        self._queue = queue.Queue()
+        self._condition = threading.Condition()
+        self._pending = False
+        self._notified_at = None
+        self._metrics = None
+
+    notifications = 0
+    """Number of :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` events
+    received.
+
+    Any number of notifications received while the event loop is busy are
+    coalesced into a single call to :meth:`~spotify.Session.process_events`.
+    """
+
+    passes = 0
+    """Number of times :meth:`~spotify.Session.process_events` has been called,
+    either because of notifications or because its timeout was reached.
+    """
 
     def start(self):
         """Start the event loop."""
@@ -63,35 +86,323 @@ class EventLoop(threading.Thread):
             spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._on_notify_main_thread
         )
         threading.Thread.start(self)
+        self._session._change_notifier.event_loop_thread = self.ident
 
     def stop(self):
         """Stop the event loop."""
         self._runnable = False
+        self._session._change_notifier.event_loop_thread = None
         self._session.off(
             spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._on_notify_main_thread
         )
+        with self._condition:
+            self._condition.notify()
 
     def run(self):
         logger.debug("Spotify event loop started")
-        timeout = self._session.process_events() / 1000.0
+        timeout = self._process_events(False, None)
         while self._runnable:
-            try:
-                logger.debug("Waiting %.3fs for new events", timeout)
-                self._queue.get(timeout=timeout)
-            except queue.Empty:
-                logger.debug("Timeout reached; processing events")
-            else:
+            with self._condition:
+                if not self._pending:
+                    logger.debug("Waiting %.3fs for new events", timeout)
+                    self._condition.wait(timeout)
+                notified = self._pending
+                notified_at = self._notified_at
+                self._pending = False
+                self._notified_at = None
+            if not self._runnable:
+                break
+            if notified:
                 logger.debug("Notification received; processing events")
-            finally:
-                timeout = self._session.process_events() / 1000.0
+            else:
+                logger.debug("Timeout reached; processing events")
+            timeout = self._process_events(notified, notified_at)
         logger.debug("Spotify event loop stopped")
 
+    def _process_events(self, notified, notified_at):
+        self.passes += 1
+        metrics = self._metrics
+        if metrics is None:
+            return self._session.process_events() / 1000.0
+
+        started = _perf_clock()
+        timeout = self._session.process_events() / 1000.0
+        duration = _perf_clock() - started
+        latency = None
+        if notified_at is not None:
+            latency = started - notified_at
+        metrics.record(notified, latency, duration, timeout)
+        logger.debug(
+            "Processed events in %.3fms after %s; next timeout is %.3fs",
+            duration * 1000,
+            "notification" if notified else "timeout",
+            timeout,
+        )
+        return timeout
+
     def _on_notify_main_thread(self, session):
         # WARNING: This event listener is called from an internal libspotify
-        # thread. It must not block.
+        # thread. It must not block. The condition's lock is never held for
+        # long by the event loop thread.
+        with self._condition:
+            self.notifications += 1
+            if not self._pending:
+                self._pending = True
+                if self._metrics is not None:
+                    self._notified_at = _perf_clock()
+                self._condition.notify()
+
+
+class AsyncioEventLoop(object):
+
+    """Event loop for processing events from libspotify on an :mod:`asyncio`
+    event loop.
+
+    This is an alternative to :class:`EventLoop` for applications built on
+    asyncio. Instead of running a separate thread, it calls
+    :meth:`~spotify.Session.process_events` from the asyncio event loop, both
+    when libspotify emits :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD`
+    events and when the timeout returned by
+    :meth:`~spotify.Session.process_events` is reached.
+
+    To use it, pass it your :class:`~spotify.Session` instance, and optionally
+    the asyncio event loop to use, and call :meth:`start`::
+
+        >>> session = spotify.Session()
+        >>> event_loop = spotify.AsyncioEventLoop(session)
+        >>> event_loop.start()
+
+    If ``loop`` is :class:`None`, the current asyncio event loop is used when
+    :meth:`start` is called. The asyncio event loop must be running for any
+    events to be processed. Call :meth:`stop` to stop processing events.
+
+    Since libspotify events are processed on the asyncio event loop, any event
+    listeners you've registered will be called from the asyncio event loop's
+    thread, where the rest of your application's state lives, and not from a
+    separate thread.
+
+    Requires Python 3.5 or newer.
+    """
+
+    def __init__(self, session, loop=None):
+        self._session = session
+        self._loop = loop
+        self._runnable = False
+        self._scheduled = False
+        self._timer = None
+
+    def start(self):
+        """Start processing events on the asyncio event loop."""
+        if self._loop is None:
+            import asyncio
+
+            self._loop = asyncio.get_event_loop()
+        self._runnable = True
+        self._session.on(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._on_notify_main_thread
+        )
+        self._session._change_notifier.event_loop_thread = _get_ident()
+        self._schedule()
+
+    def stop(self):
+        """Stop processing events."""
+        self._runnable = False
+        self._session._change_notifier.event_loop_thread = None
+        self._session.off(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._on_notify_main_thread
+        )
+
+    def _process_events(self):
+        self._scheduled = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._runnable:
+            logger.debug("Spotify event loop stopped")
+            return
+        # The asyncio event loop may run on another thread than start() was
+        # called from.
+        self._session._change_notifier.event_loop_thread = _get_ident()
+        timeout = self._session.process_events() / 1000.0
+        logger.debug("Waiting %.3fs for new events", timeout)
+        self._timer = self._loop.call_later(timeout, self._process_events)
+
+    def _schedule(self):
+        # Multiple notifications before the events are processed are
+        # coalesced into a single call to process_events().
+        if self._scheduled:
+            return
+        self._scheduled = True
         try:
-            self._queue.put_nowait(1)
-        except queue.Full:
+            self._loop.call_soon_threadsafe(self._process_events)
+        except RuntimeError:
+            self._scheduled = False
             logger.warning(
-                "pyspotify event loop queue full; dropped notification event"
+                "pyspotify asyncio event loop is closed; dropped notification event"
             )
+
+    def _on_notify_main_thread(self, session):
+        # WARNING: This event listener is called from an internal libspotify
+        # thread. It must not block.
+        self._schedule()
+
+
+class PollableEventLoop(object):
+
+    """Event loop for processing events from libspotify from any reactor that
+    can poll a file descriptor.
+
+    This is an alternative to :class:`EventLoop` for applications that already
+    have a select/poll/epoll based event loop, like a :mod:`selectors` based
+    server, uvloop, or a Twisted reactor. Instead of running a separate thread,
+    it exposes a file descriptor that becomes readable when libspotify emits
+    :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` events, and the
+    :attr:`timeout` after which events must be processed even if the file
+    descriptor hasn't become readable.
+
+    Whenever the file descriptor is readable or the timeout is reached, call
+    :meth:`process_events`. For example, with :mod:`selectors`::
+
+        >>> session = spotify.Session()
+        >>> event_loop = spotify.PollableEventLoop(session)
+        >>> event_loop.start()
+        >>> selector = selectors.DefaultSelector()
+        >>> selector.register(event_loop, selectors.EVENT_READ)
+        >>> while True:
+        ...     selector.select(event_loop.timeout)
+        ...     event_loop.process_events()
+
+    The file descriptor is an eventfd on Linux with Python 3.10 or newer, and
+    the read end of a pipe elsewhere. Only Unix-like systems are supported.
+
+    Any event listeners you've registered will be called from the thread
+    calling :meth:`process_events`.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._lock = threading.Lock()
+        self._pending = False
+        self._deadline = None
+        self._read_fd = None
+        self._write_fd = None
+
+    notifications = 0
+    """Number of :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` events
+    received."""
+
+    passes = 0
+    """Number of times :meth:`~spotify.Session.process_events` has been
+    called."""
+
+    def start(self):
+        """Create the file descriptor and start listening for notifications.
+
+        The file descriptor is readable right after :meth:`start`, so that
+        events are processed as soon as the reactor polls it.
+        """
+        self._read_fd, self._write_fd = _create_wakeup_fds()
+        self._session.on(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._on_notify_main_thread
+        )
+        self._session._change_notifier.event_loop_thread = _get_ident()
+        self._wake_up()
+
+    def stop(self):
+        """Stop listening for notifications and close the file descriptor."""
+        self._session._change_notifier.event_loop_thread = None
+        self._session.off(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._on_notify_main_thread
+        )
+        with self._lock:
+            if self._read_fd is not None:
+                os.close(self._read_fd)
+            if self._write_fd not in (None, self._read_fd):
+                os.close(self._write_fd)
+            self._read_fd = self._write_fd = None
+
+    def fileno(self):
+        """The file descriptor to poll for readability.
+
+        This method makes it possible to pass the event loop object itself to
+        e.g. :func:`select.select`.
+        """
+        return self._read_fd
+
+    @property
+    def timeout(self):
+        """Seconds until :meth:`process_events` must be called, even if the
+        file descriptor hasn't become readable.
+
+        Is 0 if :meth:`process_events` should be called right away.
+        """
+        if self._deadline is None:
+            return 0
+        return max(0, self._deadline - _clock())
+
+    def process_events(self):
+        """Process libspotify events.
+
+        Clears the file descriptor's readability and calls
+        :meth:`~spotify.Session.process_events`. Returns the number of seconds
+        until this method must be called again, which is also available as
+        :attr:`timeout`.
+        """
+        with self._lock:
+            self._pending = False
+            self._drain()
+            if self._read_fd is not None:
+                # The reactor may run on another thread than start() was
+                # called from.
+                self._session._change_notifier.event_loop_thread = _get_ident()
+        self.passes += 1
+        timeout = self._session.process_events() / 1000.0
+        self._deadline = _clock() + timeout
+        return timeout
+
+    def _drain(self):
+        # Called with the lock held.
+        if self._read_fd is None:
+            return
+        try:
+            while os.read(self._read_fd, 8):
+                if self._read_fd == self._write_fd:
+                    break
+        except OSError as exc:
+            if exc.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+
+    def _wake_up(self):
+        with self._lock:
+            if self._pending or self._write_fd is None:
+                return
+            self._pending = True
+            try:
+                os.write(self._write_fd, b"\x01\0\0\0\0\0\0\0")
+            except OSError as exc:
+                # The pipe or eventfd is full, and thus already readable
+                if exc.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    raise
+
+    def _on_notify_main_thread(self, session):
+        # WARNING: This event listener is called from an internal libspotify
+        # thread. It must not block.
+        self.notifications += 1
+        self._wake_up()
+
+
+def _create_wakeup_fds():
+    if hasattr(os, "eventfd"):
+        fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        return fd, fd
+    return _create_pipe()
+
+
+def _create_pipe():
+    import fcntl
+
+    fds = os.pipe()
+    for fd in fds:
+        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+    return fds
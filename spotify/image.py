@@ -50,6 +50,7 @@ class Image(object):
         self._sp_image = ffi.gc(sp_image, lib.sp_image_release)
 
         self.loaded_event = threading.Event()
+        self.future = utils.create_future()
 
         handle = ffi.new_handle((self._session, self, callback))
         self._session._callback_handles.add(handle)
@@ -75,6 +76,11 @@ class Image(object):
     loaded_event = None
     """:class:`threading.Event` that is set when the image is loaded."""
 
+    future = None
+    """:class:`concurrent.futures.Future` that is completed when the image is
+    loaded.
+    """
+
     @property
     def is_loaded(self):
         """Whether the image's data is loaded."""
@@ -98,6 +104,19 @@ class Image(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the image's data is
+        loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await image.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @property
     def format(self):
         """The :class:`ImageFormat` of the image.
@@ -161,6 +180,8 @@ def _image_load_callback(sp_image, handle):
     (session, image, callback) = ffi.from_handle(handle)
     session._callback_handles.remove(handle)
     image.loaded_event.set()
+    utils.complete_future(image)
+    session._change_notifier.notify()
     if callback is not None:
         callback(image)
 
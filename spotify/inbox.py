@@ -33,6 +33,7 @@ class InboxPostResult(object):
 
         self._session = session
         self.loaded_event = threading.Event()
+        self.future = utils.create_future()
 
         if sp_inbox is None:
             canonical_username = utils.to_char(canonical_username)
@@ -68,6 +69,11 @@ class InboxPostResult(object):
     loaded.
     """
 
+    future = None
+    """:class:`concurrent.futures.Future` that is completed when the inbox post
+    result is loaded.
+    """
+
     def __repr__(self):
         if not self.loaded_event.is_set():
             return "InboxPostResult(<pending>)"
@@ -105,5 +111,7 @@ def _inboxpost_complete_callback(sp_inbox, handle):
     (session, inbox_post_result, callback) = ffi.from_handle(handle)
     session._callback_handles.remove(handle)
     inbox_post_result.loaded_event.set()
+    utils.complete_future(inbox_post_result)
+    session._change_notifier.notify()
     if callback is not None:
         callback(inbox_post_result)
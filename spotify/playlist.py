@@ -111,6 +111,19 @@ class Playlist(utils.EventEmitter):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the playlist's data
+        is loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await playlist.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @property
     @serialized
     def tracks(self):
@@ -409,12 +422,18 @@ class Playlist(utils.EventEmitter):
         return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
 
     @serialized
-    def on(self, event, listener, *user_args):
+    def _add_callbacks(self):
+        # Also called while the playlist is loading, as the callbacks notify
+        # threads waiting for it to load.
         if self._sp_playlist_callbacks is None:
             self._sp_playlist_callbacks = _PlaylistCallbacks.get_struct()
             lib.sp_playlist_add_callbacks(
                 self._sp_playlist, self._sp_playlist_callbacks, ffi.NULL
             )
+
+    @serialized
+    def on(self, event, listener, *user_args):
+        self._add_callbacks()
         if self not in self._session._emitters:
             self._session._emitters.append(self)
         super(Playlist, self).on(event, listener, *user_args)
@@ -678,6 +697,7 @@ class _PlaylistCallbacks(object):
         playlist = Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True
         )
+        playlist._session._change_notifier.notify()
         playlist.emit(PlaylistEvent.PLAYLIST_STATE_CHANGED, playlist)
 
     @staticmethod
@@ -148,6 +148,19 @@ class PlaylistContainer(compat.MutableSequence, utils.EventEmitter):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the playlist
+        container's data is loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await container.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     def __len__(self):
         # Required by collections.abc.Sequence
 
@@ -413,7 +426,9 @@ class PlaylistContainer(compat.MutableSequence, utils.EventEmitter):
         self[index:index] = [value]
 
     @serialized
-    def on(self, event, listener, *user_args):
+    def _add_callbacks(self):
+        # Also called while the container is loading, as the callbacks notify
+        # threads waiting for it to load.
         if self._sp_playlistcontainer_callbacks is None:
             self._sp_playlistcontainer_callbacks = (
                 _PlaylistContainerCallbacks.get_struct()
@@ -423,6 +438,10 @@ class PlaylistContainer(compat.MutableSequence, utils.EventEmitter):
                 self._sp_playlistcontainer_callbacks,
                 ffi.NULL,
             )
+
+    @serialized
+    def on(self, event, listener, *user_args):
+        self._add_callbacks()
         if self not in self._session._emitters:
             self._session._emitters.append(self)
         super(PlaylistContainer, self).on(event, listener, *user_args)
@@ -597,6 +616,7 @@ class _PlaylistContainerCallbacks(object):
         playlist_container = PlaylistContainer._cached(
             spotify._session_instance, sp_playlistcontainer, add_ref=True
         )
+        playlist_container._session._change_notifier.notify()
         playlist_container.emit(
             PlaylistContainerEvent.CONTAINER_LOADED, playlist_container
         )
@@ -54,6 +54,7 @@ class Search(object):
         self.search_type = search_type
 
         self.loaded_event = threading.Event()
+        self.future = utils.create_future()
 
         if sp_search is None:
             handle = ffi.new_handle((self._session, self, callback))
@@ -98,6 +99,11 @@ class Search(object):
     loaded_event = None
     """:class:`threading.Event` that is set when the search is loaded."""
 
+    future = None
+    """:class:`concurrent.futures.Future` that is completed when the search is
+    loaded.
+    """
+
     @property
     def is_loaded(self):
         """Whether the search's data is loaded."""
@@ -121,6 +127,19 @@ class Search(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the search's data
+        is loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await search.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @property
     @serialized
     def query(self):
@@ -362,6 +381,8 @@ def _search_complete_callback(sp_search, handle):
     (session, search_result, callback) = ffi.from_handle(handle)
     session._callback_handles.remove(handle)
     search_result.loaded_event.set()
+    utils.complete_future(search_result)
+    session._change_notifier.notify()
     if callback is not None:
         callback(search_result)
 
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import logging
+import time
 import warnings
 import weakref
 
@@ -14,6 +15,30 @@ __all__ = ["Session", "SessionEvent"]
 
 logger = logging.getLogger(__name__)
 
+# Python 2 doesn't have time.monotonic()
+_clock = getattr(time, "monotonic", time.time)
+
+# Whether a MUSIC_DELIVERY listener has been warned about keeping an export
+# of the zero-copy frames
+_warned_frames_view_exported = False
+
+
+def _release_frames_view(frames_view):
+    global _warned_frames_view_exported
+    if not hasattr(frames_view, "release"):
+        return  # Not available on Python 2
+    try:
+        frames_view.release()
+    except BufferError:
+        # The listener still holds an export of the view, e.g. from
+        # numpy.frombuffer(). The frames were consumed anyway.
+        if not _warned_frames_view_exported:
+            _warned_frames_view_exported = True
+            logger.warning(
+                "MUSIC_DELIVERY listener kept an export of the zero-copy "
+                "frames, which are only valid until the listener returns"
+            )
+
 
 class Session(utils.EventEmitter):
 
@@ -62,6 +87,7 @@ class Session(utils.EventEmitter):
         self._cache = weakref.WeakValueDictionary()
         self._emitters = []
         self._callback_handles = set()
+        self._change_notifier = utils.ChangeNotifier()
 
         self.connection = spotify.connection.Connection(self)
         self.offline = spotify.offline.Offline(self)
@@ -107,6 +133,34 @@ class Session(utils.EventEmitter):
     Internal attribute.
     """
 
+    _audio_format_cache = None
+    """A tuple of the ``(sample_type, sample_rate, channels)`` of the last
+    audio delivered, an :class:`~spotify.AudioFormat` with a copy of that
+    format, and its frame size.
+
+    Used by the ``music_delivery`` callback to only create a new
+    :class:`~spotify.AudioFormat` when the format changes.
+
+    Internal attribute.
+    """
+
+    _metadata_coalescer = None
+    """A :class:`_MetadataUpdateCoalescer` if
+    :attr:`metadata_update_interval` is set, otherwise :class:`None`.
+
+    Internal attribute.
+    """
+
+    _change_notifier = None
+    """A :class:`~spotify.utils.ChangeNotifier` that is notified when
+    libspotify may have changed the state of its objects.
+
+    Used by :meth:`~spotify.Track.load` and friends to sleep until there is
+    a reason to check if the object is loaded.
+
+    Internal attribute.
+    """
+
     config = None
     """A :class:`Config` instance with the current configuration.
 
@@ -129,6 +183,39 @@ class Session(utils.EventEmitter):
     """A :class:`~spotify.social.Social` instance for controlling social
     sharing."""
 
+    music_delivery_zero_copy = False
+    """Whether to give :attr:`~SessionEvent.MUSIC_DELIVERY` listeners a
+    :class:`memoryview` of libspotify's audio buffer instead of a copy.
+
+    Defaults to :class:`False`, which copies each chunk of audio frames to a
+    new bytestring before calling the listener. If set to :class:`True`, the
+    listener gets a :class:`memoryview` of the buffer libspotify delivered the
+    frames in, which saves an allocation and a copy per delivery when the
+    listener writes the frames straight to a device or file.
+
+    The memory is owned by libspotify and is only valid until the listener
+    returns. The listener must not keep the :class:`memoryview`, or any slice
+    of it, after it returns, but must copy any frames it doesn't consume
+    immediately, e.g. with ``bytes(frames)``. On Python 3, the
+    :class:`memoryview` is released when the listener returns, so that later
+    use of it raises :exc:`ValueError` instead of reading freed memory.
+    """
+
+    music_delivery_buffer_pool = None
+    """An :class:`~spotify.AudioBufferPool` to deliver audio frames in, or
+    :class:`None`.
+
+    If set, each chunk of audio frames is copied to a :class:`memoryview`
+    buffer checked out from the pool before calling the
+    :attr:`~SessionEvent.MUSIC_DELIVERY` listener, instead of to a new
+    bytestring. The listener owns the buffer, even if it consumes none of the
+    frames. It may keep the buffer for as long as it needs, and should give
+    it back to the pool with :meth:`~spotify.AudioBufferPool.release` when
+    done with it. The bundled audio sinks do so.
+
+    Ignored if :attr:`music_delivery_zero_copy` is set.
+    """
+
     def login(self, username, password=None, remember_me=False, blob=None):
         """Authenticate to Spotify's servers.
 
@@ -312,6 +399,42 @@ class Session(utils.EventEmitter):
             lib.sp_session_set_volume_normalization(self._sp_session, value)
         )
 
+    @property
+    def metadata_update_interval(self):
+        """Minimum number of seconds between
+        :attr:`~SessionEvent.METADATA_UPDATED` events, or :class:`None`.
+
+        libspotify reports metadata updates in bursts, e.g. while large
+        playlists load, and each report normally causes a
+        :attr:`~SessionEvent.METADATA_UPDATED` event. If this is set to a
+        number of seconds, the reports are instead counted and a single event
+        is emitted at the end of a :meth:`process_events` call, at most once
+        per interval. If set to ``0``, an event is emitted at the end of every
+        :meth:`process_events` call that received one or more reports. The
+        timeout returned by :meth:`process_events` is shortened so that
+        pending events are emitted when the interval has passed.
+
+        While this is set, :attr:`~SessionEvent.METADATA_UPDATED` listeners
+        get the number of merged reports as an extra argument.
+
+        Defaults to :class:`None`, which emits one event per report.
+        """
+        if self._metadata_coalescer is None:
+            return None
+        return self._metadata_coalescer.interval
+
+    @metadata_update_interval.setter
+    def metadata_update_interval(self, value):
+        if value is not None and value < 0:
+            raise ValueError("Interval must be zero or positive, got %r" % value)
+        coalescer = self._metadata_coalescer
+        if value is not None:
+            self._metadata_coalescer = _MetadataUpdateCoalescer(value)
+        else:
+            self._metadata_coalescer = None
+        if coalescer is not None and coalescer.count:
+            self._emit_metadata_updated(coalescer.count)
+
     def process_events(self):
         """Process pending events in libspotify.
 
@@ -332,7 +455,45 @@ class Session(utils.EventEmitter):
             lib.sp_session_process_events(self._sp_session, next_timeout)
         )
 
-        return next_timeout[0]
+        coalescer = self._metadata_coalescer
+        if coalescer is None:
+            return next_timeout[0]
+
+        now = _clock()
+        with spotify._lock:
+            count = coalescer.pop(now)
+            timeout = coalescer.timeout(now)
+        if count:
+            self._emit_metadata_updated(count)
+        if timeout is None:
+            return next_timeout[0]
+        return min(next_timeout[0], timeout)
+
+    def _cache_audio_format(self, sp_audioformat):
+        """Replace :attr:`_audio_format_cache` with one for
+        ``sp_audioformat`` and return it.
+
+        The format is copied, as libspotify's struct is only valid during the
+        ``music_delivery`` callback.
+
+        Internal method.
+        """
+        sp_audioformat = ffi.new("sp_audioformat *", sp_audioformat[0])
+        audio_format = spotify.AudioFormat(sp_audioformat)
+        self._audio_format_cache = (
+            (
+                sp_audioformat.sample_type,
+                sp_audioformat.sample_rate,
+                sp_audioformat.channels,
+            ),
+            audio_format,
+            audio_format.frame_size(),
+        )
+        return self._audio_format_cache
+
+    def _emit_metadata_updated(self, count):
+        logger.debug("Metadata updated %d times", count)
+        self.emit(SessionEvent.METADATA_UPDATED, self, count)
 
     def inbox_post_tracks(self, canonical_username, tracks, message, callback=None):
         """Post a ``message`` and one or more ``tracks`` to the inbox of the
@@ -750,6 +911,9 @@ class SessionEvent(object):
 
     :param session: the current session
     :type session: :class:`Session`
+    :param count: the number of updates merged into this event, only given if
+        :attr:`Session.metadata_update_interval` is set
+    :type count: int
     """
 
     CONNECTION_ERROR = "connection_error"
@@ -814,7 +978,9 @@ class SessionEvent(object):
     :param audio_format: the audio format
     :type audio_format: :class:`AudioFormat`
     :param frames: the audio frames
-    :type frames: bytestring
+    :type frames: bytestring, or :class:`memoryview` if
+        :attr:`Session.music_delivery_zero_copy` or
+        :attr:`Session.music_delivery_buffer_pool` is set
     :param num_frames: the number of frames
     :type num_frames: int
     :returns: the number of frames consumed
@@ -963,6 +1129,50 @@ class SessionEvent(object):
     """
 
 
+class _MetadataUpdateCoalescer(object):
+
+    """Counts metadata updates until they are emitted as a single event.
+
+    Internal class.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.count = 0
+        self._emitted_at = None
+
+    def _next_emit(self):
+        if not self.interval or self._emitted_at is None:
+            return None
+        return self._emitted_at + self.interval
+
+    def pop(self, now):
+        """Reset and return the number of updates if an event is due, or
+        return 0.
+
+        Internal method.
+        """
+        next_emit = self._next_emit()
+        if not self.count or (next_emit is not None and now < next_emit):
+            return 0
+        (count, self.count) = (self.count, 0)
+        self._emitted_at = now
+        return count
+
+    def timeout(self, now):
+        """Milliseconds until pending updates are due, or :class:`None` if
+        there are none.
+
+        Internal method.
+        """
+        if not self.count:
+            return None
+        next_emit = self._next_emit()
+        if next_emit is None:
+            return 0
+        return max(0, int((next_emit - now) * 1000) + 1)
+
+
 class _SessionCallbacks(object):
 
     """Internal class."""
@@ -1027,6 +1237,11 @@ class _SessionCallbacks(object):
     def metadata_updated(sp_session):
         if not spotify._session_instance:
             return
+        spotify._session_instance._change_notifier.notify()
+        coalescer = spotify._session_instance._metadata_coalescer
+        if coalescer is not None:
+            coalescer.count += 1
+            return
         logger.debug("Metadata updated")
         spotify._session_instance.emit(
             SessionEvent.METADATA_UPDATED, spotify._session_instance
@@ -1060,6 +1275,7 @@ class _SessionCallbacks(object):
         if not spotify._session_instance:
             return
         logger.debug("Notify main thread")
+        spotify._session_instance._change_notifier.notify_main_thread()
         spotify._session_instance.emit(
             SessionEvent.NOTIFY_MAIN_THREAD, spotify._session_instance
         )
@@ -1067,26 +1283,61 @@ class _SessionCallbacks(object):
     @staticmethod
     @ffi.callback("int(sp_session *, const sp_audioformat *, const void *, int)")
     def music_delivery(sp_session, sp_audioformat, frames, num_frames):
-        if not spotify._session_instance:
+        # This is called up to tens of times per second from libspotify's
+        # audio thread, so it avoids the generic event emitter machinery and
+        # only does per-delivery work that can't be cached.
+        session = spotify._session_instance
+        if not session:
             return 0
-        if spotify._session_instance.num_listeners(SessionEvent.MUSIC_DELIVERY) == 0:
+        listeners = session._listeners.get(SessionEvent.MUSIC_DELIVERY)
+        if not listeners:
             logger.debug("Music delivery, but no listener")
             return 0
-        audio_format = spotify.AudioFormat(sp_audioformat)
-        frames_buffer = ffi.buffer(frames, audio_format.frame_size() * num_frames)
-        frames_bytes = frames_buffer[:]
-        num_frames_consumed = spotify._session_instance.call(
-            SessionEvent.MUSIC_DELIVERY,
-            spotify._session_instance,
-            audio_format,
-            frames_bytes,
-            num_frames,
+        assert len(listeners) == 1, (
+            "Expected exactly 1 event listener, found %d listeners" % len(listeners)
         )
-        logger.debug(
-            "Music delivery of %d frames, %d consumed",
-            num_frames,
-            num_frames_consumed,
+        (callback, user_args) = listeners[0]
+
+        key = (
+            sp_audioformat.sample_type,
+            sp_audioformat.sample_rate,
+            sp_audioformat.channels,
         )
+        audio_format_cache = session._audio_format_cache
+        if audio_format_cache is None or audio_format_cache[0] != key:
+            audio_format_cache = session._cache_audio_format(sp_audioformat)
+        (_, audio_format, frame_size) = audio_format_cache
+
+        frames_buffer = ffi.buffer(frames, frame_size * num_frames)
+        frames_view = None
+        pool = session.music_delivery_buffer_pool
+        if session.music_delivery_zero_copy:
+            frames_arg = frames_view = memoryview(frames_buffer)
+        elif pool is not None:
+            frames_arg = pool.acquire(len(frames_buffer))
+            ffi.memmove(frames_arg, frames, len(frames_buffer))
+        else:
+            frames_arg = frames_buffer[:]
+
+        args = (session, audio_format, frames_arg, num_frames) + user_args
+        watchdog = utils._listener_watchdog
+        try:
+            if watchdog is None:
+                num_frames_consumed = callback(*args)
+            else:
+                num_frames_consumed = watchdog.call(
+                    callback, SessionEvent.MUSIC_DELIVERY, args
+                )
+        finally:
+            if frames_view is not None:
+                _release_frames_view(frames_view)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Music delivery of %d frames, %d consumed",
+                num_frames,
+                num_frames_consumed,
+            )
         return num_frames_consumed
 
     @staticmethod
@@ -1137,6 +1388,7 @@ class _SessionCallbacks(object):
         if not spotify._session_instance:
             return
         logger.debug("User info updated")
+        spotify._session_instance._change_notifier.notify()
         spotify._session_instance.emit(
             SessionEvent.USER_INFO_UPDATED, spotify._session_instance
         )
@@ -1,22 +1,70 @@
 from __future__ import unicode_literals
 
+import collections
+import io
+import logging
+import math
 import sys
+import threading
+import time
+import wave
 
 import spotify
+from spotify import utils
 
-__all__ = ["AlsaSink", "PortAudioSink"]
+__all__ = ["AlsaSink", "NullSink", "PortAudioSink", "TeeSink", "WavSink"]
+
+logger = logging.getLogger(__name__)
+
+# Python 2 doesn't have time.perf_counter()
+_clock = getattr(time, "perf_counter", time.time)
 
 
 class Sink(object):
+
+    underruns = 0
+    """The number of times the audio device ran out of audio to play.
+
+    Each dropout is counted once. Pausing playback may be counted as a
+    dropout too, as the sink can't tell the difference.
+    """
+
+    overruns = 0
+    """The number of deliveries from libspotify that the sink only partly
+    accepted because its buffer was full.
+
+    libspotify delivers the rest of the frames again later, so this is
+    expected to grow steadily during playback.
+    """
+
+    _starved = True
+    _reported_underruns = 0
+    _answers_buffer_stats = False
+
+    @property
+    def buffered_frames(self):
+        """The number of audio frames the sink has accepted but that haven't
+        been played yet, or 0 if the sink can't tell."""
+        return 0
+
     def on(self):
         """Turn on the audio sink.
 
         This is done automatically when the sink is instantiated, so you'll
         only need to call this method if you ever call :meth:`off` and want to
         turn the sink back on.
+
+        Unless another listener is already connected to the
+        :attr:`~spotify.SessionEvent.GET_AUDIO_BUFFER_STATS` event, the sink
+        answers it with :attr:`buffered_frames` and the number of
+        :attr:`underruns` since the last time libspotify asked.
         """
         assert self._session.num_listeners(spotify.SessionEvent.MUSIC_DELIVERY) == 0
         self._session.on(spotify.SessionEvent.MUSIC_DELIVERY, self._on_music_delivery)
+        event = spotify.SessionEvent.GET_AUDIO_BUFFER_STATS
+        if self._session.num_listeners(event) == 0:
+            self._session.on(event, self._on_get_audio_buffer_stats)
+            self._answers_buffer_stats = True
 
     def off(self):
         """Turn off the audio sink.
@@ -25,6 +73,12 @@ class Sink(object):
         """
         self._session.off(spotify.SessionEvent.MUSIC_DELIVERY, self._on_music_delivery)
         assert self._session.num_listeners(spotify.SessionEvent.MUSIC_DELIVERY) == 0
+        if self._answers_buffer_stats:
+            self._session.off(
+                spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+                self._on_get_audio_buffer_stats,
+            )
+            self._answers_buffer_stats = False
         self._close()
 
     def _on_music_delivery(self, session, audio_format, frames, num_frames):
@@ -32,6 +86,29 @@ class Sink(object):
         # not block in any way.
         raise NotImplementedError
 
+    def _on_get_audio_buffer_stats(self, session):
+        # This method is called from an internal libspotify thread and must
+        # not block in any way.
+        underruns = self.underruns
+        stutter = underruns - self._reported_underruns
+        self._reported_underruns = underruns
+        return spotify.AudioBufferStats(self.buffered_frames, stutter)
+
+    def _release_frames(self, session, frames):
+        # Gives the frames' buffer back to the session's AudioBufferPool, if
+        # any, once the sink is done with it. Called whether the frames were
+        # consumed or not, as the sink owns the buffer either way.
+        pool = getattr(session, "music_delivery_buffer_pool", None)
+        if pool is not None:
+            pool.release(frames)
+
+    def _update_starved(self, starved):
+        # Counts an underrun when the device goes from having audio to play to
+        # having none.
+        if starved and not self._starved:
+            self.underruns += 1
+        self._starved = starved
+
     def _close(self):
         pass
 
@@ -80,9 +157,19 @@ class AlsaSink(Sink):
 
         self._alsaaudio = alsaaudio
         self._device = None
+        self._device_buffer_size = None
 
         self.on()
 
+    @property
+    def buffered_frames(self):
+        """The number of audio frames written to the ALSA device that haven't
+        been played yet.
+
+        Requires pyalsaaudio 0.10 or newer. Always 0 with older versions.
+        """
+        return self._get_queued_frames() or 0
+
     def _on_music_delivery(self, session, audio_format, frames, num_frames):
         assert audio_format.sample_type == spotify.SampleType.INT16_NATIVE_ENDIAN
 
@@ -103,12 +190,33 @@ class AlsaSink(Sink):
             self._device.setchannels(audio_format.channels)
             self._device.setperiodsize(num_frames * audio_format.frame_size())
 
-        return self._device.write(frames)
+        queued_frames = self._get_queued_frames()
+        if queued_frames is not None:
+            self._update_starved(queued_frames == 0)
+
+        num_frames_consumed = self._device.write(frames)
+        self._release_frames(session, frames)
+        if num_frames_consumed < num_frames:
+            self.overruns += 1
+        return num_frames_consumed
+
+    def _get_queued_frames(self):
+        device = self._device
+        # PCM.avail() and PCM.info() were added in pyalsaaudio 0.10
+        if device is None or not hasattr(device, "avail"):
+            return None
+        if self._device_buffer_size is None:
+            self._device_buffer_size = device.info()["buffer_size"]
+        avail = device.avail()
+        if avail < 0:
+            return 0  # The device is in an underrun state
+        return max(0, self._device_buffer_size - avail)
 
     def _close(self):
         if self._device is not None:
             self._device.close()
             self._device = None
+            self._device_buffer_size = None
 
 
 class PortAudioSink(Sink):
@@ -137,23 +245,59 @@ class PortAudioSink(Sink):
 
     For an example of how to use this class, see the :class:`AlsaSink` example.
     Just replace ``AlsaSink`` with ``PortAudioSink``.
+
+    By default, the audio frames are written to PortAudio with a blocking call
+    on libspotify's audio thread. If ``callback_mode`` is :class:`True`, the
+    frames are instead put in a ring buffer with room for ``buffer_frames``
+    frames, which PortAudio reads from its own thread when it needs more
+    audio. Deliveries from libspotify are then never blocked, but only as many
+    frames as there is room for in the buffer are accepted, and libspotify
+    delivers the rest later.
     """
 
-    def __init__(self, session):
+    def __init__(self, session, callback_mode=False, buffer_frames=22050):
         self._session = session
+        self._callback_mode = callback_mode
+        self._buffer_frames = buffer_frames
 
         import pyaudio  # Crash early if not available
 
         self._pyaudio = pyaudio
         self._device = self._pyaudio.PyAudio()
         self._stream = None
+        self._buffer = None
+        self._frame_size = None
+        self._sample_rate = None
 
         self.on()
 
+    @property
+    def buffered_frames(self):
+        """The number of audio frames given to PortAudio or waiting in the ring
+        buffer that haven't been played yet.
+
+        In blocking mode this is an estimate based on the stream's output
+        latency.
+        """
+        if self._stream is None:
+            return 0
+        if self._callback_mode:
+            return len(self._buffer) // self._frame_size
+        latency_frames = int(self._stream.get_output_latency() * self._sample_rate)
+        return max(0, latency_frames - self._stream.get_write_available())
+
     def _on_music_delivery(self, session, audio_format, frames, num_frames):
         assert audio_format.sample_type == spotify.SampleType.INT16_NATIVE_ENDIAN
 
+        if self._callback_mode:
+            num_frames_consumed = self._buffer_frames_for_callback(
+                audio_format, frames, num_frames
+            )
+            self._release_frames(session, frames)
+            return num_frames_consumed
+
         if self._stream is None:
+            self._sample_rate = audio_format.sample_rate
             self._stream = self._device.open(
                 format=self._pyaudio.paInt16,
                 channels=audio_format.channels,
@@ -161,18 +305,506 @@ class PortAudioSink(Sink):
                 output=True,
             )
 
-        # XXX write() is a blocking call. There are two non-blocking
-        # alternatives:
-        # 1) Only feed write() with the number of frames returned by
-        # self._stream.get_write_available() on each call. This causes buffer
-        # underruns every third or fourth write().
-        # 2) Let pyaudio call a callback function when it needs data, but then
-        # we need to introduce a thread safe buffer here which is filled when
-        # libspotify got data and drained when pyaudio needs data.
+        self._update_starved(self.buffered_frames == 0)
+
+        # XXX write() is a blocking call. Use callback_mode to avoid it.
         self._stream.write(frames, num_frames=num_frames)
+        self._release_frames(session, frames)
         return num_frames
 
+    def _buffer_frames_for_callback(self, audio_format, frames, num_frames):
+        if self._stream is None:
+            self._frame_size = audio_format.frame_size()
+            self._buffer = _RingBuffer(self._buffer_frames * self._frame_size)
+            self._starved = True
+            self._stream = self._device.open(
+                format=self._pyaudio.paInt16,
+                channels=audio_format.channels,
+                rate=audio_format.sample_rate,
+                output=True,
+                stream_callback=self._on_stream_callback,
+            )
+
+        num_bytes = self._buffer.write(
+            memoryview(frames)[: num_frames * self._frame_size]
+        )
+        num_frames_consumed = num_bytes // self._frame_size
+        if num_frames_consumed < num_frames:
+            self.overruns += 1
+        return num_frames_consumed
+
+    def _on_stream_callback(self, in_data, frame_count, time_info, status):
+        # This method is called from PortAudio's audio thread and must not
+        # block in any way.
+        num_bytes = frame_count * self._frame_size
+        data = self._buffer.read(num_bytes)
+        self._update_starved(len(data) < num_bytes)
+        if len(data) < num_bytes:
+            data += b"\x00" * (num_bytes - len(data))
+        return (data, self._pyaudio.paContinue)
+
     def _close(self):
         if self._stream is not None:
             self._stream.close()
             self._stream = None
+        self._buffer = None
+
+
+class NullSink(Sink):
+
+    """Audio sink that discards the audio, but measures how it was delivered.
+
+    This audio sink consumes all frames immediately, and records the number
+    of deliveries, frames, and bytes, together with rolling histograms of the
+    number of frames per delivery and the time in seconds between
+    deliveries, covering the last ``window`` deliveries. Use :meth:`stats` to
+    get a summary, and :meth:`reset` to start over.
+
+    It is useful for measuring the overhead of pyspotify's audio path, and
+    for checking how evenly libspotify delivers audio, without a sound
+    device.
+
+    Example::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> audio = spotify.NullSink(session)
+        # Login, play a track, etc...
+        >>> audio.stats()['frames_per_second']
+        1254231.0
+    """
+
+    def __init__(self, session, window=1000):
+        self._session = session
+        self._window = window
+        self._lock = threading.Lock()
+
+        self.reset()
+        self.on()
+
+    deliveries = 0
+    """The number of deliveries."""
+
+    frames_delivered = 0
+    """The number of audio frames delivered."""
+
+    bytes_delivered = 0
+    """The number of bytes of audio delivered."""
+
+    chunk_sizes = None
+    """A :class:`~spotify.stats.RollingHistogram` of the number of frames per
+    delivery."""
+
+    intervals = None
+    """A :class:`~spotify.stats.RollingHistogram` of the time in seconds
+    between deliveries."""
+
+    def reset(self):
+        """Reset all counters and histograms."""
+        with self._lock:
+            self.deliveries = 0
+            self.frames_delivered = 0
+            self.bytes_delivered = 0
+            self.chunk_sizes = spotify.stats.RollingHistogram(self._window)
+            self.intervals = spotify.stats.RollingHistogram(self._window)
+            self._first_delivery = None
+            self._last_delivery = None
+
+    def stats(self):
+        """Return a summary of the deliveries as a JSON serializable dict.
+
+        The rates are calculated over the time from the first to the last
+        delivery. ``jitter`` is the standard deviation of the time between
+        deliveries in the window.
+        """
+        with self._lock:
+            if self.deliveries > 1:
+                seconds = self._last_delivery - self._first_delivery
+            else:
+                seconds = 0.0
+            intervals = list(self.intervals.values)
+            result = {
+                "deliveries": self.deliveries,
+                "frames": self.frames_delivered,
+                "bytes": self.bytes_delivered,
+                "seconds": seconds,
+                "frames_per_second": (
+                    self.frames_delivered / seconds if seconds else None
+                ),
+                "bytes_per_second": (
+                    self.bytes_delivered / seconds if seconds else None
+                ),
+                "chunk_sizes": self.chunk_sizes.as_dict(),
+                "intervals": self.intervals.as_dict(),
+            }
+        if intervals:
+            mean = sum(intervals) / len(intervals)
+            variance = sum((v - mean) ** 2 for v in intervals) / len(intervals)
+            result["jitter"] = math.sqrt(variance)
+        else:
+            result["jitter"] = None
+        return result
+
+    def _on_music_delivery(self, session, audio_format, frames, num_frames):
+        now = _clock()
+        with self._lock:
+            if self._last_delivery is None:
+                self._first_delivery = now
+            else:
+                self.intervals.add(now - self._last_delivery)
+            self._last_delivery = now
+            self.deliveries += 1
+            self.frames_delivered += num_frames
+            self.bytes_delivered += len(frames)
+            self.chunk_sizes.add(num_frames)
+        self._release_frames(session, frames)
+        return num_frames
+
+
+class TeeSink(Sink):
+
+    """Audio sink that passes the audio on to several other sinks.
+
+    Create a branch with :meth:`branch` for each of the other sinks, and pass
+    the branch to the other sink instead of the session. Each chunk of audio
+    from libspotify is copied once, and then queued in every branch. Each
+    branch has its own thread that passes the queued audio on to its sink, so
+    that a slow or blocking sink, like one writing to disk or the network,
+    never blocks libspotify or the other sinks.
+
+    Example::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> tee = spotify.TeeSink(session)
+        >>> audio = spotify.AlsaSink(tee.branch(backpressure=True))
+        >>> recording = spotify.WavSink(tee.branch(), 'recording.wav')
+        >>> loop = spotify.EventLoop(session)
+        >>> loop.start()
+        # Login, play a track, etc...
+
+    The tee answers :attr:`~spotify.SessionEvent.GET_AUDIO_BUFFER_STATS` by
+    asking the sinks on its branches, and adding the audio queued in the
+    branches.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._branches = ()
+
+        self.on()
+
+    def branch(self, buffer_frames=44100, backpressure=False):
+        """Create a new branch to connect another sink to.
+
+        The branch queues up to ``buffer_frames`` frames of audio for its
+        sink. By default, audio that doesn't fit in the branch is dropped for
+        that branch only, and counted in the branch's ``dropped_frames``
+        attribute, so that a slow sink never holds back the other sinks. If
+        ``backpressure`` is :class:`True`, the tee doesn't accept more audio
+        from libspotify than there is room for in the branch, so the branch's
+        sink sets the pace for all branches. This is meant for the branch of
+        the sound device sink only.
+
+        The branch can be passed to any sink in place of the session. The
+        sink's listeners are called from the branch's thread, with the
+        session as the ``session`` argument. If the sink fails to consume a
+        chunk of audio, the error is logged and the chunk is dropped for that
+        branch.
+        """
+        branch = _TeeBranch(self._session, buffer_frames, backpressure)
+        self._branches = self._branches + (branch,)
+        branch.start()
+        return branch
+
+    @property
+    def buffered_frames(self):
+        """The number of frames queued in the branches with backpressure.
+
+        If there are several such branches, the lowest number is used.
+        """
+        queued = [b.buffered_frames for b in self._branches if b.backpressure]
+        return min(queued) if queued else 0
+
+    def on(self):
+        super(TeeSink, self).on()
+        for branch in self._branches:
+            branch.start()
+
+    def _on_music_delivery(self, session, audio_format, frames, num_frames):
+        branches = self._branches
+        num_frames_accepted = num_frames
+        for branch in branches:
+            if branch.backpressure:
+                num_frames_accepted = min(num_frames_accepted, branch.free_frames)
+        if num_frames_accepted < num_frames:
+            self.overruns += 1
+        if num_frames_accepted <= 0:
+            self._release_frames(session, frames)
+            return 0
+
+        # The branches share a single copy of the frames
+        num_bytes = len(frames) // num_frames * num_frames_accepted
+        chunk = memoryview(frames)[:num_bytes].tobytes()
+        self._release_frames(session, frames)
+        for branch in branches:
+            branch.put(audio_format, chunk, num_frames_accepted)
+        return num_frames_accepted
+
+    def _on_get_audio_buffer_stats(self, session):
+        samples = None
+        stutter = super(TeeSink, self)._on_get_audio_buffer_stats(session).stutter
+        for branch in self._branches:
+            branch_samples = branch.buffered_frames
+            if branch.num_listeners(spotify.SessionEvent.GET_AUDIO_BUFFER_STATS):
+                stats = branch.call(
+                    spotify.SessionEvent.GET_AUDIO_BUFFER_STATS, session
+                )
+                branch_samples += stats.samples
+                stutter += stats.stutter
+            if branch.backpressure and (samples is None or branch_samples < samples):
+                samples = branch_samples
+        return spotify.AudioBufferStats(samples or 0, stutter)
+
+    def _close(self):
+        for branch in self._branches:
+            branch.stop()
+
+
+class _TeeBranch(utils.EventEmitter):
+
+    """A queue of audio between a :class:`TeeSink` and another sink.
+
+    The other sink connects to the branch's events as if the branch was the
+    session.
+
+    Internal class.
+    """
+
+    # How long to wait before delivering frames the sink didn't consume again
+    retry_delay = 0.01
+
+    def __init__(self, session, buffer_frames, backpressure):
+        super(_TeeBranch, self).__init__()
+        self._session = session
+        self.buffer_frames = buffer_frames
+        self.backpressure = backpressure
+        self.dropped_frames = 0
+        self._chunks = collections.deque()
+        self._queued_frames = 0
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    @property
+    def buffered_frames(self):
+        return self._queued_frames
+
+    @property
+    def free_frames(self):
+        return self.buffer_frames - self._queued_frames
+
+    def put(self, audio_format, chunk, num_frames):
+        with self._cond:
+            if num_frames > self.buffer_frames - self._queued_frames:
+                self.dropped_frames += num_frames
+                return
+            self._chunks.append((audio_format, chunk, num_frames))
+            self._queued_frames += num_frames
+            self._cond.notify()
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="TeeSinkBranch")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the branch's thread after giving the sink the queued audio
+        once more.
+
+        Internal method.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._chunks:
+                    self._cond.wait()
+                if not self._chunks:
+                    return
+                (audio_format, chunk, num_frames) = self._chunks[0]
+                running = self._running
+
+            failed = False
+            if self.num_listeners(spotify.SessionEvent.MUSIC_DELIVERY):
+                try:
+                    num_frames_consumed = self.call(
+                        spotify.SessionEvent.MUSIC_DELIVERY,
+                        self._session,
+                        audio_format,
+                        chunk,
+                        num_frames,
+                    )
+                except Exception:
+                    # Drop the chunk, so that the branch keeps draining and a
+                    # backpressure branch doesn't stop playback for good.
+                    logger.exception(
+                        "TeeSink branch's sink failed; dropped %d frames",
+                        num_frames,
+                    )
+                    num_frames_consumed = 0
+                    failed = True
+            else:
+                num_frames_consumed = num_frames
+
+            with self._cond:
+                if num_frames_consumed >= num_frames or failed or not running:
+                    self._chunks.popleft()
+                    self._queued_frames -= num_frames
+                    self.dropped_frames += max(0, num_frames - num_frames_consumed)
+                    continue
+                if num_frames_consumed > 0:
+                    frame_size = len(chunk) // num_frames
+                    self._chunks[0] = (
+                        audio_format,
+                        chunk[num_frames_consumed * frame_size :],
+                        num_frames - num_frames_consumed,
+                    )
+                    self._queued_frames -= num_frames_consumed
+                # The sink is full. Like libspotify, try again in a while.
+                self._cond.wait(self.retry_delay)
+
+
+class WavSink(Sink):
+
+    """Audio sink that writes the audio to a WAV file.
+
+    This audio sink doesn't need a sound device, which makes it useful for
+    capturing audio on headless servers, and for testing and benchmarking.
+
+    ``file`` can be a path or a binary file object. The file object must be
+    seekable, so that the WAV header can be fixed up with the final length of
+    the audio when the sink is turned off. If ``file`` is a path, the file is
+    written through a buffer of ``buffer_size`` bytes, and is closed when the
+    sink is turned off. File objects are written to as is, and are left open.
+
+    The sink accepts all frames as fast as libspotify delivers them. The WAV
+    file is created on the first delivery, and is finished when the sink is
+    turned off with :meth:`off`. If the sink is turned on again, the next
+    delivery starts a new WAV file.
+
+    Example::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> audio = spotify.WavSink(session, 'track.wav')
+        >>> loop = spotify.EventLoop(session)
+        >>> loop.start()
+        # Login, etc...
+        >>> track = session.get_track('spotify:track:3N2UhXZI4Gf64Ku3cCjz2g')
+        >>> track.load()
+        >>> session.player.load(track)
+        >>> session.player.play()
+        # Wait for the end of track...
+        >>> audio.off()
+    """
+
+    def __init__(self, session, file, buffer_size=1024 * 1024):
+        self._session = session
+        self._file = file
+        self._buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._opened_file = None
+        self._writer = None
+
+        self.on()
+
+    frames_written = 0
+    """The number of audio frames written to the file."""
+
+    def _on_music_delivery(self, session, audio_format, frames, num_frames):
+        assert audio_format.sample_type == spotify.SampleType.INT16_NATIVE_ENDIAN
+
+        with self._lock:
+            if self._writer is None:
+                self._open(audio_format)
+            self._writer.writeframesraw(frames)
+            self.frames_written += num_frames
+        self._release_frames(session, frames)
+        return num_frames
+
+    def _open(self, audio_format):
+        if hasattr(self._file, "write"):
+            fileobj = self._file
+        else:
+            fileobj = self._opened_file = io.open(
+                self._file, "wb", buffering=self._buffer_size
+            )
+        self._writer = wave.open(fileobj, "wb")
+        self._writer.setnchannels(audio_format.channels)
+        self._writer.setsampwidth(2)  # INT16_NATIVE_ENDIAN
+        self._writer.setframerate(audio_format.sample_rate)
+
+    def _close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()  # Fixes up the header
+                self._writer = None
+            if self._opened_file is not None:
+                self._opened_file.close()
+                self._opened_file = None
+
+
+class _RingBuffer(object):
+
+    """A fixed size ring buffer of bytes for one writer and one reader thread.
+
+    The writer and the reader may run concurrently without locking, as the
+    writer only moves the write position and the reader only moves the read
+    position, in both cases after the data has been copied.
+
+    Internal class.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._read_pos = 0
+        self._write_pos = 0
+
+    def __len__(self):
+        return self._write_pos - self._read_pos
+
+    def write(self, data):
+        """Copy as much of ``data`` as there is room for into the buffer.
+
+        Returns the number of bytes written.
+        """
+        size = min(len(data), self.capacity - len(self))
+        start = self._write_pos % self.capacity
+        first = min(size, self.capacity - start)
+        self._buffer[start : start + first] = data[:first]
+        self._buffer[: size - first] = data[first:size]
+        self._write_pos += size
+        return size
+
+    def read(self, size):
+        """Remove and return up to ``size`` bytes from the buffer."""
+        size = min(size, len(self))
+        start = self._read_pos % self.capacity
+        first = min(size, self.capacity - start)
+        data = bytes(self._buffer[start : start + first])
+        if first < size:
+            data += bytes(self._buffer[: size - first])
+        self._read_pos += size
+        return data
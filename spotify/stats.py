@@ -0,0 +1,765 @@
+from __future__ import unicode_literals
+
+import collections
+import functools
+import json
+import logging
+import math
+import sys
+import threading
+import time
+
+import spotify
+from spotify._spotify import lib as _raw_lib
+
+try:
+    from threading import get_ident as _get_ident
+except ImportError:
+    # Python 2
+    from thread import get_ident as _get_ident
+
+__all__ = [
+    "EventLoopMetrics",
+    "Histogram",
+    "ListenerCall",
+    "ListenerStats",
+    "LockStats",
+    "RollingHistogram",
+]
+
+logger = logging.getLogger(__name__)
+
+
+# Python 2 doesn't have time.perf_counter()
+_clock = getattr(time, "perf_counter", time.time)
+
+
+class Histogram(object):
+
+    """A histogram of durations in seconds.
+
+    The durations are counted in buckets with power-of-two boundaries: bucket
+    ``i`` counts durations from ``2 ** (i - 1)`` up to ``2 ** i``
+    microseconds, while bucket 0 counts all durations below one microsecond.
+    The count, total, minimum, and maximum are tracked exactly, while
+    percentiles are estimated from the buckets.
+    """
+
+    num_buckets = 32
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * self.num_buckets
+
+    def __repr__(self):
+        return "Histogram(count=%d, mean=%s, max=%s)" % (
+            self.count,
+            self.mean,
+            self.max,
+        )
+
+    def add(self, value):
+        """Add a duration of ``value`` seconds to the histogram."""
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        index = int(value * 1000000).bit_length()
+        self.buckets[min(index, self.num_buckets - 1)] += 1
+
+    @property
+    def mean(self):
+        """The mean duration, or :class:`None` if the histogram is empty."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def percentile(self, percent):
+        """Estimate the duration below which ``percent`` of the durations
+        fall.
+
+        The estimate is the upper boundary of the bucket containing the
+        percentile, capped by the largest duration seen. Returns
+        :class:`None` if the histogram is empty.
+        """
+        if not self.count:
+            return None
+        wanted = self.count * percent / 100.0
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= wanted:
+                return min((2 ** index) / 1000000.0, self.max)
+        return self.max
+
+    def copy(self):
+        """Return a copy of the histogram."""
+        result = self.__class__()
+        result.count = self.count
+        result.total = self.total
+        result.min = self.min
+        result.max = self.max
+        result.buckets = list(self.buckets)
+        return result
+
+    def as_dict(self):
+        """Return a summary of the histogram as a JSON serializable dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class RollingHistogram(object):
+
+    """A histogram of the most recent durations in seconds.
+
+    Only the last ``size`` durations are kept, so that the histogram reflects
+    recent behavior instead of everything since it was created. Percentiles
+    are exact within the window. Apart from :meth:`add`, the interface is the
+    same as for :class:`Histogram`.
+    """
+
+    def __init__(self, size=1000):
+        self.size = size
+        self.values = collections.deque(maxlen=size)
+
+    def __repr__(self):
+        return "RollingHistogram(count=%d, mean=%s, max=%s)" % (
+            self.count,
+            self.mean,
+            self.max,
+        )
+
+    def add(self, value):
+        """Add a duration of ``value`` seconds to the histogram, dropping the
+        oldest duration if the histogram is full."""
+        self.values.append(value)
+
+    @property
+    def count(self):
+        """The number of durations in the window."""
+        return len(self.values)
+
+    @property
+    def total(self):
+        """The sum of the durations in the window."""
+        return sum(self.values)
+
+    @property
+    def min(self):
+        """The shortest duration, or :class:`None` if the histogram is
+        empty."""
+        return min(self.values) if self.values else None
+
+    @property
+    def max(self):
+        """The longest duration, or :class:`None` if the histogram is
+        empty."""
+        return max(self.values) if self.values else None
+
+    @property
+    def mean(self):
+        """The mean duration, or :class:`None` if the histogram is empty."""
+        if not self.values:
+            return None
+        return self.total / len(self.values)
+
+    def percentile(self, percent):
+        """Get the duration below which ``percent`` of the durations fall.
+
+        Returns :class:`None` if the histogram is empty.
+        """
+        if not self.values:
+            return None
+        values = sorted(self.values)
+        index = int(math.ceil(len(values) * percent / 100.0)) - 1
+        return values[max(0, min(index, len(values) - 1))]
+
+    def copy(self):
+        """Return a copy of the histogram."""
+        result = self.__class__(self.size)
+        result.values.extend(self.values)
+        return result
+
+    def as_dict(self):
+        """Return a summary of the histogram as a JSON serializable dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class LockStats(collections.namedtuple("LockStats", ["wait", "hold"])):
+
+    """Wait and hold times for one user of pyspotify's global lock.
+
+    Both ``wait`` and ``hold`` are :class:`Histogram` instances.
+    """
+
+    pass
+
+
+def _qualified_name(func):
+    """Get a human readable name for a function or method.
+
+    Functions on :attr:`spotify.lib` are named by their libspotify function
+    name, e.g. ``sp_track_name``.
+
+    Internal function.
+    """
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None)
+    if name is None:
+        return repr(func)
+    if module == "spotify._spotify":
+        return func.__name__
+    if module is None:
+        return name
+    return "%s.%s" % (module, name)
+
+
+# The code object shared by all wrappers created by @serialized, used to
+# recognize when the global lock is taken on behalf of a serialized function.
+_serialized_code = spotify.serialized(len).__code__
+
+
+def _lock_user_name(frame):
+    """Get the name of the code taking the lock in the given ``frame``.
+
+    Internal function.
+    """
+    if frame.f_code is _serialized_code:
+        return _qualified_name(frame.f_locals["f"])
+    return "%s.%s" % (frame.f_globals.get("__name__"), frame.f_code.co_name)
+
+
+class _InstrumentedLock(object):
+
+    """Wrapper around pyspotify's global lock that records wait and hold
+    times, broken down by the function that took the lock.
+
+    Only the outermost acquisition in each thread is measured. Reentrant
+    acquisitions are counted as part of the outer hold time.
+
+    Internal class.
+    """
+
+    def __init__(self, lock, stats):
+        self._lock = lock
+        self._local = threading.local()
+        self._stats = stats
+
+    def __enter__(self):
+        self._acquire(_lock_user_name(sys._getframe(1)), True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def acquire(self, blocking=True):
+        return self._acquire(_lock_user_name(sys._getframe(1)), blocking)
+
+    def _acquire(self, name, blocking):
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth:
+            self._lock.acquire()
+            local.depth = depth + 1
+            return True
+
+        started = _clock()
+        if not self._lock.acquire(blocking):
+            return False
+        acquired = _clock()
+
+        local.depth = 1
+        local.name = name
+        local.acquired = acquired
+        self._get_stats(name).wait.add(acquired - started)
+        return True
+
+    def release(self):
+        local = self._local
+        local.depth -= 1
+        if local.depth == 0:
+            self._get_stats(local.name).hold.add(_clock() - local.acquired)
+        self._lock.release()
+
+    def _get_stats(self, name):
+        # Only called while holding the lock.
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = LockStats(wait=Histogram(), hold=Histogram())
+        return stats
+
+
+_lock_stats = {}
+
+
+def enable_lock_stats():
+    """Start recording wait and hold times for pyspotify's global lock.
+
+    While enabled, every acquisition of the lock is timed, and the times are
+    recorded per :attr:`spotify.lib` function or ``@serialized`` method that
+    took the lock. Any previously recorded stats are discarded.
+
+    When disabled, which is the default, the lock is not instrumented at all,
+    and has no overhead.
+    """
+    global _lock_stats
+    with spotify._lock:
+        if isinstance(spotify._lock, _InstrumentedLock):
+            raw_lock = spotify._lock._lock
+        else:
+            raw_lock = spotify._lock
+        _lock_stats = {}
+        spotify._lock = _InstrumentedLock(raw_lock, _lock_stats)
+
+
+def disable_lock_stats():
+    """Stop recording wait and hold times for pyspotify's global lock.
+
+    The stats recorded so far are still available from :func:`lock`.
+    """
+    with spotify._lock:
+        if isinstance(spotify._lock, _InstrumentedLock):
+            spotify._lock = spotify._lock._lock
+
+
+def lock():
+    """Get the recorded wait and hold times for pyspotify's global lock.
+
+    Returns a dict mapping the names of the functions that took the lock to
+    :class:`LockStats` instances. libspotify functions are named by their C
+    function name, e.g. ``sp_track_name``, while other functions are named
+    by their qualified Python name, e.g. ``spotify.track.Track.name``.
+
+    The returned stats are a snapshot, and won't change as more stats are
+    recorded. See :func:`enable_lock_stats` to start recording.
+    """
+    with spotify._lock:
+        return {
+            name: LockStats(wait=stats.wait.copy(), hold=stats.hold.copy())
+            for name, stats in _lock_stats.items()
+        }
+
+
+_lib_stats = {}
+
+
+def _profiled(func, histogram):
+    """Wrap a libspotify function to record its run time in ``histogram``.
+
+    The wrapper is called with pyspotify's global lock held, so it is safe to
+    update the histogram.
+
+    Internal function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        started = _clock()
+        try:
+            return func(*args)
+        finally:
+            histogram.add(_clock() - started)
+
+    return wrapper
+
+
+def _lib_functions():
+    for name in dir(_raw_lib):
+        func = getattr(_raw_lib, name)
+        if name.startswith("sp_") and callable(func):
+            yield name, func
+
+
+def enable_lib_profiling():
+    """Start profiling all calls to functions on :attr:`spotify.lib`.
+
+    While enabled, every libspotify function call is counted and timed. The
+    time spent waiting for pyspotify's global lock is not included. Any
+    previously recorded profile is discarded.
+
+    When disabled, which is the default, the functions are not wrapped at
+    all, and there is no overhead.
+    """
+    global _lib_stats
+    with spotify._lock:
+        _lib_stats = {}
+        for name, func in _lib_functions():
+            histogram = _lib_stats[name] = Histogram()
+            setattr(spotify.lib, name, spotify.serialized(_profiled(func, histogram)))
+
+
+def disable_lib_profiling():
+    """Stop profiling calls to functions on :attr:`spotify.lib`.
+
+    The profile recorded so far is still available from :func:`lib`.
+    """
+    with spotify._lock:
+        for name, func in _lib_functions():
+            setattr(spotify.lib, name, spotify.serialized(func))
+
+
+def lib():
+    """Get the recorded profile of calls to functions on :attr:`spotify.lib`.
+
+    Returns a dict mapping libspotify function names to :class:`Histogram`
+    instances with the functions' run times. Functions that haven't been
+    called are left out.
+
+    The returned profile is a snapshot, and won't change as more calls are
+    recorded. See :func:`enable_lib_profiling` to start recording.
+    """
+    with spotify._lock:
+        return {
+            name: histogram.copy()
+            for name, histogram in _lib_stats.items()
+            if histogram.count
+        }
+
+
+class EventLoopMetrics(object):
+
+    """Latency and throughput metrics for an :class:`~spotify.EventLoop`.
+
+    Each pass of the event loop is a call to
+    :meth:`~spotify.Session.process_events`, either because libspotify emitted
+    a :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` event, or because the
+    timeout requested by the previous pass was reached. The histograms are
+    :class:`RollingHistogram` instances covering the last ``window`` passes.
+    """
+
+    def __init__(self, window=1000):
+        self._lock = threading.Lock()
+        self.window = window
+        self.notify_wakeups = 0
+        self.timeout_wakeups = 0
+        self.notify_latency = RollingHistogram(window)
+        self.process_events = RollingHistogram(window)
+        self.requested_timeout = RollingHistogram(window)
+
+    notify_wakeups = 0
+    """Number of passes caused by notifications."""
+
+    timeout_wakeups = 0
+    """Number of passes caused by the requested timeout being reached,
+    including the first pass when the event loop starts."""
+
+    notify_latency = None
+    """Time from the first notification since the previous pass until the
+    start of the pass, for passes caused by notifications."""
+
+    process_events = None
+    """Duration of each pass, including all event listeners called during
+    the pass."""
+
+    requested_timeout = None
+    """The timeout libspotify requested at the end of each pass."""
+
+    def __repr__(self):
+        return (
+            "EventLoopMetrics(notify_wakeups=%d, timeout_wakeups=%d, "
+            "process_events=%r)"
+            % (self.notify_wakeups, self.timeout_wakeups, self.process_events)
+        )
+
+    def record(self, notified, latency, duration, timeout):
+        """Record a pass of the event loop.
+
+        ``notified`` is whether the pass was caused by a notification.
+        ``latency`` is the time from the notification to the start of the
+        pass, or :class:`None` if unknown. ``duration`` is the duration of the
+        pass, and ``timeout`` is the next timeout, all in seconds.
+
+        Internal method.
+        """
+        with self._lock:
+            if notified:
+                self.notify_wakeups += 1
+                if latency is not None:
+                    self.notify_latency.add(latency)
+            else:
+                self.timeout_wakeups += 1
+            self.process_events.add(duration)
+            self.requested_timeout.add(timeout)
+
+    def copy(self):
+        """Return a copy of the metrics, which won't change as more passes
+        are recorded."""
+        with self._lock:
+            result = self.__class__(self.window)
+            result.notify_wakeups = self.notify_wakeups
+            result.timeout_wakeups = self.timeout_wakeups
+            result.notify_latency = self.notify_latency.copy()
+            result.process_events = self.process_events.copy()
+            result.requested_timeout = self.requested_timeout.copy()
+            return result
+
+    def histograms(self):
+        """Return a dict of the histograms, suitable for
+        :func:`format_table` and :func:`format_json`."""
+        return {
+            "notify_latency": self.notify_latency,
+            "process_events": self.process_events,
+            "requested_timeout": self.requested_timeout,
+        }
+
+
+def enable_event_loop_metrics(event_loop, window=1000):
+    """Start recording latency and throughput metrics for an
+    :class:`~spotify.EventLoop`.
+
+    The metrics cover the last ``window`` passes of the event loop. Any
+    previously recorded metrics are discarded.
+
+    When disabled, which is the default, the event loop records nothing, and
+    has no overhead.
+    """
+    event_loop._metrics = EventLoopMetrics(window)
+
+
+def disable_event_loop_metrics(event_loop):
+    """Stop recording metrics for an :class:`~spotify.EventLoop`."""
+    event_loop._metrics = None
+
+
+def event_loop(event_loop):
+    """Get the recorded metrics for an :class:`~spotify.EventLoop`.
+
+    Returns an :class:`EventLoopMetrics` snapshot, which won't change as more
+    passes are recorded, or :class:`None` if metrics aren't enabled for the
+    event loop. See :func:`enable_event_loop_metrics` to start recording.
+
+    Example::
+
+        >>> metrics = spotify.stats.event_loop(event_loop)
+        >>> print(spotify.stats.format_table(metrics.histograms()))
+    """
+    metrics = event_loop._metrics
+    if metrics is None:
+        return None
+    return metrics.copy()
+
+
+class ListenerStats(collections.namedtuple("ListenerStats", ["calls", "slow"])):
+
+    """Run times for one event listener and event.
+
+    ``calls`` is a :class:`Histogram` of the run times of all calls to the
+    listener, while ``slow`` is a :class:`Histogram` of the run times of the
+    calls that exceeded the watchdog's budget.
+    """
+
+    pass
+
+
+class ListenerCall(
+    collections.namedtuple("ListenerCall", ["thread", "listener", "event", "elapsed"])
+):
+
+    """An event listener call that is currently running.
+
+    ``thread`` is the name of the thread running the listener, ``listener`` is
+    the listener's qualified name, ``event`` is the event being emitted, and
+    ``elapsed`` is the number of seconds the listener has been running.
+    """
+
+    pass
+
+
+class _ListenerWatchdog(object):
+
+    """Times event listener calls made by :class:`~spotify.utils.EventEmitter`.
+
+    Internal class.
+    """
+
+    def __init__(self, budget, log, stats):
+        self.budget = budget
+        self.log = log
+        self._stats = stats
+        self._running = {}
+
+    def call(self, callback, event, args):
+        """Call ``callback`` with ``args`` as a listener for ``event``."""
+        ident = _get_ident()
+        stack = self._running.get(ident)
+        if stack is None:
+            stack = self._running[ident] = []
+        started = _clock()
+        stack.append((callback, event, started))
+        try:
+            return callback(*args)
+        finally:
+            duration = _clock() - started
+            stack.pop()
+            self._record(callback, event, duration)
+
+    def _record(self, callback, event, duration):
+        name = _qualified_name(callback)
+        slow = duration > self.budget
+        with _listener_lock:
+            key = (name, event)
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = ListenerStats(
+                    calls=Histogram(), slow=Histogram()
+                )
+            stats.calls.add(duration)
+            if slow:
+                stats.slow.add(duration)
+        if slow and self.log:
+            logger.warning(
+                "Event listener %s for %r took %.3fms, exceeding the budget "
+                "of %.3fms",
+                name,
+                event,
+                duration * 1000,
+                self.budget * 1000,
+            )
+
+    def running(self):
+        """Get the innermost listener call running in each thread."""
+        now = _clock()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        result = []
+        for ident, stack in list(self._running.items()):
+            try:
+                callback, event, started = stack[-1]
+            except IndexError:
+                continue
+            result.append(
+                ListenerCall(
+                    thread=names.get(ident, str(ident)),
+                    listener=_qualified_name(callback),
+                    event=event,
+                    elapsed=now - started,
+                )
+            )
+        return result
+
+
+_listener_stats = {}
+_listener_lock = threading.Lock()
+
+
+def enable_listener_watchdog(budget=0.01, log=True):
+    """Start timing all calls to event listeners.
+
+    While enabled, every call to a listener registered with e.g.
+    :meth:`Session.on() <spotify.Session.on>` is timed, and the times are
+    recorded per listener and event. Calls that take longer than ``budget``
+    seconds are counted separately, and logged as warnings if ``log`` is
+    :class:`True`. Any previously recorded stats are discarded.
+
+    Listeners are called synchronously, from
+    :meth:`~spotify.Session.process_events` or from libspotify's internal
+    threads, so a slow listener stalls all event processing.
+
+    When disabled, which is the default, the listeners are not timed at all.
+    """
+    global _listener_stats
+    _listener_stats = {}
+    spotify.utils._listener_watchdog = _ListenerWatchdog(budget, log, _listener_stats)
+
+
+def disable_listener_watchdog():
+    """Stop timing calls to event listeners.
+
+    The stats recorded so far are still available from :func:`listeners`.
+    """
+    spotify.utils._listener_watchdog = None
+
+
+def listeners():
+    """Get the recorded run times for event listeners.
+
+    Returns a dict mapping ``(listener_name, event)`` pairs to
+    :class:`ListenerStats` instances. Listeners are named by their qualified
+    Python name, e.g. ``myapp.player.Player.on_end_of_track``.
+
+    The returned stats are a snapshot, and won't change as more stats are
+    recorded. See :func:`enable_listener_watchdog` to start recording.
+    """
+    with _listener_lock:
+        return {
+            key: ListenerStats(calls=stats.calls.copy(), slow=stats.slow.copy())
+            for key, stats in _listener_stats.items()
+        }
+
+
+def running_listeners():
+    """Get the event listener calls that are currently running.
+
+    Returns a list of :class:`ListenerCall` instances, one for each thread
+    that is currently running a listener. This can e.g. tell which listener
+    is blocking the :class:`~spotify.EventLoop` thread. Returns an empty list
+    if the watchdog isn't enabled. See :func:`enable_listener_watchdog`.
+    """
+    watchdog = spotify.utils._listener_watchdog
+    if watchdog is None:
+        return []
+    return watchdog.running()
+
+
+def format_table(histograms):
+    """Format a dict of :class:`Histogram` instances as a text table.
+
+    The rows are sorted with the largest total time first. All times are in
+    milliseconds.
+
+    Example::
+
+        >>> print(spotify.stats.format_table(spotify.stats.lib()))
+    """
+    columns = ["calls", "total", "mean", "p50", "p90", "p99", "max"]
+    width = max([len(name) for name in histograms] + [len("name")])
+    lines = [("%-*s" + " %10s" * len(columns)) % tuple([width, "name"] + columns)]
+    rows = sorted(histograms.items(), key=lambda item: item[1].total, reverse=True)
+    for name, histogram in rows:
+        values = [
+            histogram.total,
+            histogram.mean,
+            histogram.percentile(50),
+            histogram.percentile(90),
+            histogram.percentile(99),
+            histogram.max,
+        ]
+        lines.append(
+            ("%-*s %10d" + " %10.3f" * len(values))
+            % tuple([width, name, histogram.count] + [(v or 0) * 1000 for v in values])
+        )
+    return "\n".join(lines)
+
+
+def format_json(histograms):
+    """Format a dict of :class:`Histogram` instances as a JSON string.
+
+    Each histogram is summarized by :meth:`Histogram.as_dict`. All times are
+    in seconds.
+    """
+    return json.dumps(
+        {name: histogram.as_dict() for name, histogram in histograms.items()},
+        indent=2,
+        sort_keys=True,
+    )
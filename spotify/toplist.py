@@ -44,6 +44,11 @@ class Toplist(object):
     loaded_event = None
     """:class:`threading.Event` that is set when the toplist is loaded."""
 
+    future = None
+    """:class:`concurrent.futures.Future` that is completed when the toplist is
+    loaded.
+    """
+
     def __init__(
         self,
         session,
@@ -64,6 +69,7 @@ class Toplist(object):
         self.region = region
         self.canonical_username = canonical_username
         self.loaded_event = threading.Event()
+        self.future = utils.create_future()
 
         if sp_toplistbrowse is None:
             if isinstance(region, ToplistRegion):
@@ -122,6 +128,19 @@ class Toplist(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None, loop=None):
+        """Get an :mod:`asyncio` future that completes when the toplist's data
+        is loaded.
+
+        The future's result is ``self``, so the method can be awaited from a
+        coroutine::
+
+            >>> await toplist.load_async()
+
+        See :func:`spotify.utils.load_async` for details.
+        """
+        return utils.load_async(self._session, self, timeout=timeout, loop=loop)
+
     @property
     def error(self):
         """An :class:`ErrorType` associated with the toplist.
@@ -236,6 +255,8 @@ def _toplistbrowse_complete_callback(sp_toplistbrowse, handle):
     (session, toplist, callback) = ffi.from_handle(handle)
     session._callback_handles.remove(handle)
     toplist.loaded_event.set()
+    utils.complete_future(toplist)
+    session._change_notifier.notify()
     if callback is not None:
         callback(toplist)
 
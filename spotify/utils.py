@@ -2,19 +2,32 @@ from __future__ import unicode_literals
 
 import collections
 import functools
+import logging
 import pprint
+import threading
 import time
 
 import spotify
 from spotify import compat, ffi, lib, serialized
 
+__all__ = ["LoadAllResult", "iter_load_all", "load_all"]
+
+logger = logging.getLogger(__name__)
+
+
+# Set by spotify.stats.enable_listener_watchdog() to time listener calls.
+_listener_watchdog = None
+
 
 class EventEmitter(object):
 
     """Mixin for adding event emitter functionality to a class."""
 
     def __init__(self):
-        self._listeners = collections.defaultdict(list)
+        # Maps events to tuples of listeners. The tuples are replaced instead
+        # of modified when listeners are added or removed, so that emit() can
+        # iterate over them without copying or locking.
+        self._listeners = {}
 
     @serialized
     def on(self, event, listener, *user_args):
@@ -27,7 +40,41 @@ class EventEmitter(object):
         If the listener function returns :class:`False`, it is removed and will
         not be called the next time the ``event`` is emitted.
         """
-        self._listeners[event].append(_Listener(callback=listener, user_args=user_args))
+        self._add_listener(event, _Listener(callback=listener, user_args=user_args))
+
+    @serialized
+    def on_executor(self, executor, event, listener, *user_args, **kwargs):
+        """Register a ``listener`` to be called on ``event`` using ``executor``.
+
+        This works like :meth:`on`, except that the listener isn't called
+        directly from :meth:`emit`, but is run by ``executor``, which can be a
+        :class:`concurrent.futures.Executor`, like a thread pool, or an
+        :mod:`asyncio` event loop. Thus, slow listeners don't block
+        :meth:`~spotify.Session.process_events` or libspotify's internal
+        threads.
+
+        The listener is called in the order the events were emitted, one call
+        at a time. If the listener falls behind, up to ``max_pending`` calls,
+        1000 by default, are queued. When the queue is full, :meth:`emit`
+        doesn't wait for the listener to catch up, as it is often called while
+        pyspotify's global lock is held, which the listener may need too.
+        Instead, the event is dropped and a warning is logged. The same goes
+        for events emitted after the executor has been shut down or the event
+        loop has been closed.
+
+        The listener's return value is ignored, so it can't remove itself by
+        returning :class:`False`. Exceptions raised by the listener are logged.
+        The listener can be removed with :meth:`off` just like any other
+        listener.
+        """
+        max_pending = kwargs.pop("max_pending", 1000)
+        if kwargs:
+            raise TypeError("Unexpected keyword arguments: %r" % list(kwargs))
+        callback = _OffloadedListener(listener, executor, max_pending)
+        self._add_listener(event, _Listener(callback=callback, user_args=user_args))
+
+    def _add_listener(self, event, listener):
+        self._listeners[event] = self._listeners.get(event, ()) + (listener,)
 
     @serialized
     def off(self, event=None, listener=None):
@@ -40,16 +87,20 @@ class EventEmitter(object):
         object will be removed.
         """
         if event is None:
-            events = self._listeners.keys()
+            events = list(self._listeners.keys())
         else:
             events = [event]
         for event in events:
             if listener is None:
-                self._listeners[event] = []
+                self._listeners.pop(event, None)
+                continue
+            listeners = tuple(
+                v for v in self._listeners.get(event, ()) if v.callback != listener
+            )
+            if listeners:
+                self._listeners[event] = listeners
             else:
-                self._listeners[event] = [
-                    v for v in self._listeners[event] if v.callback != listener
-                ]
+                self._listeners.pop(event, None)
 
     def emit(self, event, *event_args):
         """Call the registered listeners for ``event``.
@@ -57,12 +108,18 @@ class EventEmitter(object):
         The listeners will be called with any extra arguments passed to
         :meth:`emit` first, and then the extra arguments passed to :meth:`on`
         """
-        listeners = self._listeners[event][:]
-        for listener in listeners:
-            args = list(event_args) + list(listener.user_args)
-            result = listener.callback(*args)
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+        watchdog = _listener_watchdog
+        for callback, user_args in listeners:
+            args = event_args + user_args if user_args else event_args
+            if watchdog is None:
+                result = callback(*args)
+            else:
+                result = watchdog.call(callback, event, args)
             if result is False:
-                self.off(event, listener.callback)
+                self.off(event, callback)
 
     def num_listeners(self, event=None):
         """Return the number of listeners for ``event``.
@@ -71,7 +128,7 @@ class EventEmitter(object):
         ``event`` is :class:`None`.
         """
         if event is not None:
-            return len(self._listeners[event])
+            return len(self._listeners.get(event, ()))
         else:
             return sum(len(v) for v in self._listeners.values())
 
@@ -91,9 +148,12 @@ class EventEmitter(object):
             "Expected exactly 1 event listener, found %d listeners"
             % self.num_listeners(event)
         )
-        listener = self._listeners[event][0]
-        args = list(event_args) + list(listener.user_args)
-        return listener.callback(*args)
+        callback, user_args = self._listeners[event][0]
+        args = event_args + user_args if user_args else event_args
+        watchdog = _listener_watchdog
+        if watchdog is None:
+            return callback(*args)
+        return watchdog.call(callback, event, args)
 
 
 class _Listener(collections.namedtuple("Listener", ["callback", "user_args"])):
@@ -101,6 +161,92 @@ class _Listener(collections.namedtuple("Listener", ["callback", "user_args"])):
     """An listener of events from an :class:`EventEmitter`"""
 
 
+class _OffloadedListener(object):
+
+    """Calls a listener in order on an executor or asyncio event loop.
+
+    The calls are queued, and a single task on the executor runs all queued
+    calls in order. While the queue is full, new calls are dropped and counted
+    in :attr:`dropped`, as the caller may hold the global lock that the
+    listener is waiting for.
+
+    Compares equal to the listener, so that :meth:`EventEmitter.off` can find
+    it.
+
+    Internal class.
+    """
+
+    def __init__(self, listener, executor, max_pending):
+        self.listener = listener
+        self._executor = executor
+        self._max_pending = max_pending
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._running = False
+        self.dropped = 0
+
+    def __repr__(self):
+        return "<offloaded %r>" % (self.listener,)
+
+    def __eq__(self, other):
+        if isinstance(other, _OffloadedListener):
+            return self.listener == other.listener
+        return self.listener == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.listener)
+
+    def __call__(self, *args):
+        with self._lock:
+            if len(self._queue) >= self._max_pending:
+                self.dropped += 1
+                logger.warning(
+                    "Offloaded event listener %r is %d calls behind; "
+                    "dropped %d calls in total",
+                    self.listener,
+                    len(self._queue),
+                    self.dropped,
+                )
+                return
+            self._queue.append(args)
+            if self._running:
+                return
+            self._running = True
+        try:
+            if hasattr(self._executor, "submit"):
+                self._executor.submit(self._run)
+            else:
+                self._executor.call_soon_threadsafe(self._run)
+        except RuntimeError:
+            # The executor is shut down, or the asyncio event loop is closed
+            with self._lock:
+                self._running = False
+                num_dropped = len(self._queue)
+                self._queue.clear()
+                self.dropped += num_dropped
+            logger.warning(
+                "Executor of offloaded event listener %r is shut down; "
+                "dropped %d calls",
+                self.listener,
+                num_dropped,
+            )
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._running = False
+                    return
+                args = self._queue.popleft()
+            try:
+                self.listener(*args)
+            except Exception:
+                logger.exception("Offloaded event listener %r failed", self.listener)
+
+
 class IntEnum(int):
 
     """An enum type for values mapping to integers.
@@ -110,11 +256,13 @@ class IntEnum(int):
     """
 
     def __new__(cls, value):
-        if not hasattr(cls, "_values"):
-            cls._values = {}
-        if value not in cls._values:
-            cls._values[value] = int.__new__(cls, value)
-        return cls._values[value]
+        try:
+            return cls._values[value]
+        except (AttributeError, KeyError):
+            if "_values" not in cls.__dict__:
+                cls._values = {}
+            attr = cls._values[value] = int.__new__(cls, value)
+            return attr
 
     def __repr__(self):
         if hasattr(self, "_name"):
@@ -130,6 +278,41 @@ class IntEnum(int):
         setattr(cls, name, attr)
 
 
+_constants_index = None
+
+
+def get_lib_constants(lib_prefix):
+    """Get all libspotify constants with names starting with ``lib_prefix``.
+
+    Returns a list of ``(name, value)`` pairs, sorted by name.
+
+    The constants are read from :attr:`spotify.lib` once, and indexed by all
+    their name prefixes ending with an underscore, e.g. ``SP_``,
+    ``SP_ERROR_``, and ``SP_ERROR_BAD_`` for ``SP_ERROR_BAD_API_VERSION``.
+    Thus, looking up the constants for a ``lib_prefix`` ending with an
+    underscore doesn't need to scan the full library.
+    """
+    global _constants_index
+    if _constants_index is None:
+        index = collections.defaultdict(list)
+        for name in sorted(dir(lib)):
+            if not name.startswith("SP_"):
+                continue
+            value = getattr(lib, name)
+            end = name.find("_")
+            while end != -1:
+                index[name[: end + 1]].append((name, value))
+                end = name.find("_", end + 1)
+        _constants_index = dict(index)
+    if lib_prefix.endswith("_"):
+        return list(_constants_index.get(lib_prefix, []))
+    return [
+        (name, value)
+        for name, value in _constants_index["SP_"]
+        if name.startswith(lib_prefix)
+    ]
+
+
 def make_enum(lib_prefix, enum_prefix=""):
     """Class decorator for automatically adding enum values.
 
@@ -140,10 +323,9 @@ def make_enum(lib_prefix, enum_prefix=""):
     """
 
     def wrapper(cls):
-        for attr in dir(lib):
-            if attr.startswith(lib_prefix):
-                name = attr.replace(lib_prefix, enum_prefix)
-                cls.add(name, getattr(lib, attr))
+        for attr, value in get_lib_constants(lib_prefix):
+            name = attr.replace(lib_prefix, enum_prefix)
+            cls.add(name, value)
         return cls
 
     return wrapper
@@ -192,6 +374,194 @@ def _check_error(obj):
     spotify.Error.maybe_raise(error_type, ignores=[spotify.ErrorType.IS_LOADING])
 
 
+def create_future():
+    """Create a :class:`concurrent.futures.Future` for a pending request.
+
+    Returns :class:`None` on Python 2 if the ``futures`` backport isn't
+    installed.
+
+    Internal function.
+    """
+    if compat.futures is None:
+        return None
+    return compat.futures.Future()
+
+
+def complete_future(obj):
+    """Complete ``obj.future`` when ``obj`` is done loading.
+
+    The future's result is ``obj`` itself, unless ``obj`` has an error, in
+    which case the future's exception is a :exc:`spotify.LibError`.
+
+    Internal function.
+    """
+    future = obj.future
+    if future is None or future.done():
+        return
+    try:
+        _check_error(obj)
+    except spotify.Error as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(obj)
+
+
+class ChangeNotifier(object):
+
+    """Lets threads wait until libspotify may have changed its objects' state.
+
+    The session notifies when e.g. metadata has been updated or a browse
+    request has completed, and threads waiting in :func:`load` wake up to
+    check if the object they're waiting for is done loading.
+
+    If no event loop is running, the waiting threads must call
+    :meth:`~spotify.Session.process_events` themselves, so they are also woken
+    up by :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` events. The same
+    goes for a thread waiting on the event loop's own thread, e.g. in an event
+    listener, as the event loop can't process events until it returns. Only
+    one of the waiting threads processes events at a time, through
+    :meth:`process_events`, while the others just check their objects again.
+
+    Internal class.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._processing = threading.Lock()
+
+    generation = 0
+    """Counter that is increased by each notification."""
+
+    event_loop_thread = None
+    """Identifier of the thread where an event loop is calling
+    :meth:`~spotify.Session.process_events` when needed, or :class:`None` if
+    no event loop is running."""
+
+    _event_loop_thread_waiting = False
+
+    # Whether libspotify has asked for events to be processed since the last
+    # call to process_events(), and when they must be processed at the latest
+    _events_pending = True
+    _process_events_at = 0
+
+    _listeners = ()
+
+    @property
+    def event_loop_running(self):
+        """Whether an event loop is calling
+        :meth:`~spotify.Session.process_events` when needed."""
+        return self.event_loop_thread is not None
+
+    def should_process_events(self):
+        """Whether the calling thread must call
+        :meth:`~spotify.Session.process_events` itself while waiting.
+
+        That is the case if no event loop is running, or if the caller is
+        running on the event loop's own thread.
+        """
+        thread = self.event_loop_thread
+        return thread is None or thread == threading.current_thread().ident
+
+    def add_listener(self, callback):
+        """Call ``callback`` without arguments on each notification.
+
+        The callback is called from internal libspotify threads, and must not
+        block.
+        """
+        with self._condition:
+            self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback):
+        """Stop calling ``callback`` on notifications."""
+        with self._condition:
+            listeners = list(self._listeners)
+            listeners.remove(callback)
+            self._listeners = tuple(listeners)
+
+    def notify(self):
+        """Wake up all waiting threads, and call all listeners.
+
+        Must not block, as it is called from internal libspotify threads.
+        Exceptions raised by listeners are logged, so that they don't keep the
+        caller from e.g. calling the user's callback or emitting an event.
+        """
+        with self._condition:
+            self.generation += 1
+            self._condition.notify_all()
+        for listener in self._listeners:
+            try:
+                listener()
+            except Exception:
+                logger.exception("Change listener %r failed", listener)
+
+    def notify_main_thread(self):
+        """Wake up all waiting threads if they need to process events."""
+        self._events_pending = True
+        if self.event_loop_thread is None or self._event_loop_thread_waiting:
+            self.notify()
+
+    def process_events(self, session):
+        """Call :meth:`~spotify.Session.process_events` on behalf of all
+        waiting threads, if needed.
+
+        Events are processed if libspotify has asked for it, or if the
+        timeout returned by the last call has been reached, and no other
+        thread is already processing them. Thus, a notification that wakes up
+        many waiting threads only leads to a single call.
+
+        Returns the number of seconds until events must be processed again.
+        """
+        if not self._processing.acquire(False):
+            # Another thread is processing events, and the notifications it
+            # causes wake us up again.
+            return _LOAD_RECHECK_INTERVAL
+        try:
+            now = time.time()
+            if not self._events_pending and now < self._process_events_at:
+                return self._process_events_at - now
+            self._events_pending = False
+            timeout = session.process_events() / 1000.0
+            self._process_events_at = time.time() + timeout
+            return timeout
+        finally:
+            self._processing.release()
+
+    def wait(self, generation, timeout):
+        """Wait up to ``timeout`` seconds for a notification.
+
+        Returns immediately if there has been any notifications since
+        :attr:`generation` had the value ``generation``.
+        """
+        with self._condition:
+            if self.generation != generation:
+                return
+            if self.event_loop_thread != threading.current_thread().ident:
+                self._condition.wait(timeout)
+                return
+            self._event_loop_thread_waiting = True
+            try:
+                self._condition.wait(timeout)
+            finally:
+                self._event_loop_thread_waiting = False
+
+
+# Upper bound on how long load() sleeps between checks of the object's state,
+# in case the state changes without any notification from libspotify.
+_LOAD_RECHECK_INTERVAL = 1.0
+
+
+def _add_load_callbacks(obj):
+    """Register the libspotify callbacks of objects that need them to notify
+    the session's :class:`ChangeNotifier` when they are done loading, like
+    playlists.
+
+    Internal function.
+    """
+    add_callbacks = getattr(obj, "_add_callbacks", None)
+    if add_callbacks is not None:
+        add_callbacks()
+
+
 def load(session, obj, timeout=None):
     """Block until the object's data is loaded.
 
@@ -208,6 +578,13 @@ def load(session, obj, timeout=None):
     no timeout, since no timeout would cause programs to potentially hang
     forever without any information to help debug the issue.
 
+    While waiting, the thread sleeps until the session signals that objects
+    may have changed, e.g. by the :attr:`~spotify.SessionEvent.METADATA_UPDATED`
+    event. If an :class:`~spotify.EventLoop` is running, it is left to process
+    the events. Otherwise, or if called from the event loop's own thread, e.g.
+    from an event listener, the waiting thread calls
+    :meth:`~spotify.Session.process_events` itself when needed.
+
     The method returns ``self`` to allow for chaining of calls.
     """
     _check_error(obj)
@@ -223,26 +600,312 @@ def load(session, obj, timeout=None):
     if timeout is None:
         timeout = 10
     deadline = time.time() + timeout
+    notifier = session._change_notifier
+    _add_load_callbacks(obj)
+
+    while True:
+        generation = notifier.generation
+        wait = _LOAD_RECHECK_INTERVAL
+        if notifier.should_process_events():
+            # Sleeping for the time returned by process_events() is safe, as
+            # the "notify_main_thread" session callback wakes us up if
+            # libspotify needs events to be processed earlier.
+            wait = min(wait, notifier.process_events(session))
 
-    while not obj.is_loaded:
-        session.process_events()
         _check_error(obj)
         if obj.is_loaded:
             return obj
-        if time.time() > deadline:
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
             raise spotify.Timeout(timeout)
 
-        # Instead of sleeping for a very short time and making a tight loop
-        # here, one might be tempted to sleep for the time returned by the
-        # session.process_events() call above. If no event loop is running,
-        # that could lead to very long waits (up to a minute or so) since no
-        # one is doing anything on "notify_main_thread" session callbacks,
-        # which is intended to interrupt the sleep interval prescribed by
-        # session.process_events(). Thus, it is better to make this loop tight.
-        time.sleep(0.001)
+        notifier.wait(generation, min(wait, remaining))
 
-    _check_error(obj)
-    return obj
+
+class LoadAllResult(
+    collections.namedtuple("LoadAllResult", ["loaded", "failed", "timed_out"])
+):
+
+    """The result of :func:`~spotify.load_all`.
+
+    Each attribute is a set of the objects that were passed to
+    :func:`~spotify.load_all`.
+    """
+
+    pass
+
+
+def _partition_loaded(objects):
+    """Check which of the ``objects`` are done loading.
+
+    Returns a list of ``(obj, error)`` pairs for the objects that are done,
+    and a list of the objects that are still loading. ``error`` is
+    :class:`None` for loaded objects, and a :exc:`spotify.Error` for objects
+    that failed to load.
+
+    Internal function.
+    """
+    done = []
+    pending = []
+    with spotify.batch():
+        for obj in objects:
+            try:
+                _check_error(obj)
+            except spotify.Error as exc:
+                done.append((obj, exc))
+                continue
+            if obj.is_loaded:
+                done.append((obj, None))
+            else:
+                pending.append(obj)
+    return done, pending
+
+
+def iter_load_all(objects, timeout=None):
+    """Load many objects at once, yielding them as they are done loading.
+
+    ``objects`` can be any iterable of objects with a ``load()`` method, like
+    :class:`~spotify.Track`, :class:`~spotify.Album`,
+    :class:`~spotify.AlbumBrowser`, or :class:`~spotify.Image`. All objects
+    must belong to the same session.
+
+    Yields an ``(obj, error)`` pair for each object, exactly once, in the
+    order the objects are done loading. ``error`` is :class:`None` if the
+    object was loaded, a :exc:`~spotify.LibError` if the object failed to
+    load, or a :exc:`~spotify.Timeout` if the object still wasn't loaded when
+    ``timeout`` seconds had passed.
+
+    All objects share the same deadline. If unspecified, the ``timeout``
+    defaults to 10s, just like for :func:`~spotify.utils.load`.
+
+    If the session isn't logged in, a :exc:`spotify.Error` is raised before
+    any of the objects that aren't already loaded are yielded.
+    """
+    done, pending = _partition_loaded(objects)
+    for item in done:
+        yield item
+    if not pending:
+        return
+
+    session = pending[0]._session
+    if session.connection.state is not spotify.ConnectionState.LOGGED_IN:
+        raise spotify.Error(
+            "Session must be logged in and online to load objects: %r"
+            % session.connection.state
+        )
+
+    if timeout is None:
+        timeout = 10
+    deadline = time.time() + timeout
+    notifier = session._change_notifier
+    for obj in pending:
+        _add_load_callbacks(obj)
+
+    while True:
+        generation = notifier.generation
+        wait = _LOAD_RECHECK_INTERVAL
+        if notifier.should_process_events():
+            wait = min(wait, notifier.process_events(session))
+
+        done, pending = _partition_loaded(pending)
+        for item in done:
+            yield item
+        if not pending:
+            return
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            for obj in pending:
+                yield obj, spotify.Timeout(timeout)
+            return
+
+        notifier.wait(generation, min(wait, remaining))
+
+
+def load_all(objects, timeout=None):
+    """Block until all the ``objects`` are loaded, failed, or timed out.
+
+    This is a lot more efficient than calling ``load()`` on each object in
+    turn, as all objects are waited for at once, against one shared deadline::
+
+        >>> tracks = [session.get_track(uri) for uri in uris]
+        >>> result = spotify.load_all(tracks, timeout=30)
+        >>> len(result.loaded), len(result.failed), len(result.timed_out)
+        (4998, 2, 0)
+
+    See :func:`iter_load_all` for details on the arguments, and for a way to
+    handle the objects as they are done loading.
+
+    Returns a :class:`LoadAllResult`.
+    """
+    result = LoadAllResult(loaded=set(), failed=set(), timed_out=set())
+    for obj, error in iter_load_all(objects, timeout=timeout):
+        if error is None:
+            result.loaded.add(obj)
+        elif isinstance(error, spotify.Timeout):
+            result.timed_out.add(obj)
+        else:
+            result.failed.add(obj)
+    return result
+
+
+class _AsyncLoader(object):
+
+    """Completes :mod:`asyncio` futures for objects that are loading.
+
+    There is one loader per session and asyncio event loop with objects that
+    are loading. The loader checks all its objects at once when the session's
+    :class:`ChangeNotifier` is notified, e.g. by the completion callback of a
+    browse request, and then at least every :data:`_LOAD_RECHECK_INTERVAL`.
+
+    If no :class:`~spotify.EventLoop` is running, the loader also calls
+    :meth:`~spotify.Session.process_events` when needed.
+
+    All methods but :meth:`_notify` must be called from the asyncio event
+    loop's thread.
+
+    Internal class.
+    """
+
+    def __init__(self, session, loop):
+        self._session = session
+        self._loop = loop
+        self._pending = {}
+        self._scheduled = False
+        self._timer = None
+
+    def add(self, obj, future, timeout):
+        handle = self._loop.call_later(timeout, self._time_out, future, timeout)
+        self._pending[future] = (obj, handle)
+        future.add_done_callback(self._discard)
+        if len(self._pending) == 1:
+            self._session._change_notifier.add_listener(self._notify)
+            self._loop.call_soon(self._check)
+
+    def _discard(self, future):
+        # Called when the future is done, whether it completed, failed, timed
+        # out, or was cancelled.
+        obj, handle = self._pending.pop(future)
+        handle.cancel()
+        if self._pending:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._session._change_notifier.remove_listener(self._notify)
+        del _async_loaders[(self._session, self._loop)]
+
+    def _notify(self):
+        # Called from internal libspotify threads.
+        if self._scheduled:
+            return
+        self._scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._check)
+        except RuntimeError:
+            # The asyncio event loop is closed, so the futures can never be
+            # completed. Drop the loader instead of being notified forever.
+            self._scheduled = False
+            logger.warning(
+                "asyncio event loop is closed; dropped %d pending loads",
+                len(self._pending),
+            )
+            self._drop()
+
+    def _drop(self):
+        self._pending.clear()
+        try:
+            self._session._change_notifier.remove_listener(self._notify)
+        except ValueError:
+            pass  # Already dropped by another libspotify thread
+        key = (self._session, self._loop)
+        if _async_loaders.get(key) is self:
+            _async_loaders.pop(key, None)
+
+    def _time_out(self, future, timeout):
+        if not future.done():
+            future.set_exception(spotify.Timeout(timeout))
+
+    def _check(self):
+        self._scheduled = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        wait = _LOAD_RECHECK_INTERVAL
+        notifier = self._session._change_notifier
+        if not notifier.event_loop_running:
+            wait = min(wait, notifier.process_events(self._session))
+
+        with spotify.batch():
+            for future, (obj, _) in list(self._pending.items()):
+                if future.done():
+                    continue
+                try:
+                    _check_error(obj)
+                except spotify.Error as exc:
+                    future.set_exception(exc)
+                    continue
+                if obj.is_loaded:
+                    future.set_result(obj)
+
+        self._timer = self._loop.call_later(wait, self._check)
+
+
+_async_loaders = {}
+
+
+def load_async(session, obj, timeout=None, loop=None):
+    """Get an :mod:`asyncio` future that completes when the object's data is
+    loaded.
+
+    This is the asyncio equivalent of :func:`load`. The future's result is the
+    object itself. If the object fails to load, the future's exception is a
+    :exc:`spotify.LibError`, or :exc:`spotify.Timeout` after ``timeout``
+    seconds. The object can be loading while the future is awaited, without
+    blocking the asyncio event loop or using up a thread.
+
+    If ``loop`` is :class:`None`, the current asyncio event loop is used. The
+    function must be called from the asyncio event loop's thread.
+
+    Requires Python 3.5 or newer.
+    """
+    import asyncio
+
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    future = loop.create_future()
+
+    try:
+        _check_error(obj)
+    except spotify.Error as exc:
+        future.set_exception(exc)
+        return future
+    if obj.is_loaded:
+        future.set_result(obj)
+        return future
+
+    if session.connection.state is not spotify.ConnectionState.LOGGED_IN:
+        future.set_exception(
+            spotify.Error(
+                "Session must be logged in and online to load objects: %r"
+                % session.connection.state
+            )
+        )
+        return future
+
+    if timeout is None:
+        timeout = 10
+    _add_load_callbacks(obj)
+
+    loader = _async_loaders.get((session, loop))
+    if loader is None:
+        loader = _async_loaders[(session, loop)] = _AsyncLoader(session, loop)
+    loader.add(obj, future, timeout)
+    return future
 
 
 class Sequence(compat.Sequence):
@@ -2,6 +2,8 @@ from __future__ import unicode_literals
 
 from spotify import lib, utils
 
+__all__ = ["get_libspotify_api_version", "get_libspotify_build_id"]
+
 
 def get_libspotify_api_version():
     """Get the API compatibility level of the wrapped libspotify library.
@@ -51,6 +51,7 @@ def create_session_mock():
     session._cache = weakref.WeakValueDictionary()
     session._emitters = []
     session._callback_handles = set()
+    session._change_notifier = spotify.utils.ChangeNotifier()
     return session
 
 
@@ -0,0 +1,40 @@
+"""Compare per-call locking of :attr:`spotify.lib` with :func:`spotify.batch`.
+
+The benchmark calls a cheap libspotify function that doesn't need a session,
+so it mostly measures pyspotify's locking overhead.
+
+Usage: python tests/benchmarks/bench_batch.py [NUM_CALLS]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+import spotify
+
+
+def per_call_locking(num_calls):
+    sp_error_message = spotify.lib.sp_error_message
+    for _ in range(num_calls):
+        sp_error_message(0)
+
+
+def batched_locking(num_calls):
+    sp_error_message = spotify.lib.sp_error_message
+    with spotify.batch():
+        for _ in range(num_calls):
+            sp_error_message(0)
+
+
+def main(num_calls):
+    for func in (per_call_locking, batched_locking):
+        best = min(timeit.repeat(lambda: func(num_calls), number=1, repeat=5))
+        print(
+            "%-20s %8d calls in %.3fs, %.0f ns/call"
+            % (func.__name__, num_calls, best, best / num_calls * 1e9)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
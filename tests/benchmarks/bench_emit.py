@@ -0,0 +1,52 @@
+"""Measure :meth:`spotify.utils.EventEmitter.emit` throughput.
+
+The listeners do nothing, so the benchmark measures the event emitter's own
+overhead for events with 0, 1, and 10 listeners, with and without extra
+arguments given to :meth:`~spotify.utils.EventEmitter.on`.
+
+Usage: python tests/benchmarks/bench_emit.py [NUM_EMITS]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from spotify import utils
+
+
+def listener(*args):
+    pass
+
+
+def create_emitter(num_listeners, user_args):
+    emitter = utils.EventEmitter()
+    for _ in range(num_listeners):
+        emitter.on("event", listener, *user_args)
+    return emitter
+
+
+def main(num_emits):
+    for num_listeners in (0, 1, 10):
+        for user_args in ((), ("user_arg",)):
+            emitter = create_emitter(num_listeners, user_args)
+            emit = emitter.emit
+            best = min(
+                timeit.repeat(
+                    lambda: emit("event", "event_arg"), number=num_emits, repeat=5
+                )
+            )
+            print(
+                "%2d listeners, %d user args: %8d emits in %.3fs, %.0f ns/emit"
+                % (
+                    num_listeners,
+                    len(user_args),
+                    num_emits,
+                    best,
+                    best / num_emits * 1e9,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
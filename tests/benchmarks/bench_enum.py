@@ -0,0 +1,68 @@
+"""Measure enum construction, error checking, and :class:`spotify.Track`
+property access.
+
+The track is backed by a fake libspotify implemented in Python, so that the
+benchmark doesn't need a logged in session. It measures pyspotify's own
+overhead around each libspotify call.
+
+Usage: python tests/benchmarks/bench_enum.py [NUM_CALLS]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+import spotify
+import spotify.track
+
+
+class FakeLib(object):
+    def __init__(self, lib):
+        self._lib = lib
+
+    def __getattr__(self, name):
+        return getattr(self._lib, name)
+
+    def sp_track_add_ref(self, sp_track):
+        return spotify.ErrorType.OK
+
+    def sp_track_release(self, sp_track):
+        return spotify.ErrorType.OK
+
+    def sp_track_error(self, sp_track):
+        return spotify.lib.SP_ERROR_OK
+
+    def sp_track_is_loaded(self, sp_track):
+        return 1
+
+    def sp_track_is_placeholder(self, sp_track):
+        return 0
+
+
+def main(num_calls):
+    spotify.track.lib = FakeLib(spotify.track.lib)
+    track = spotify.Track(
+        session=None, sp_track=spotify.ffi.cast("sp_track *", 1), add_ref=False
+    )
+    ok = spotify.lib.SP_ERROR_OK
+    is_loading = spotify.ErrorType.IS_LOADING
+
+    cases = [
+        ("ErrorType(OK)", lambda: spotify.ErrorType(ok)),
+        ("LinkType(TRACK)", lambda: spotify.LinkType(1)),
+        ("Error.maybe_raise(OK)", lambda: spotify.Error.maybe_raise(ok)),
+        (
+            "Error.maybe_raise(OK, ignores)",
+            lambda: spotify.Error.maybe_raise(ok, ignores=[is_loading]),
+        ),
+        ("Track.error", lambda: track.error),
+        ("Track.is_placeholder", lambda: track.is_placeholder),
+    ]
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=num_calls, repeat=5))
+        print("%-32s %7.0f ns/call" % (name, best / num_calls * 1e9))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
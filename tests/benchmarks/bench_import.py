@@ -0,0 +1,41 @@
+"""Measure the time it takes to import pyspotify in a fresh interpreter.
+
+Each snippet is run in a new Python process, and the best wall clock time of
+a number of runs is reported, including the interpreter startup time. The
+"python" baseline shows the startup time alone.
+
+Usage: python tests/benchmarks/bench_import.py [NUM_RUNS]
+"""
+
+from __future__ import print_function
+
+import subprocess
+import sys
+import time
+
+SNIPPETS = [
+    ("python", "pass"),
+    ("import spotify", "import spotify"),
+    ("spotify.__version__", "import spotify; spotify.__version__"),
+    ("spotify.ErrorType", "import spotify; spotify.ErrorType"),
+    ("spotify.Session", "import spotify; spotify.Session"),
+    ("from spotify import *", "from spotify import *"),
+]
+
+
+def run(code, num_runs):
+    timings = []
+    for _ in range(num_runs):
+        started = time.time()
+        subprocess.check_call([sys.executable, "-c", code])
+        timings.append(time.time() - started)
+    return min(timings)
+
+
+def main(num_runs):
+    for name, code in SNIPPETS:
+        print("%-25s %7.1f ms" % (name, run(code, num_runs) * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
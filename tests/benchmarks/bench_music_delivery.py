@@ -0,0 +1,97 @@
+"""Measure the throughput of the ``music_delivery`` session callback.
+
+The benchmark calls the callback directly with a buffer of silence, like
+libspotify does from its audio thread, and a listener that consumes all
+frames. It compares copying the frames to a bytestring with giving the
+listener a :class:`memoryview` of the buffer, see
+:attr:`spotify.Session.music_delivery_zero_copy`, and with copying the frames
+to a buffer from an :class:`spotify.AudioBufferPool` that the listener gives
+back, see :attr:`spotify.Session.music_delivery_buffer_pool`.
+
+Run it with a small NUM_FRAMES, e.g. 1, to measure the per-delivery overhead
+without the cost of copying the frames.
+
+Usage: python tests/benchmarks/bench_music_delivery.py [NUM_DELIVERIES]
+    [NUM_FRAMES]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+import spotify
+from spotify.session import _SessionCallbacks
+
+CHANNELS = 2
+
+
+def listener(session, audio_format, frames, num_frames):
+    return num_frames
+
+
+def pooled_listener(session, audio_format, frames, num_frames):
+    session.music_delivery_buffer_pool.release(frames)
+    return num_frames
+
+
+def deliver(num_deliveries, sp_audioformat, frames, num_frames):
+    music_delivery = _SessionCallbacks.music_delivery
+    for _ in range(num_deliveries):
+        music_delivery(spotify.ffi.NULL, sp_audioformat, frames, num_frames)
+
+
+def main(num_deliveries, num_frames):
+    sp_audioformat = spotify.ffi.new(
+        "sp_audioformat *",
+        {
+            "sample_type": spotify.SampleType.INT16_NATIVE_ENDIAN,
+            "sample_rate": 44100,
+            "channels": CHANNELS,
+        },
+    )
+    frames = spotify.ffi.new("int16_t[]", num_frames * CHANNELS)
+    num_bytes = num_deliveries * num_frames * CHANNELS * 2
+
+    # A session object that skips creating a libspotify session
+    session = spotify.Session.__new__(spotify.Session)
+    spotify.utils.EventEmitter.__init__(session)
+    spotify._session_instance = session
+    try:
+        for mode in ("copy", "zero_copy", "pool"):
+            session.off(spotify.SessionEvent.MUSIC_DELIVERY)
+            if mode == "pool":
+                session.on(spotify.SessionEvent.MUSIC_DELIVERY, pooled_listener)
+            else:
+                session.on(spotify.SessionEvent.MUSIC_DELIVERY, listener)
+            session.music_delivery_zero_copy = mode == "zero_copy"
+            if mode == "pool":
+                session.music_delivery_buffer_pool = spotify.AudioBufferPool()
+            best = min(
+                timeit.repeat(
+                    lambda: deliver(
+                        num_deliveries, sp_audioformat, frames, num_frames
+                    ),
+                    number=1,
+                    repeat=5,
+                )
+            )
+            print(
+                "%-10s %8d deliveries in %.3fs, %.0f ns/delivery, %.0f MB/s"
+                % (
+                    mode,
+                    num_deliveries,
+                    best,
+                    best / num_deliveries * 1e9,
+                    num_bytes / best / 1e6,
+                )
+            )
+    finally:
+        spotify._session_instance = None
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2048,
+    )
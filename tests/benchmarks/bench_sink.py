@@ -0,0 +1,127 @@
+"""Measure how fast an audio sink accepts audio from libspotify.
+
+A stand-in for libspotify's audio thread calls the ``music_delivery`` session
+callback directly with chunks of silence, so the benchmark covers the whole
+Python side of the audio path: the cffi callback, the copy of the frames, the
+call to the listener, and the sink itself.
+
+With the ``null`` sink, the :class:`spotify.NullSink` statistics are printed,
+including the time between deliveries, which is the per-delivery overhead of
+pyspotify's audio path. With the ``wav`` sink, the audio is written to a
+temporary file with :class:`spotify.WavSink`.
+
+Usage: python tests/benchmarks/bench_sink.py [null|wav] [SECONDS_OF_AUDIO]
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import spotify
+from spotify.session import _SessionCallbacks
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+
+class FakeLibspotify(object):
+
+    """Delivers audio through the ``music_delivery`` callback like libspotify.
+
+    Frames that the sink doesn't consume are delivered again, after a pause
+    if none were consumed.
+    """
+
+    def __init__(self, chunk_frames=2048):
+        self.chunk_frames = chunk_frames
+        self.sp_audioformat = spotify.ffi.new(
+            "sp_audioformat *",
+            {
+                "sample_type": spotify.SampleType.INT16_NATIVE_ENDIAN,
+                "sample_rate": SAMPLE_RATE,
+                "channels": CHANNELS,
+            },
+        )
+        self.frames = spotify.ffi.new("int16_t[]", chunk_frames * CHANNELS)
+
+    def play(self, num_frames):
+        music_delivery = _SessionCallbacks.music_delivery
+        sp_audioformat = self.sp_audioformat
+        frames = self.frames
+        while num_frames > 0:
+            chunk_frames = min(num_frames, self.chunk_frames)
+            consumed = music_delivery(
+                spotify.ffi.NULL, sp_audioformat, frames, chunk_frames
+            )
+            if consumed == 0:
+                time.sleep(0.1)
+            num_frames -= consumed
+
+
+def create_session():
+    # A session object that skips creating a libspotify session
+    session = spotify.Session.__new__(spotify.Session)
+    spotify.utils.EventEmitter.__init__(session)
+    return session
+
+
+def main(sink_name, seconds):
+    num_frames = seconds * SAMPLE_RATE
+    num_bytes = num_frames * CHANNELS * 2
+
+    tmpdir = tempfile.mkdtemp()
+    session = create_session()
+    spotify._session_instance = session
+    try:
+        if sink_name == "null":
+            sink = spotify.NullSink(session, window=100000)
+        else:
+            sink = spotify.WavSink(session, os.path.join(tmpdir, "bench.wav"))
+        started = time.time()
+        FakeLibspotify().play(num_frames)
+        sink.off()
+        elapsed = time.time() - started
+    finally:
+        spotify._session_instance = None
+        shutil.rmtree(tmpdir)
+
+    print(
+        "%s: %ds of audio in %.3fs, %.0f MB/s, %.0fx real time"
+        % (
+            type(sink).__name__,
+            seconds,
+            elapsed,
+            num_bytes / elapsed / 1e6,
+            seconds / elapsed,
+        )
+    )
+    if sink_name == "null":
+        stats = sink.stats()
+        print(
+            "  %d deliveries of %d frames, %.0f frames/s, %.0f MB/s"
+            % (
+                stats["deliveries"],
+                stats["chunk_sizes"]["p50"],
+                stats["frames_per_second"],
+                stats["bytes_per_second"] / 1e6,
+            )
+        )
+        print(
+            "  between deliveries: mean %.0f ns, p99 %.0f ns, jitter %.0f ns"
+            % (
+                stats["intervals"]["mean"] * 1e9,
+                stats["intervals"]["p99"] * 1e9,
+                stats["jitter"] * 1e9,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else "null",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3600,
+    )
@@ -110,6 +110,15 @@ class AlbumTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, album, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_album = spotify.ffi.cast("sp_album *", 42)
+        album = spotify.Album(self.session, sp_album=sp_album)
+
+        album.load_async(10)
+
+        load_mock.assert_called_with(self.session, album, timeout=10, loop=None)
+
     def test_is_available(self, lib_mock):
         lib_mock.sp_album_is_available.return_value = 1
         sp_album = spotify.ffi.cast("sp_album *", 42)
@@ -365,6 +374,85 @@ class AlbumBrowserTest(unittest.TestCase):
         result.loaded_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_browse_complete_callback_completes_future(self, lib_mock):
+        lib_mock.sp_albumbrowse_error.return_value = int(spotify.ErrorType.OK)
+        sp_album = spotify.ffi.cast("sp_album *", 43)
+        album = spotify.Album(self.session, sp_album=sp_album)
+        sp_albumbrowse = spotify.ffi.cast("sp_albumbrowse *", 42)
+        lib_mock.sp_albumbrowse_create.return_value = sp_albumbrowse
+
+        result = album.browse()
+        self.assertFalse(result.future.done())
+        albumbrowse_complete_cb = lib_mock.sp_albumbrowse_create.call_args[0][2]
+        userdata = lib_mock.sp_albumbrowse_create.call_args[0][3]
+        albumbrowse_complete_cb(sp_albumbrowse, userdata)
+
+        self.assertEqual(result.future.result(timeout=0), result)
+
+    def test_browse_complete_callback_fails_future_on_error(self, lib_mock):
+        lib_mock.sp_albumbrowse_error.return_value = int(
+            spotify.ErrorType.OTHER_PERMANENT
+        )
+        sp_album = spotify.ffi.cast("sp_album *", 43)
+        album = spotify.Album(self.session, sp_album=sp_album)
+        sp_albumbrowse = spotify.ffi.cast("sp_albumbrowse *", 42)
+        lib_mock.sp_albumbrowse_create.return_value = sp_albumbrowse
+
+        result = album.browse()
+        albumbrowse_complete_cb = lib_mock.sp_albumbrowse_create.call_args[0][2]
+        userdata = lib_mock.sp_albumbrowse_create.call_args[0][3]
+        albumbrowse_complete_cb(sp_albumbrowse, userdata)
+
+        self.assertIsInstance(result.future.exception(timeout=0), spotify.LibError)
+
+    def test_browse_complete_callback_notifies_loaders(self, lib_mock):
+        sp_album = spotify.ffi.cast("sp_album *", 43)
+        album = spotify.Album(self.session, sp_album=sp_album)
+        sp_albumbrowse = spotify.ffi.cast("sp_albumbrowse *", 42)
+        lib_mock.sp_albumbrowse_create.return_value = sp_albumbrowse
+        generation = self.session._change_notifier.generation
+
+        album.browse()
+        albumbrowse_complete_cb = lib_mock.sp_albumbrowse_create.call_args[0][2]
+        userdata = lib_mock.sp_albumbrowse_create.call_args[0][3]
+        albumbrowse_complete_cb(sp_albumbrowse, userdata)
+
+        self.assertEqual(self.session._change_notifier.generation, generation + 1)
+
+    def test_browse_complete_callback_is_called_if_change_listener_fails(
+        self, lib_mock
+    ):
+        sp_album = spotify.ffi.cast("sp_album *", 43)
+        album = spotify.Album(self.session, sp_album=sp_album)
+        sp_albumbrowse = spotify.ffi.cast("sp_albumbrowse *", 42)
+        lib_mock.sp_albumbrowse_create.return_value = sp_albumbrowse
+        listener = mock.Mock(side_effect=RuntimeError("Event loop is closed"))
+        self.session._change_notifier.add_listener(listener)
+        callback = mock.Mock()
+
+        result = album.browse(callback)
+        albumbrowse_complete_cb = lib_mock.sp_albumbrowse_create.call_args[0][2]
+        userdata = lib_mock.sp_albumbrowse_create.call_args[0][3]
+        with mock.patch("spotify.utils.logger"):
+            albumbrowse_complete_cb(sp_albumbrowse, userdata)
+
+        listener.assert_called_once_with()
+        callback.assert_called_once_with(result)
+
+    @mock.patch("spotify.utils.load_async")
+    def test_browse_async(self, load_async_mock, lib_mock):
+        sp_album = spotify.ffi.cast("sp_album *", 43)
+        album = spotify.Album(self.session, sp_album=sp_album)
+        sp_albumbrowse = spotify.ffi.cast("sp_albumbrowse *", 42)
+        lib_mock.sp_albumbrowse_create.return_value = sp_albumbrowse
+
+        result = album.browse_async(10)
+
+        self.assertEqual(result, load_async_mock.return_value)
+        browser = load_async_mock.call_args[0][1]
+        self.assertIsInstance(browser, spotify.AlbumBrowser)
+        load_async_mock.assert_called_with(self.session, browser, timeout=10, loop=None)
+
     def test_browser_is_gone_before_callback_is_called(self, lib_mock):
         sp_album = spotify.ffi.cast("sp_album *", 43)
         album = spotify.Album(self.session, sp_album=sp_album)
@@ -468,6 +556,15 @@ class AlbumBrowserTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, browser, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_albumbrowse = spotify.ffi.cast("sp_albumbrowse *", 42)
+        browser = spotify.AlbumBrowser(self.session, sp_albumbrowse=sp_albumbrowse)
+
+        browser.load_async(10)
+
+        load_mock.assert_called_with(self.session, browser, timeout=10, loop=None)
+
     def test_error(self, lib_mock):
         lib_mock.sp_albumbrowse_error.return_value = int(
             spotify.ErrorType.OTHER_PERMANENT
@@ -132,6 +132,15 @@ class ArtistTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, artist, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_artist = spotify.ffi.cast("sp_artist *", 42)
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+
+        artist.load_async(10)
+
+        load_mock.assert_called_with(self.session, artist, timeout=10, loop=None)
+
     @mock.patch("spotify.Image", spec=spotify.Image)
     def test_portrait(self, image_mock, lib_mock):
         sp_artist = spotify.ffi.cast("sp_artist *", 42)
@@ -267,6 +276,21 @@ class ArtistBrowserTest(unittest.TestCase):
         artistbrowse_complete_cb(sp_artistbrowse, userdata)
         self.assertTrue(result.loaded_event.is_set())
 
+    def test_browse_complete_callback_completes_future(self, lib_mock):
+        lib_mock.sp_artistbrowse_error.return_value = int(spotify.ErrorType.OK)
+        sp_artist = spotify.ffi.cast("sp_artist *", 43)
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        sp_artistbrowse = spotify.ffi.cast("sp_artistbrowse *", 42)
+        lib_mock.sp_artistbrowse_create.return_value = sp_artistbrowse
+
+        result = artist.browse()
+        self.assertFalse(result.future.done())
+        artistbrowse_complete_cb = lib_mock.sp_artistbrowse_create.call_args[0][3]
+        userdata = lib_mock.sp_artistbrowse_create.call_args[0][4]
+        artistbrowse_complete_cb(sp_artistbrowse, userdata)
+
+        self.assertEqual(result.future.result(timeout=0), result)
+
     def test_create_from_artist_with_type_and_callback(self, lib_mock):
         sp_artist = spotify.ffi.cast("sp_artist *", 43)
         artist = spotify.Artist(self.session, sp_artist=sp_artist)
@@ -292,6 +316,29 @@ class ArtistBrowserTest(unittest.TestCase):
         result.loaded_event.wait(3)
         callback.assert_called_with(result)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_browse_async(self, load_async_mock, lib_mock):
+        sp_artist = spotify.ffi.cast("sp_artist *", 43)
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        sp_artistbrowse = spotify.ffi.cast("sp_artistbrowse *", 42)
+        lib_mock.sp_artistbrowse_create.return_value = sp_artistbrowse
+
+        result = artist.browse_async(
+            type=spotify.ArtistBrowserType.NO_TRACKS, timeout=10
+        )
+
+        lib_mock.sp_artistbrowse_create.assert_called_with(
+            self.session._sp_session,
+            sp_artist,
+            int(spotify.ArtistBrowserType.NO_TRACKS),
+            mock.ANY,
+            mock.ANY,
+        )
+        self.assertEqual(result, load_async_mock.return_value)
+        browser = load_async_mock.call_args[0][1]
+        self.assertIsInstance(browser, spotify.ArtistBrowser)
+        load_async_mock.assert_called_with(self.session, browser, timeout=10, loop=None)
+
     def test_browser_is_gone_before_callback_is_called(self, lib_mock):
         sp_artist = spotify.ffi.cast("sp_artist *", 43)
         artist = spotify.Artist(self.session, sp_artist=sp_artist)
@@ -394,6 +441,15 @@ class ArtistBrowserTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, browser, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_artistbrowse = spotify.ffi.cast("sp_artistbrowse *", 42)
+        browser = spotify.ArtistBrowser(self.session, sp_artistbrowse=sp_artistbrowse)
+
+        browser.load_async(10)
+
+        load_mock.assert_called_with(self.session, browser, timeout=10, loop=None)
+
     def test_error(self, lib_mock):
         lib_mock.sp_artistbrowse_error.return_value = int(
             spotify.ErrorType.OTHER_PERMANENT
@@ -3,6 +3,95 @@ from __future__ import unicode_literals
 import unittest
 
 import spotify
+from spotify import compat
+
+
+class AudioBufferPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = spotify.AudioBufferPool(max_free=2)
+
+    def test_acquire_allocates_buffer_of_given_size(self):
+        buf = self.pool.acquire(8)
+
+        self.assertIsInstance(buf, memoryview)
+        self.assertEqual(len(buf), 8)
+        self.assertFalse(buf.readonly)
+        self.assertEqual(self.pool.allocated, 1)
+        self.assertEqual(self.pool.reused, 0)
+
+    @unittest.skipIf(compat.PY2, "buffers aren't reused on Python 2")
+    def test_released_buffer_is_reused(self):
+        buf1 = self.pool.acquire(8)
+        self.pool.release(buf1)
+        self.assertEqual(self.pool.num_free(), 1)
+
+        buf2 = self.pool.acquire(8)
+
+        self.assertIs(buf2.obj, buf1.obj)
+        self.assertEqual(self.pool.allocated, 1)
+        self.assertEqual(self.pool.reused, 1)
+        self.assertEqual(self.pool.num_free(), 0)
+
+    @unittest.skipIf(compat.PY2, "buffers aren't reused on Python 2")
+    def test_released_buffer_is_reused_for_other_sizes_in_size_class(self):
+        size = self.pool.min_capacity * 4
+        buf1 = self.pool.acquire(size)
+        self.pool.release(buf1)
+
+        buf2 = self.pool.acquire(size - 12)
+
+        self.assertIs(buf2.obj, buf1.obj)
+        self.assertEqual(len(buf2), size - 12)
+        self.assertEqual(self.pool.allocated, 1)
+
+    @unittest.skipIf(compat.PY2, "buffers aren't reused on Python 2")
+    def test_released_buffer_is_not_reused_for_other_size_classes(self):
+        size = self.pool.min_capacity * 4
+        buf1 = self.pool.acquire(size)
+        self.pool.release(buf1)
+
+        buf2 = self.pool.acquire(size + 1)
+
+        self.assertIsNot(buf2.obj, buf1.obj)
+        self.assertEqual(len(buf2), size + 1)
+        self.assertEqual(self.pool.allocated, 2)
+
+    @unittest.skipIf(compat.PY2, "buffers aren't reused on Python 2")
+    def test_keeps_at_most_max_free_buffers_in_total(self):
+        buffers = [self.pool.acquire(8), self.pool.acquire(8)]
+        buffers.append(self.pool.acquire(self.pool.min_capacity * 2))
+        for buf in buffers:
+            self.pool.release(buf)
+
+        self.assertEqual(self.pool.num_free(), 2)
+
+    @unittest.skipIf(compat.PY2, "buffers aren't reused on Python 2")
+    def test_buffer_released_twice_is_only_reused_once(self):
+        buf = self.pool.acquire(8192)
+        self.pool.release(buf)
+        self.pool.release(buf)
+
+        self.assertEqual(self.pool.num_free(), 1)
+        buf1 = self.pool.acquire(8192)
+        buf2 = self.pool.acquire(8192)
+        self.assertIsNot(buf1.obj, buf2.obj)
+
+    def test_release_ignores_buffers_not_from_a_pool(self):
+        self.pool.release(bytearray(8))
+        self.pool.release(memoryview(bytearray(4096)))
+        self.pool.release(b"abc")
+
+        self.assertEqual(self.pool.num_free(), 0)
+
+    def test_acquire_frames(self):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+        sp_audioformat.channels = 2
+        audio_format = spotify.AudioFormat(sp_audioformat)
+
+        buf = self.pool.acquire_frames(audio_format, 10)
+
+        self.assertEqual(len(buf), 40)
 
 
 class AudioBufferStatsTest(unittest.TestCase):
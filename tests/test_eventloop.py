@@ -1,16 +1,13 @@
 from __future__ import unicode_literals
 
+import os
+import select
+import threading
 import time
 import unittest
 
-try:
-    # Python 3
-    import queue
-except ImportError:
-    # Python 2
-    import Queue as queue
-
 import spotify
+from spotify import compat
 from tests import mock
 
 
@@ -50,6 +47,19 @@ class EventLoopTest(unittest.TestCase):
             self.loop._on_notify_main_thread,
         )
 
+    def test_start_tells_loaders_that_an_event_loop_is_running(self):
+        self.loop.start()
+
+        self.assertEqual(
+            self.session._change_notifier.event_loop_thread, self.loop.ident
+        )
+
+    def test_stop_tells_loaders_that_no_event_loop_is_running(self):
+        self.loop.start()
+        self.loop.stop()
+
+        self.assertIsNone(self.session._change_notifier.event_loop_thread)
+
     def test_stop_unregisters_notify_main_thread_listener(self):
         self.loop.stop()
 
@@ -65,25 +75,295 @@ class EventLoopTest(unittest.TestCase):
         self.session.process_events.assert_called_once_with()
 
     def test_processes_events_if_no_notify_main_thread_before_timeout(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
-        self.loop._queue.get = lambda timeout: time.sleep(timeout)
+        self.session.process_events.return_value = 50
         self.loop.start()
 
         time.sleep(0.25)
         self.loop.stop()
         self.assertGreaterEqual(self.session.process_events.call_count, 3)
+        self.assertEqual(self.loop.notifications, 0)
+
+    def test_stop_wakes_up_the_event_loop_without_processing_events(self):
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
+
+        self.loop.stop()
+        self.loop.join(1)
+
+        self.assertFalse(self.loop.is_alive())
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+    def test_processes_events_on_notify_main_thread(self):
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
+
+        self.loop._on_notify_main_thread(self.session)
+        time.sleep(0.05)
+
+        self.loop.stop()
+        self.assertEqual(self.session.process_events.call_count, 2)
+        self.assertEqual(self.loop.notifications, 1)
+        self.assertEqual(self.loop.passes, 2)
+
+    def test_records_metrics_when_enabled(self):
+        spotify.stats.enable_event_loop_metrics(self.loop)
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
+
+        self.loop._on_notify_main_thread(self.session)
+        time.sleep(0.05)
+
+        self.loop.stop()
+        metrics = spotify.stats.event_loop(self.loop)
+        self.assertEqual(metrics.notify_wakeups, 1)
+        self.assertEqual(metrics.timeout_wakeups, 1)
+        self.assertEqual(metrics.notify_latency.count, 1)
+        self.assertEqual(metrics.process_events.count, 2)
+        self.assertEqual(metrics.requested_timeout.max, 10)
+
+    def test_records_timeout_wakeups(self):
+        spotify.stats.enable_event_loop_metrics(self.loop)
+        self.session.process_events.return_value = 10
+        self.loop.start()
+        time.sleep(0.1)
+
+        self.loop.stop()
+        metrics = spotify.stats.event_loop(self.loop)
+        self.assertGreaterEqual(metrics.timeout_wakeups, 3)
+        self.assertEqual(metrics.notify_wakeups, 0)
+        self.assertEqual(metrics.notify_latency.count, 0)
+
+    def test_on_notify_main_thread_sets_pending_flag(self):
+        self.loop._on_notify_main_thread(self.session)
+
+        self.assertTrue(self.loop._pending)
+        self.assertEqual(self.loop.notifications, 1)
+
+    def test_coalesces_notifications_into_one_pass(self):
+        for _ in range(1000):
+            self.loop._on_notify_main_thread(self.session)
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
+
+        self.loop.stop()
+        # One pass when the loop starts, and one for all the notifications
+        self.assertEqual(self.session.process_events.call_count, 2)
+        self.assertEqual(self.loop.notifications, 1000)
+        self.assertEqual(self.loop.passes, 2)
+
+
+@unittest.skipIf(compat.PY2, "requires asyncio")
+class AsyncioEventLoopTest(unittest.TestCase):
+    def setUp(self):
+        import asyncio
+
+        self.timeout = 0.1
+        self.session = mock.Mock(spec=spotify.Session)
+        self.session.process_events.return_value = int(self.timeout * 1000)
+        self.asyncio_loop = asyncio.new_event_loop()
+        self.loop = spotify.AsyncioEventLoop(self.session, loop=self.asyncio_loop)
+
+    def tearDown(self):
+        self.loop.stop()
+        self.asyncio_loop.close()
+
+    def run_loop(self, duration):
+        self.asyncio_loop.call_later(duration, self.asyncio_loop.stop)
+        self.asyncio_loop.run_forever()
+
+    def test_start_registers_notify_main_thread_listener(self):
+        self.loop.start()
+
+        self.session.on.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.loop._on_notify_main_thread,
+        )
+
+    def test_start_tells_loaders_that_an_event_loop_is_running(self):
+        self.loop.start()
+
+        self.assertEqual(
+            self.session._change_notifier.event_loop_thread,
+            threading.current_thread().ident,
+        )
+
+    def test_event_loop_thread_is_the_thread_processing_events(self):
+        self.loop.start()
+        thread = threading.Thread(target=self.run_loop, args=(0.01,))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(self.session._change_notifier.event_loop_thread, thread.ident)
+
+    def test_stop_tells_loaders_that_no_event_loop_is_running(self):
+        self.loop.start()
+        self.loop.stop()
+
+        self.assertIsNone(self.session._change_notifier.event_loop_thread)
+
+    def test_stop_unregisters_notify_main_thread_listener(self):
+        self.loop.stop()
+
+        self.session.off.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.loop._on_notify_main_thread,
+        )
+
+    def test_processes_events_when_started(self):
+        self.loop.start()
+
+        self.run_loop(0.01)
+
+        self.session.process_events.assert_called_once_with()
+
+    def test_processes_events_again_when_timeout_is_reached(self):
+        self.session.process_events.return_value = 10
+        self.loop.start()
+
+        self.run_loop(0.25)
+
+        self.assertGreaterEqual(self.session.process_events.call_count, 3)
+
+    def test_processes_events_on_notify_main_thread(self):
+        self.loop.start()
+        self.run_loop(0.01)
+
+        self.loop._on_notify_main_thread(self.session)
+        self.run_loop(0.01)
+
+        self.assertEqual(self.session.process_events.call_count, 2)
+
+    def test_coalesces_notifications_before_events_are_processed(self):
+        self.loop.start()
+        self.run_loop(0.01)
+
+        for _ in range(10):
+            self.loop._on_notify_main_thread(self.session)
+        self.run_loop(0.01)
 
-    def test_puts_on_queue_on_notify_main_thread(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
+        self.assertEqual(self.session.process_events.call_count, 2)
+
+    def test_does_not_process_events_after_stop(self):
+        self.loop.start()
+        self.run_loop(0.01)
+
+        self.loop.stop()
+        self.run_loop(0.15)
+
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+    def test_on_notify_main_thread_fails_nicely_if_loop_is_closed(self):
+        self.loop.start()
+        self.run_loop(0.01)
+        self.asyncio_loop.close()
 
         self.loop._on_notify_main_thread(self.session)
 
-        self.loop._queue.put_nowait.assert_called_once_with(mock.ANY)
+        self.assertFalse(self.loop._scheduled)
+
+
+@unittest.skipIf(os.name != "posix", "requires a Unix-like system")
+class PollableEventLoopTest(unittest.TestCase):
+    def setUp(self):
+        self.session = mock.Mock(spec=spotify.Session)
+        self.session.process_events.return_value = 100
+        self.loop = spotify.PollableEventLoop(self.session)
+
+    def tearDown(self):
+        self.loop.stop()
+
+    def is_readable(self):
+        return bool(select.select([self.loop], [], [], 0)[0])
+
+    def test_start_registers_notify_main_thread_listener(self):
+        self.loop.start()
+
+        self.session.on.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.loop._on_notify_main_thread,
+        )
+
+    def test_start_tells_loaders_that_an_event_loop_is_running(self):
+        self.loop.start()
+
+        self.assertEqual(
+            self.session._change_notifier.event_loop_thread,
+            threading.current_thread().ident,
+        )
+
+    def test_event_loop_thread_is_the_thread_processing_events(self):
+        self.loop.start()
+        thread = threading.Thread(target=self.loop.process_events)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(self.session._change_notifier.event_loop_thread, thread.ident)
+
+    def test_stop_unregisters_listener_and_closes_fd(self):
+        self.loop.start()
+
+        self.loop.stop()
+
+        self.session.off.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.loop._on_notify_main_thread,
+        )
+        self.assertIsNone(self.session._change_notifier.event_loop_thread)
+        self.assertIsNone(self.loop.fileno())
+
+    def test_fd_is_readable_after_start(self):
+        self.loop.start()
+
+        self.assertTrue(self.is_readable())
+        self.assertEqual(self.loop.timeout, 0)
+
+    def test_process_events_clears_readability_and_sets_timeout(self):
+        self.loop.start()
+
+        result = self.loop.process_events()
 
-    def test_on_notify_main_thread_fails_nicely_if_queue_is_full(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
-        self.loop._queue.put_nowait.side_effect = queue.Full
+        self.assertEqual(result, 0.1)
+        self.assertFalse(self.is_readable())
+        self.assertGreater(self.loop.timeout, 0)
+        self.assertLessEqual(self.loop.timeout, 0.1)
+        self.session.process_events.assert_called_once_with()
+        self.assertEqual(self.loop.passes, 1)
+
+    def test_fd_is_readable_after_notify_main_thread(self):
+        self.loop.start()
+        self.loop.process_events()
 
         self.loop._on_notify_main_thread(self.session)
 
-        self.loop._queue.put_nowait.assert_called_once_with(mock.ANY)
+        self.assertTrue(self.is_readable())
+        self.assertEqual(self.loop.notifications, 1)
+
+    def test_notifications_are_coalesced(self):
+        self.loop.start()
+        self.loop.process_events()
+
+        for _ in range(1000):
+            self.loop._on_notify_main_thread(self.session)
+        self.loop.process_events()
+
+        self.assertFalse(self.is_readable())
+        self.assertEqual(self.loop.notifications, 1000)
+        self.assertEqual(self.loop.passes, 2)
+
+    @mock.patch(
+        "spotify.eventloop._create_wakeup_fds", spotify.eventloop._create_pipe
+    )
+    def test_can_use_a_pipe_instead_of_an_eventfd(self):
+        self.loop.start()
+        self.assertTrue(self.is_readable())
+
+        self.loop.process_events()
+        self.assertFalse(self.is_readable())
+
+        self.loop._on_notify_main_thread(self.session)
+        self.assertTrue(self.is_readable())
+        self.assertNotEqual(self.loop._read_fd, self.loop._write_fd)
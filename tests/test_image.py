@@ -136,6 +136,19 @@ class ImageTest(unittest.TestCase):
         )
         self.assertTrue(image.loaded_event.is_set())
 
+    def test_load_callback_completes_future(self, lib_mock):
+        lib_mock.sp_image_add_load_callback.return_value = int(spotify.ErrorType.OK)
+        lib_mock.sp_image_error.return_value = int(spotify.ErrorType.OK)
+        sp_image = spotify.ffi.cast("sp_image *", 42)
+
+        image = spotify.Image(self.session, sp_image=sp_image)
+        self.assertFalse(image.future.done())
+        image_load_cb = lib_mock.sp_image_add_load_callback.call_args[0][1]
+        callback_handle = lib_mock.sp_image_add_load_callback.call_args[0][2]
+        image_load_cb(sp_image, callback_handle)
+
+        self.assertEqual(image.future.result(timeout=0), image)
+
     def test_create_with_callback_and_throw_away_image_and_call_load_callback(
         self, lib_mock
     ):
@@ -209,6 +222,16 @@ class ImageTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, image, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        lib_mock.sp_image_add_load_callback.return_value = int(spotify.ErrorType.OK)
+        sp_image = spotify.ffi.cast("sp_image *", 42)
+        image = spotify.Image(self.session, sp_image=sp_image)
+
+        image.load_async(10)
+
+        load_mock.assert_called_with(self.session, image, timeout=10, loop=None)
+
     def test_format(self, lib_mock):
         lib_mock.sp_image_is_loaded.return_value = 1
         lib_mock.sp_image_format.return_value = int(spotify.ImageFormat.JPEG)
@@ -0,0 +1,76 @@
+from __future__ import unicode_literals
+
+import importlib
+import subprocess
+import sys
+import unittest
+
+import spotify
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_lazy_names_match_the_submodules_all(self):
+        for module_name, names in spotify._submodule_names.items():
+            if module_name == "stats":
+                continue  # Only available as spotify.stats.*
+            module = importlib.import_module("spotify.%s" % module_name)
+            self.assertEqual(
+                sorted(getattr(module, "__all__", [])), sorted(names), module_name
+            )
+
+    def test_lazy_names_are_the_submodule_objects(self):
+        from spotify import error
+
+        self.assertIs(spotify.ErrorType, error.ErrorType)
+
+    def test_submodules_are_available_as_attributes(self):
+        self.assertIs(spotify.offline, importlib.import_module("spotify.offline"))
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            spotify.NoSuchThing
+
+    def test_all_lists_the_public_names(self):
+        self.assertIn("Session", spotify.__all__)
+        self.assertIn("batch", spotify.__all__)
+        self.assertIn("stats", spotify.__all__)
+
+    def test_version(self):
+        self.assertEqual(spotify.__version__, spotify._get_version())
+
+    @unittest.skipIf(sys.version_info < (3, 7), "requires module __getattr__")
+    def test_import_only_loads_the_submodules_that_are_used(self):
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, spotify; spotify.ErrorType; spotify.__version__; "
+                "print(' '.join(sorted(sys.modules)))",
+            ]
+        )
+        modules = output.decode("ascii").split()
+
+        self.assertIn("spotify.error", modules)
+        self.assertNotIn("spotify.session", modules)
+        self.assertNotIn("spotify.track", modules)
+        self.assertNotIn("pkg_resources", modules)
+
+
+class SerializedLibTest(unittest.TestCase):
+    def test_wraps_lib_functions_on_first_access(self):
+        lib = spotify._SerializedLib(spotify._spotify.lib)
+        self.assertNotIn("sp_build_id", vars(lib))
+
+        func = lib.sp_build_id
+
+        self.assertIs(func.__wrapped__, spotify._spotify.lib.sp_build_id)
+        self.assertIs(vars(lib)["sp_build_id"], func)
+
+    def test_passes_constants_through(self):
+        lib = spotify._SerializedLib(spotify._spotify.lib)
+
+        self.assertEqual(lib.SP_ERROR_OK, spotify._spotify.lib.SP_ERROR_OK)
+
+    def test_dir_lists_the_full_api(self):
+        self.assertIn("sp_track_name", dir(spotify.lib))
+        self.assertIn("SP_ERROR_OK", dir(spotify.lib))
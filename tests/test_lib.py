@@ -1,8 +1,10 @@
 from __future__ import unicode_literals
 
+import threading
 import unittest
 
 import spotify
+from tests import mock
 
 
 class LibTest(unittest.TestCase):
@@ -13,3 +15,77 @@ class LibTest(unittest.TestCase):
 
     def test_SPOTIFY_API_VERSION_macro(self):
         self.assertEqual(spotify.lib.SPOTIFY_API_VERSION, 12)
+
+
+class BatchTest(unittest.TestCase):
+    def lock_is_free_for_other_threads(self):
+        result = []
+
+        def try_lock():
+            acquired = spotify._lock.acquire(False)
+            if acquired:
+                spotify._lock.release()
+            result.append(acquired)
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def test_holds_lock_for_the_duration_of_the_block(self):
+        self.assertTrue(self.lock_is_free_for_other_threads())
+
+        with spotify.batch():
+            self.assertFalse(self.lock_is_free_for_other_threads())
+
+        self.assertTrue(self.lock_is_free_for_other_threads())
+
+    def test_serialized_functions_skip_locking_inside_batch(self):
+        lock_mock = mock.MagicMock()
+        func = spotify.serialized(lambda: 42)
+
+        with spotify.batch():
+            with mock.patch("spotify._lock", lock_mock):
+                result = func()
+
+        self.assertEqual(result, 42)
+        self.assertEqual(lock_mock.__enter__.call_count, 0)
+
+    def test_serialized_functions_lock_outside_batch(self):
+        lock_mock = mock.MagicMock()
+        func = spotify.serialized(lambda: 42)
+
+        with mock.patch("spotify._lock", lock_mock):
+            result = func()
+
+        self.assertEqual(result, 42)
+        self.assertEqual(lock_mock.__enter__.call_count, 1)
+
+    def test_batches_can_be_nested(self):
+        with spotify.batch():
+            with spotify.batch():
+                self.assertEqual(spotify._batch_state.depth, 2)
+            self.assertEqual(spotify._batch_state.depth, 1)
+        self.assertEqual(spotify._batch_state.depth, 0)
+
+    def test_releases_lock_on_exception(self):
+        with self.assertRaises(ValueError):
+            with spotify.batch():
+                raise ValueError
+
+        self.assertEqual(spotify._batch_state.depth, 0)
+        self.assertTrue(self.lock_is_free_for_other_threads())
+
+    def test_batch_state_is_per_thread(self):
+        depths = []
+
+        def get_depth():
+            depths.append(spotify._batch_state.depth)
+
+        with spotify.batch():
+            thread = threading.Thread(target=get_depth)
+            thread.start()
+            # The other thread doesn't need the lock to read its own depth.
+            thread.join()
+
+        self.assertEqual(depths, [0])
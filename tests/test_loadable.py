@@ -1,10 +1,12 @@
 from __future__ import unicode_literals
 
+import threading
 import time
 import unittest
 
 import spotify
 import tests
+from spotify import compat
 from spotify.utils import load
 from tests import mock
 
@@ -33,6 +35,14 @@ class LoadableTest(unittest.TestCase):
     def setUp(self):
         self.session = tests.create_session_mock()
         self.session.connection.state = spotify.ConnectionState.LOGGED_IN
+        self.session.process_events.return_value = 100
+        self.notifier = mock.Mock(spec=spotify.utils.ChangeNotifier)
+        self.notifier.generation = 0
+        self.notifier.should_process_events.return_value = True
+        self.notifier.process_events.side_effect = (
+            lambda session: session.process_events() / 1000.0
+        )
+        self.session._change_notifier = self.notifier
 
     def test_load_raises_error_if_not_logged_in(self, is_loaded_mock, time_mock):
         is_loaded_mock.return_value = False
@@ -71,14 +81,50 @@ class LoadableTest(unittest.TestCase):
             foo.load(timeout=0)
 
     def test_load_processes_events_until_loaded(self, is_loaded_mock, time_mock):
-        is_loaded_mock.side_effect = [False, False, False, False, False, True]
+        is_loaded_mock.side_effect = [False, False, False, True]
         time_mock.time.side_effect = time.time
 
         foo = Foo(self.session)
         foo.load()
 
-        self.assertEqual(self.session.process_events.call_count, 2)
-        self.assertEqual(time_mock.sleep.call_count, 2)
+        self.assertEqual(self.session.process_events.call_count, 3)
+        self.assertEqual(self.notifier.wait.call_count, 2)
+
+    def test_load_waits_for_notification_or_process_events_timeout(
+        self, is_loaded_mock, time_mock
+    ):
+        is_loaded_mock.side_effect = [False, False, True]
+        time_mock.time.side_effect = time.time
+        self.notifier.generation = 7
+
+        foo = Foo(self.session)
+        foo.load()
+
+        self.notifier.wait.assert_called_once_with(7, 0.1)
+
+    def test_load_waits_at_most_until_deadline(self, is_loaded_mock, time_mock):
+        is_loaded_mock.side_effect = [False, False, True]
+        time_mock.time.side_effect = [100, 100.5]
+        self.session.process_events.return_value = 60000
+
+        foo = Foo(self.session)
+        foo.load(timeout=0.75)
+
+        self.notifier.wait.assert_called_once_with(0, 0.25)
+
+    def test_load_leaves_event_processing_to_running_event_loop(
+        self, is_loaded_mock, time_mock
+    ):
+        is_loaded_mock.side_effect = [False, False, False, True]
+        time_mock.time.side_effect = time.time
+        self.notifier.should_process_events.return_value = False
+
+        foo = Foo(self.session)
+        foo.load()
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+        self.notifier.wait.assert_called_with(0, spotify.utils._LOAD_RECHECK_INTERVAL)
+        self.assertEqual(self.notifier.wait.call_count, 2)
 
     @mock.patch.object(FooWithError, "error", new_callable=mock.PropertyMock)
     def test_load_raises_exception_on_error(
@@ -96,7 +142,7 @@ class LoadableTest(unittest.TestCase):
             foo.load()
 
         self.assertEqual(self.session.process_events.call_count, 1)
-        self.assertEqual(time_mock.sleep.call_count, 0)
+        self.assertEqual(self.notifier.wait.call_count, 0)
 
     def test_load_raises_exception_on_error_even_if_already_loaded(
         self, is_loaded_mock, time_mock
@@ -110,15 +156,15 @@ class LoadableTest(unittest.TestCase):
             foo.load()
 
     def test_load_does_not_abort_on_is_loading_error(self, is_loaded_mock, time_mock):
-        is_loaded_mock.side_effect = [False, False, False, False, False, True]
+        is_loaded_mock.side_effect = [False, False, False, True]
         time_mock.time.side_effect = time.time
 
         foo = Foo(self.session)
         foo.error = spotify.ErrorType.IS_LOADING
         foo.load()
 
-        self.assertEqual(self.session.process_events.call_count, 2)
-        self.assertEqual(time_mock.sleep.call_count, 2)
+        self.assertEqual(self.session.process_events.call_count, 3)
+        self.assertEqual(self.notifier.wait.call_count, 2)
 
     def test_load_returns_self(self, is_loaded_mock, time_mock):
         is_loaded_mock.return_value = True
@@ -127,3 +173,461 @@ class LoadableTest(unittest.TestCase):
         result = foo.load()
 
         self.assertEqual(result, foo)
+
+
+class ChangeNotifierTest(unittest.TestCase):
+    def setUp(self):
+        self.notifier = spotify.utils.ChangeNotifier()
+
+    def test_notify_increases_generation(self):
+        self.notifier.notify()
+        self.notifier.notify()
+
+        self.assertEqual(self.notifier.generation, 2)
+
+    def test_wait_returns_immediately_if_notified_since_generation(self):
+        generation = self.notifier.generation
+        self.notifier.notify()
+
+        started = time.time()
+        self.notifier.wait(generation, 10)
+
+        self.assertLess(time.time() - started, 1)
+
+    def test_wait_times_out_without_notification(self):
+        started = time.time()
+        self.notifier.wait(self.notifier.generation, 0.01)
+
+        self.assertGreaterEqual(time.time() - started, 0.005)
+
+    def test_wait_is_woken_by_notify_from_another_thread(self):
+        generation = self.notifier.generation
+        timer = threading.Timer(0.01, self.notifier.notify)
+        timer.start()
+
+        started = time.time()
+        self.notifier.wait(generation, 10)
+        timer.join()
+
+        self.assertLess(time.time() - started, 5)
+        self.assertEqual(self.notifier.generation, generation + 1)
+
+    def test_notify_calls_listeners(self):
+        listener = mock.Mock()
+        self.notifier.add_listener(listener)
+
+        self.notifier.notify()
+
+        listener.assert_called_once_with()
+
+    def test_failing_listener_does_not_stop_other_listeners(self):
+        failing_listener = mock.Mock(side_effect=RuntimeError("oops"))
+        listener = mock.Mock()
+        self.notifier.add_listener(failing_listener)
+        self.notifier.add_listener(listener)
+
+        with mock.patch("spotify.utils.logger") as logger_mock:
+            self.notifier.notify()
+
+        listener.assert_called_once_with()
+        self.assertEqual(logger_mock.exception.call_count, 1)
+
+    def test_removed_listener_is_not_called(self):
+        listener = mock.Mock()
+        self.notifier.add_listener(listener)
+        self.notifier.remove_listener(listener)
+
+        self.notifier.notify()
+
+        self.assertEqual(listener.call_count, 0)
+
+    def test_notify_main_thread_notifies_if_no_event_loop_is_running(self):
+        self.notifier.notify_main_thread()
+
+        self.assertEqual(self.notifier.generation, 1)
+
+    def test_notify_main_thread_is_ignored_if_event_loop_is_running(self):
+        self.notifier.event_loop_thread = -1
+
+        self.notifier.notify_main_thread()
+
+        self.assertEqual(self.notifier.generation, 0)
+
+    def test_process_events_is_skipped_until_timeout_or_notification(self):
+        session = mock.Mock()
+        session.process_events.return_value = 10000
+
+        self.assertEqual(self.notifier.process_events(session), 10)
+        self.assertGreater(self.notifier.process_events(session), 9)
+        self.assertEqual(session.process_events.call_count, 1)
+
+        self.notifier.notify_main_thread()
+
+        self.assertEqual(self.notifier.process_events(session), 10)
+        self.assertEqual(session.process_events.call_count, 2)
+
+    def test_process_events_is_skipped_while_another_thread_processes(self):
+        session = mock.Mock()
+        self.notifier._processing.acquire()
+        self.addCleanup(self.notifier._processing.release)
+
+        self.assertEqual(
+            self.notifier.process_events(session),
+            spotify.utils._LOAD_RECHECK_INTERVAL,
+        )
+        self.assertEqual(session.process_events.call_count, 0)
+
+    def test_only_one_waiting_thread_processes_events_on_notification(self):
+        session = tests.create_session_mock()
+        session.connection.state = spotify.ConnectionState.LOGGED_IN
+        session.process_events.return_value = 10000
+        self.notifier = session._change_notifier
+        objs = [mock.Mock(spec=["is_loaded"], is_loaded=False) for _ in range(20)]
+        threads = [
+            threading.Thread(target=load, args=(session, obj, 10)) for obj in objs
+        ]
+        for thread in threads:
+            thread.start()
+
+        self.notifier.notify_main_thread()
+        time.sleep(0.05)
+        for obj in objs:
+            obj.is_loaded = True
+        self.notifier.notify()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(session.process_events.call_count, 2)
+
+    def test_should_process_events_if_no_event_loop_is_running(self):
+        self.assertFalse(self.notifier.event_loop_running)
+        self.assertTrue(self.notifier.should_process_events())
+
+    def test_should_not_process_events_if_event_loop_runs_elsewhere(self):
+        self.notifier.event_loop_thread = -1
+
+        self.assertTrue(self.notifier.event_loop_running)
+        self.assertFalse(self.notifier.should_process_events())
+
+    def test_should_process_events_on_the_event_loop_thread(self):
+        self.notifier.event_loop_thread = threading.current_thread().ident
+
+        self.assertTrue(self.notifier.event_loop_running)
+        self.assertTrue(self.notifier.should_process_events())
+
+    def test_notify_main_thread_wakes_up_event_loop_thread_waiting(self):
+        self.notifier.event_loop_thread = threading.current_thread().ident
+        generation = self.notifier.generation
+        timer = threading.Timer(0.01, self.notifier.notify_main_thread)
+        timer.start()
+
+        started = time.time()
+        self.notifier.wait(generation, 10)
+        timer.join()
+
+        self.assertLess(time.time() - started, 5)
+        self.assertEqual(self.notifier.generation, generation + 1)
+
+
+class LoadOnEventLoopThreadTest(unittest.TestCase):
+    def setUp(self):
+        self.session = tests.create_session_mock()
+        self.session.connection.state = spotify.ConnectionState.LOGGED_IN
+        self.notifier = self.session._change_notifier
+        self.notifier.event_loop_thread = threading.current_thread().ident
+
+    def test_load_processes_events_on_the_event_loop_thread(self):
+        foo = mock.Mock(spec=["is_loaded"])
+        foo.is_loaded = False
+
+        def process_events():
+            foo.is_loaded = True
+            return 100
+
+        self.session.process_events.side_effect = process_events
+
+        started = time.time()
+        result = load(self.session, foo, timeout=2)
+
+        self.assertIs(result, foo)
+        self.assertLess(time.time() - started, 1)
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+
+class LoadAllTest(unittest.TestCase):
+    def setUp(self):
+        self.session = tests.create_session_mock()
+        self.session.connection.state = spotify.ConnectionState.LOGGED_IN
+        self.session.process_events.return_value = 100
+        self.notifier = mock.Mock(spec=spotify.utils.ChangeNotifier)
+        self.notifier.generation = 0
+        self.notifier.should_process_events.return_value = True
+        self.notifier.process_events.side_effect = (
+            lambda session: session.process_events() / 1000.0
+        )
+        self.session._change_notifier = self.notifier
+
+    def create_loadable(self, is_loaded=True, error=None):
+        obj = mock.Mock(spec=["_session", "is_loaded", "error"])
+        obj._session = self.session
+        obj.is_loaded = is_loaded
+        obj.error = spotify.ErrorType.OK if error is None else error
+        return obj
+
+    def test_load_all_returns_empty_result_for_no_objects(self):
+        result = spotify.load_all([])
+
+        self.assertEqual(result, spotify.LoadAllResult(set(), set(), set()))
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_load_all_returns_immediately_if_already_loaded(self):
+        self.session.connection.state = spotify.ConnectionState.OFFLINE
+        foo = self.create_loadable()
+        bar = self.create_loadable()
+
+        result = spotify.load_all([foo, bar])
+
+        self.assertEqual(result.loaded, {foo, bar})
+        self.assertEqual(result.failed, set())
+        self.assertEqual(result.timed_out, set())
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_load_all_raises_error_if_not_logged_in(self):
+        self.session.connection.state = spotify.ConnectionState.LOGGED_OUT
+        foo = self.create_loadable(is_loaded=False)
+
+        with self.assertRaises(spotify.Error):
+            spotify.load_all([foo])
+
+    @mock.patch("spotify.utils.time")
+    def test_load_all_waits_until_all_are_loaded(self, time_mock):
+        time_mock.time.return_value = 0
+        foo = self.create_loadable(is_loaded=False)
+        bar = self.create_loadable(is_loaded=False)
+
+        def process_events():
+            if foo.is_loaded:
+                bar.is_loaded = True
+            foo.is_loaded = True
+            return 100
+
+        self.session.process_events.side_effect = process_events
+
+        result = spotify.load_all([foo, bar])
+
+        self.assertEqual(result.loaded, {foo, bar})
+        self.assertEqual(self.session.process_events.call_count, 2)
+        self.notifier.wait.assert_called_once_with(0, 0.1)
+
+    @mock.patch("spotify.utils.time")
+    def test_load_all_shares_one_deadline(self, time_mock):
+        time_mock.time.side_effect = [0, 3, 6, 9, 12]
+        foo = self.create_loadable()
+        bar = self.create_loadable(is_loaded=False)
+        baz = self.create_loadable(is_loaded=False)
+        self.session.process_events.return_value = 10000
+
+        result = spotify.load_all([foo, bar, baz], timeout=10)
+
+        self.assertEqual(result.loaded, {foo})
+        self.assertEqual(result.timed_out, {bar, baz})
+        self.assertEqual(
+            self.notifier.wait.call_args_list,
+            [mock.call(0, 1.0), mock.call(0, 1.0), mock.call(0, 1.0)],
+        )
+
+    def test_load_all_collects_failed_objects(self):
+        foo = self.create_loadable()
+        bar = self.create_loadable(
+            is_loaded=False, error=spotify.ErrorType.OTHER_PERMANENT
+        )
+
+        result = spotify.load_all([foo, bar])
+
+        self.assertEqual(result.loaded, {foo})
+        self.assertEqual(result.failed, {bar})
+
+    def test_load_all_does_not_fail_on_is_loading_error(self):
+        foo = self.create_loadable(is_loaded=False, error=spotify.ErrorType.IS_LOADING)
+
+        def process_events():
+            foo.is_loaded = True
+            foo.error = spotify.ErrorType.OK
+            return 100
+
+        self.session.process_events.side_effect = process_events
+
+        result = spotify.load_all([foo])
+
+        self.assertEqual(result.loaded, {foo})
+
+    def test_load_all_leaves_event_processing_to_running_event_loop(self):
+        self.notifier.should_process_events.return_value = False
+        foo = self.create_loadable(is_loaded=False)
+
+        def wait(generation, timeout):
+            foo.is_loaded = True
+
+        self.notifier.wait.side_effect = wait
+
+        result = spotify.load_all([foo])
+
+        self.assertEqual(result.loaded, {foo})
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    @mock.patch("spotify.utils.time")
+    def test_iter_load_all_yields_objects_as_they_are_done(self, time_mock):
+        time_mock.time.side_effect = [0, 1, 11]
+        foo = self.create_loadable(is_loaded=False)
+        bar = self.create_loadable(error=spotify.ErrorType.OTHER_PERMANENT)
+        baz = self.create_loadable(is_loaded=False)
+
+        def process_events():
+            foo.is_loaded = True
+            return 100
+
+        self.session.process_events.side_effect = process_events
+
+        result = list(spotify.iter_load_all([foo, bar, baz], timeout=10))
+
+        self.assertEqual([obj for obj, error in result], [bar, foo, baz])
+        self.assertIsInstance(result[0][1], spotify.LibError)
+        self.assertIsNone(result[1][1])
+        self.assertIsInstance(result[2][1], spotify.Timeout)
+
+
+@unittest.skipIf(compat.PY2, "requires asyncio")
+class LoadAsyncTest(unittest.TestCase):
+    def setUp(self):
+        import asyncio
+
+        self.loop = asyncio.new_event_loop()
+        self.session = tests.create_session_mock()
+        self.session.connection.state = spotify.ConnectionState.LOGGED_IN
+        self.session.process_events.return_value = 100
+        self.notifier = self.session._change_notifier
+        self.notifier.event_loop_thread = -1
+
+    def tearDown(self):
+        self.loop.close()
+
+    def create_loadable(self, is_loaded=True, error=None):
+        obj = mock.Mock(spec=["_session", "is_loaded", "error"])
+        obj._session = self.session
+        obj.is_loaded = is_loaded
+        obj.error = spotify.ErrorType.OK if error is None else error
+        return obj
+
+    def load(self, obj, timeout=None):
+        future = spotify.utils.load_async(
+            self.session, obj, timeout=timeout, loop=self.loop
+        )
+        return self.loop.run_until_complete(future)
+
+    def test_completes_immediately_if_already_loaded(self):
+        foo = self.create_loadable()
+
+        future = spotify.utils.load_async(self.session, foo, loop=self.loop)
+
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), foo)
+
+    def test_fails_on_error(self):
+        foo = self.create_loadable(error=spotify.ErrorType.OTHER_PERMANENT)
+
+        with self.assertRaises(spotify.LibError):
+            self.load(foo)
+
+    def test_fails_if_not_logged_in(self):
+        self.session.connection.state = spotify.ConnectionState.LOGGED_OUT
+        foo = self.create_loadable(is_loaded=False)
+
+        with self.assertRaises(spotify.Error):
+            self.load(foo)
+
+    def test_fails_when_timeout_is_reached(self):
+        foo = self.create_loadable(is_loaded=False)
+
+        with self.assertRaises(spotify.Timeout):
+            self.load(foo, timeout=0.01)
+
+    def test_completes_when_notified_from_another_thread(self):
+        foo = self.create_loadable(is_loaded=False)
+
+        def complete():
+            foo.is_loaded = True
+            self.notifier.notify()
+
+        timer = threading.Timer(0.01, complete)
+        timer.start()
+        result = self.load(foo)
+        timer.join()
+
+        self.assertEqual(result, foo)
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_loader_is_dropped_if_event_loop_is_closed(self):
+        foo = self.create_loadable(is_loaded=False)
+        spotify.utils.load_async(self.session, foo, loop=self.loop)
+        self.assertIn((self.session, self.loop), spotify.utils._async_loaders)
+        self.loop.close()
+
+        with mock.patch("spotify.utils.logger") as logger_mock:
+            self.notifier.notify()
+            self.notifier.notify()
+
+        self.assertEqual(logger_mock.warning.call_count, 1)
+        self.assertEqual(logger_mock.exception.call_count, 0)
+        self.assertEqual(self.notifier._listeners, ())
+        self.assertNotIn((self.session, self.loop), spotify.utils._async_loaders)
+
+    def test_processes_events_if_no_event_loop_is_running(self):
+        self.notifier.event_loop_thread = None
+        foo = self.create_loadable(is_loaded=False)
+
+        def process_events():
+            foo.is_loaded = True
+            return 100
+
+        self.session.process_events.side_effect = process_events
+
+        result = self.load(foo)
+
+        self.assertEqual(result, foo)
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+    def test_many_objects_are_checked_together(self):
+        foos = [self.create_loadable(is_loaded=False) for _ in range(3)]
+        futures = [
+            spotify.utils.load_async(self.session, foo, loop=self.loop) for foo in foos
+        ]
+
+        def complete():
+            for foo in foos:
+                foo.is_loaded = True
+            self.notifier.notify()
+
+        self.assertEqual(len(self.notifier._listeners), 1)
+        self.loop.call_soon(complete)
+        for future in futures:
+            self.loop.run_until_complete(future)
+
+        self.assertEqual([future.result() for future in futures], foos)
+
+    def test_stops_listening_when_all_objects_are_done(self):
+        foo = self.create_loadable(is_loaded=False)
+        self.loop.call_later(0.01, setattr, foo, "is_loaded", True)
+        self.loop.call_later(0.02, self.notifier.notify)
+
+        self.load(foo)
+        self.loop.run_until_complete(asyncio_sleep(self.loop, 0.01))
+
+        self.assertEqual(self.notifier._listeners, ())
+        self.assertEqual(spotify.utils._async_loaders, {})
+
+
+def asyncio_sleep(loop, delay):
+    future = loop.create_future()
+    loop.call_later(delay, future.set_result, None)
+    return future
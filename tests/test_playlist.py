@@ -2,6 +2,8 @@
 
 from __future__ import unicode_literals
 
+import threading
+import time
 import unittest
 
 import spotify
@@ -166,6 +168,15 @@ class PlaylistTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, playlist, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_playlist = spotify.ffi.cast("sp_playlist *", 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        playlist.load_async(10)
+
+        load_mock.assert_called_with(self.session, playlist, timeout=10, loop=None)
+
     @mock.patch("spotify.track.lib", spec=spotify.lib)
     def test_tracks(self, track_lib_mock, lib_mock):
         sp_track = spotify.ffi.cast("sp_track *", 43)
@@ -1062,6 +1073,37 @@ class PlaylistCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(playlist)
 
+    def test_playlist_state_changed_callback_notifies_loaders(self, lib_mock):
+        sp_playlist = spotify.ffi.cast("sp_playlist *", 42)
+        spotify.Playlist._cached(self.session, sp_playlist=sp_playlist)
+        generation = self.session._change_notifier.generation
+
+        _PlaylistCallbacks.playlist_state_changed(sp_playlist, spotify.ffi.NULL)
+
+        self.assertEqual(self.session._change_notifier.generation, generation + 1)
+
+    def test_load_is_woken_up_by_playlist_state_changed(self, lib_mock):
+        self.session.connection.state = spotify.ConnectionState.LOGGED_IN
+        self.session._change_notifier.event_loop_thread = -1
+        lib_mock.sp_playlist_is_loaded.return_value = 0
+        sp_playlist = spotify.ffi.cast("sp_playlist *", 42)
+        playlist = spotify.Playlist._cached(self.session, sp_playlist=sp_playlist)
+
+        def loaded():
+            lib_mock.sp_playlist_is_loaded.return_value = 1
+            _PlaylistCallbacks.playlist_state_changed(sp_playlist, spotify.ffi.NULL)
+
+        timer = threading.Timer(0.01, loaded)
+        timer.start()
+        started = time.time()
+        playlist.load(timeout=5)
+        timer.join()
+
+        self.assertLess(time.time() - started, 0.5)
+        lib_mock.sp_playlist_add_callbacks.assert_called_once_with(
+            sp_playlist, mock.ANY, spotify.ffi.NULL
+        )
+
     def test_playlist_update_in_progress_callback(self, lib_mock):
         callback = mock.Mock()
         sp_playlist = spotify.ffi.cast("sp_playlist *", 42)
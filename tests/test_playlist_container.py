@@ -1,6 +1,8 @@
 from __future__ import unicode_literals
 
 import os
+import threading
+import time
 import unittest
 
 import spotify
@@ -136,6 +138,19 @@ class PlaylistContainerTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, playlist_container, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_playlistcontainer = spotify.ffi.cast("sp_playlistcontainer *", 42)
+        playlist_container = spotify.PlaylistContainer(
+            self.session, sp_playlistcontainer=sp_playlistcontainer
+        )
+
+        playlist_container.load_async(10)
+
+        load_mock.assert_called_with(
+            self.session, playlist_container, timeout=10, loop=None
+        )
+
     def test_len(self, lib_mock):
         lib_mock.sp_playlistcontainer_num_playlists.return_value = 8
         sp_playlistcontainer = spotify.ffi.cast("sp_playlistcontainer *", 42)
@@ -1346,6 +1361,32 @@ class PlaylistContainerCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(playlist_container)
 
+    def test_load_is_woken_up_by_container_loaded(self, lib_mock):
+        self.session.connection.state = spotify.ConnectionState.LOGGED_IN
+        self.session._change_notifier.event_loop_thread = -1
+        lib_mock.sp_playlistcontainer_is_loaded.return_value = 0
+        sp_playlistcontainer = spotify.ffi.cast("sp_playlistcontainer *", 43)
+        playlist_container = spotify.PlaylistContainer._cached(
+            self.session, sp_playlistcontainer=sp_playlistcontainer
+        )
+
+        def loaded():
+            lib_mock.sp_playlistcontainer_is_loaded.return_value = 1
+            _PlaylistContainerCallbacks.container_loaded(
+                sp_playlistcontainer, spotify.ffi.NULL
+            )
+
+        timer = threading.Timer(0.01, loaded)
+        timer.start()
+        started = time.time()
+        playlist_container.load(timeout=5)
+        timer.join()
+
+        self.assertLess(time.time() - started, 0.5)
+        lib_mock.sp_playlistcontainer_add_callbacks.assert_called_once_with(
+            sp_playlistcontainer, mock.ANY, spotify.ffi.NULL
+        )
+
 
 class PlaylistFolderTest(unittest.TestCase):
     def test_id(self):
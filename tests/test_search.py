@@ -76,6 +76,19 @@ class SearchTest(unittest.TestCase):
         result.loaded_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_search_complete_callback_completes_future(self, lib_mock):
+        lib_mock.sp_search_error.return_value = int(spotify.ErrorType.OK)
+        sp_search = spotify.ffi.cast("sp_search *", 42)
+        lib_mock.sp_search_create.return_value = sp_search
+
+        result = spotify.Search(self.session, query="alice")
+        self.assertFalse(result.future.done())
+        search_complete_cb = lib_mock.sp_search_create.call_args[0][11]
+        userdata = lib_mock.sp_search_create.call_args[0][12]
+        search_complete_cb(sp_search, userdata)
+
+        self.assertEqual(result.future.result(timeout=0), result)
+
     def test_search_where_result_is_gone_before_callback_is_called(self, lib_mock):
 
         sp_search = spotify.ffi.cast("sp_search *", 42)
@@ -181,6 +194,15 @@ class SearchTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, search, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_search = spotify.ffi.cast("sp_search *", 42)
+        search = spotify.Search(self.session, sp_search=sp_search)
+
+        search.load_async(10)
+
+        load_mock.assert_called_with(self.session, search, timeout=10, loop=None)
+
     @mock.patch("spotify.track.lib", spec=spotify.lib)
     def test_tracks(self, track_lib_mock, lib_mock):
         lib_mock.sp_search_error.return_value = spotify.ErrorType.OK
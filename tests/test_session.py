@@ -8,6 +8,7 @@ import pytest
 
 import spotify
 import tests
+from spotify import compat
 from spotify.session import _SessionCallbacks
 from tests import mock
 
@@ -461,6 +462,91 @@ class SessionTest(unittest.TestCase):
         with self.assertRaises(spotify.Error):
             session.process_events()
 
+    def test_metadata_update_interval_defaults_to_none(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+
+        self.assertIsNone(session.metadata_update_interval)
+
+    def test_metadata_update_interval_must_not_be_negative(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+
+        with self.assertRaises(ValueError):
+            session.metadata_update_interval = -1
+
+    def test_process_events_emits_coalesced_metadata_updates(self, lib_mock):
+        def func(sp_session, int_ptr):
+            _SessionCallbacks.metadata_updated(sp_session)
+            _SessionCallbacks.metadata_updated(sp_session)
+            _SessionCallbacks.metadata_updated(sp_session)
+            int_ptr[0] = 5500
+            return spotify.ErrorType.OK
+
+        lib_mock.sp_session_process_events.side_effect = func
+        callback = mock.Mock()
+        session = tests.create_real_session(lib_mock)
+        session.metadata_update_interval = 0
+        session.on(spotify.SessionEvent.METADATA_UPDATED, callback)
+
+        timeout = session.process_events()
+
+        callback.assert_called_once_with(session, 3)
+        self.assertEqual(timeout, 5500)
+
+    def test_process_events_without_metadata_updates_emits_nothing(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = spotify.ErrorType.OK
+        callback = mock.Mock()
+        session = tests.create_real_session(lib_mock)
+        session.metadata_update_interval = 0
+        session.on(spotify.SessionEvent.METADATA_UPDATED, callback)
+
+        session.process_events()
+
+        self.assertEqual(callback.call_count, 0)
+
+    @mock.patch("spotify.session._clock")
+    def test_process_events_emits_metadata_updates_once_per_interval(
+        self, clock_mock, lib_mock
+    ):
+        def func(sp_session, int_ptr):
+            _SessionCallbacks.metadata_updated(sp_session)
+            int_ptr[0] = 5500
+            return spotify.ErrorType.OK
+
+        lib_mock.sp_session_process_events.side_effect = func
+        callback = mock.Mock()
+        session = tests.create_real_session(lib_mock)
+        session.metadata_update_interval = 1
+        session.on(spotify.SessionEvent.METADATA_UPDATED, callback)
+
+        clock_mock.return_value = 100
+        self.assertEqual(session.process_events(), 5500)
+        callback.assert_called_once_with(session, 1)
+
+        clock_mock.return_value = 100.5
+        self.assertEqual(session.process_events(), 501)
+        clock_mock.return_value = 100.75
+        self.assertEqual(session.process_events(), 251)
+        self.assertEqual(callback.call_count, 1)
+
+        clock_mock.return_value = 101
+        self.assertEqual(session.process_events(), 5500)
+        self.assertEqual(callback.call_count, 2)
+        callback.assert_called_with(session, 3)
+
+    def test_disabling_coalescing_emits_pending_metadata_updates(self, lib_mock):
+        callback = mock.Mock()
+        session = tests.create_real_session(lib_mock)
+        session.metadata_update_interval = 10
+        session.on(spotify.SessionEvent.METADATA_UPDATED, callback)
+        _SessionCallbacks.metadata_updated(session._sp_session)
+        _SessionCallbacks.metadata_updated(session._sp_session)
+        self.assertEqual(callback.call_count, 0)
+
+        session.metadata_update_interval = None
+
+        callback.assert_called_once_with(session, 2)
+        self.assertIsNone(session.metadata_update_interval)
+
     @mock.patch("spotify.InboxPostResult", spec=spotify.InboxPostResult)
     def test_inbox_post_tracks(self, inbox_mock, lib_mock):
         session = tests.create_real_session(lib_mock)
@@ -788,6 +874,27 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(session)
 
+    def test_metadata_updated_callback_notifies_loaders(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        generation = session._change_notifier.generation
+
+        _SessionCallbacks.metadata_updated(session._sp_session)
+
+        self.assertEqual(session._change_notifier.generation, generation + 1)
+
+    def test_metadata_updated_callback_is_counted_if_coalescing(self, lib_mock):
+        callback = mock.Mock()
+        session = tests.create_real_session(lib_mock)
+        session.metadata_update_interval = 0
+        session.on(spotify.SessionEvent.METADATA_UPDATED, callback)
+        generation = session._change_notifier.generation
+
+        _SessionCallbacks.metadata_updated(session._sp_session)
+
+        self.assertEqual(callback.call_count, 0)
+        self.assertEqual(session._metadata_coalescer.count, 1)
+        self.assertEqual(session._change_notifier.generation, generation + 1)
+
     def test_connection_error_callback(self, lib_mock):
         callback = mock.Mock()
         session = tests.create_real_session(lib_mock)
@@ -818,6 +925,14 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(session)
 
+    def test_notify_main_thread_callback_notifies_loaders(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        generation = session._change_notifier.generation
+
+        _SessionCallbacks.notify_main_thread(session._sp_session)
+
+        self.assertEqual(session._change_notifier.generation, generation + 1)
+
     def test_music_delivery_callback(self, lib_mock):
         sp_audioformat = spotify.ffi.new("sp_audioformat *")
         sp_audioformat.channels = 2
@@ -839,10 +954,191 @@ class SessionCallbacksTest(unittest.TestCase):
         )
 
         callback.assert_called_once_with(session, mock.ANY, mock.ANY, num_frames)
-        self.assertEqual(callback.call_args[0][1]._sp_audioformat, sp_audioformat)
+        self.assertEqual(callback.call_args[0][1].channels, 2)
         self.assertEqual(callback.call_args[0][2][:5], b"abc\x00\x00")
         self.assertEqual(result, num_frames)
 
+    def test_music_delivery_callback_with_zero_copy(self, lib_mock):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.channels = 2
+
+        num_frames = 10
+        frames = spotify.ffi.new("char[]", 4 * num_frames)
+        frames[0:3] = [b"a", b"b", b"c"]
+        frames_void_ptr = spotify.ffi.cast("void *", frames)
+
+        received = []
+
+        def callback(session, audio_format, frames, num_frames):
+            received.append(frames)
+            self.assertIsInstance(frames, memoryview)
+            self.assertEqual(len(frames), 4 * num_frames)
+            self.assertEqual(frames[:5].tobytes(), b"abc\x00\x00")
+            return num_frames
+
+        session = tests.create_real_session(lib_mock)
+        session.music_delivery_zero_copy = True
+        session.on("music_delivery", callback)
+
+        result = _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, num_frames
+        )
+
+        self.assertEqual(result, num_frames)
+        self.assertEqual(len(received), 1)
+        if not compat.PY2:
+            with self.assertRaises(ValueError):
+                received[0].tobytes()
+
+    @unittest.skipIf(compat.PY2, "memoryview can't be released on Python 2")
+    @mock.patch("spotify.session._warned_frames_view_exported", False)
+    def test_music_delivery_with_zero_copy_view_still_exported(self, lib_mock):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.channels = 2
+        num_frames = 10
+        frames = spotify.ffi.new("char[]", 4 * num_frames)
+        frames_void_ptr = spotify.ffi.cast("void *", frames)
+        exports = []
+
+        def callback(session, audio_format, frames, num_frames):
+            exports.append(spotify.ffi.from_buffer(frames))
+            return num_frames
+
+        session = tests.create_real_session(lib_mock)
+        session.music_delivery_zero_copy = True
+        session.on("music_delivery", callback)
+
+        with mock.patch("spotify.session.logger") as logger_mock:
+            results = [
+                _SessionCallbacks.music_delivery(
+                    session._sp_session, sp_audioformat, frames_void_ptr, num_frames
+                )
+                for _ in range(2)
+            ]
+
+        self.assertEqual(results, [num_frames, num_frames])
+        self.assertEqual(logger_mock.warning.call_count, 1)
+
+    def test_music_delivery_callback_with_buffer_pool(self, lib_mock):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.channels = 2
+
+        num_frames = 10
+        frames = spotify.ffi.new("char[]", 4 * num_frames)
+        frames[0:3] = [b"a", b"b", b"c"]
+        frames_void_ptr = spotify.ffi.cast("void *", frames)
+
+        callback = mock.Mock()
+        callback.return_value = num_frames
+        pool = spotify.AudioBufferPool()
+        session = tests.create_real_session(lib_mock)
+        session.music_delivery_buffer_pool = pool
+        session.on("music_delivery", callback)
+
+        result = _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, num_frames
+        )
+
+        self.assertEqual(result, num_frames)
+        buf = callback.call_args[0][2]
+        self.assertIsInstance(buf, memoryview)
+        self.assertEqual(len(buf), 4 * num_frames)
+        self.assertEqual(buf[:5].tobytes(), b"abc\x00\x00")
+        self.assertEqual(pool.allocated, 1)
+        self.assertEqual(pool.num_free(), 0)
+
+    def test_music_delivery_not_consumed_is_still_owned_by_listener(self, lib_mock):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.channels = 2
+        num_frames = 10
+        frames = spotify.ffi.new("char[]", 4 * num_frames)
+        frames_void_ptr = spotify.ffi.cast("void *", frames)
+
+        callback = mock.Mock()
+        callback.return_value = 0
+        pool = spotify.AudioBufferPool()
+        session = tests.create_real_session(lib_mock)
+        session.music_delivery_buffer_pool = pool
+        session.on("music_delivery", callback)
+
+        result = _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, num_frames
+        )
+
+        self.assertEqual(result, 0)
+        self.assertEqual(pool.num_free(), 0)
+
+    @unittest.skipIf(compat.PY2, "buffers aren't reused on Python 2")
+    def test_music_delivery_through_sink_reuses_buffer_pool(self, lib_mock):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.channels = 2
+        frames = spotify.ffi.new("char[]", 4 * 2048)
+        frames_void_ptr = spotify.ffi.cast("void *", frames)
+
+        pool = spotify.AudioBufferPool()
+        session = tests.create_real_session(lib_mock)
+        session.music_delivery_buffer_pool = pool
+        sink = spotify.NullSink(session)
+
+        for num_frames in [2048, 1500, 2047, 1100] * 25:
+            _SessionCallbacks.music_delivery(
+                session._sp_session, sp_audioformat, frames_void_ptr, num_frames
+            )
+
+        self.assertEqual(sink.deliveries, 100)
+        self.assertEqual(pool.allocated, 1)
+        self.assertEqual(pool.reused, 99)
+        self.assertEqual(pool.num_free(), 1)
+
+    def test_music_delivery_reuses_audio_format_until_it_changes(self, lib_mock):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.sample_rate = 44100
+        sp_audioformat.channels = 2
+        frames = spotify.ffi.new("char[]", 4 * 10)
+        frames_void_ptr = spotify.ffi.cast("void *", frames)
+
+        callback = mock.Mock()
+        callback.return_value = 10
+        session = tests.create_real_session(lib_mock)
+        session.on("music_delivery", callback)
+
+        def deliver():
+            _SessionCallbacks.music_delivery(
+                session._sp_session, sp_audioformat, frames_void_ptr, 10
+            )
+            return callback.call_args[0][1]
+
+        audio_format1 = deliver()
+        audio_format2 = deliver()
+        sp_audioformat.channels = 1
+        audio_format3 = deliver()
+
+        self.assertIs(audio_format2, audio_format1)
+        self.assertIsNot(audio_format3, audio_format1)
+        self.assertEqual(audio_format1.channels, 2)
+        self.assertEqual(audio_format3.channels, 1)
+        self.assertEqual(audio_format3.sample_rate, 44100)
+        self.assertEqual(len(callback.call_args[0][2]), 2 * 10)
+
+    def test_music_delivery_passes_user_args_to_callback(self, lib_mock):
+        sp_audioformat = spotify.ffi.new("sp_audioformat *")
+        sp_audioformat.channels = 2
+        frames = spotify.ffi.new("char[]", 4 * 10)
+        frames_void_ptr = spotify.ffi.cast("void *", frames)
+
+        callback = mock.Mock()
+        callback.return_value = 10
+        session = tests.create_real_session(lib_mock)
+        session.on("music_delivery", callback, mock.sentinel.user_arg)
+
+        _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, 10
+        )
+
+        callback.assert_called_once_with(
+            session, mock.ANY, mock.ANY, 10, mock.sentinel.user_arg
+        )
+
     def test_music_delivery_without_callback_does_not_consume(self, lib_mock):
         session = tests.create_real_session(lib_mock)
 
@@ -1,33 +1,102 @@
 from __future__ import unicode_literals
 
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
+import wave
 
 import spotify
+import spotify.sink  # noqa: F401, imported before sys.modules is patched
 from tests import mock
 
 
 class BaseSinkTest(object):
     def test_init_connects_to_music_delivery_event(self):
-        self.session.on.assert_called_with(
+        self.session.on.assert_any_call(
             spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery
         )
 
+    def test_init_connects_to_get_audio_buffer_stats_event(self):
+        self.session.on.assert_any_call(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self.sink._on_get_audio_buffer_stats,
+        )
+
     def test_off_disconnects_from_music_delivery_event(self):
         self.assertEqual(self.session.off.call_count, 0)
 
         self.sink.off()
 
-        self.session.off.assert_called_with(
+        self.session.off.assert_any_call(
             spotify.SessionEvent.MUSIC_DELIVERY, mock.ANY
         )
 
+    def test_off_disconnects_from_get_audio_buffer_stats_event(self):
+        self.sink.off()
+
+        self.session.off.assert_any_call(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self.sink._on_get_audio_buffer_stats,
+        )
+
     def test_on_connects_to_music_delivery_event(self):
-        self.assertEqual(self.session.on.call_count, 1)
+        self.assertEqual(self.session.on.call_count, 2)
 
         self.sink.off()
         self.sink.on()
 
-        self.assertEqual(self.session.on.call_count, 2)
+        self.assertEqual(self.session.on.call_count, 4)
+
+    def test_on_leaves_get_audio_buffer_stats_to_existing_listener(self):
+        self.sink.off()
+        self.session.reset_mock()
+
+        def num_listeners(event):
+            if event == spotify.SessionEvent.GET_AUDIO_BUFFER_STATS:
+                return 1
+            return 0
+
+        self.session.num_listeners.side_effect = num_listeners
+        self.sink.on()
+        self.sink.off()
+
+        self.session.on.assert_called_once_with(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery
+        )
+        self.session.off.assert_called_once_with(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery
+        )
+
+    def test_get_audio_buffer_stats_reports_underruns_since_last_query(self):
+        self.sink._update_starved(False)
+        self.sink._update_starved(True)
+        self.sink._update_starved(True)
+        self.sink._update_starved(False)
+        self.sink._update_starved(True)
+
+        stats1 = self.sink._on_get_audio_buffer_stats(mock.sentinel.session)
+        stats2 = self.sink._on_get_audio_buffer_stats(mock.sentinel.session)
+
+        self.assertEqual(self.sink.underruns, 2)
+        self.assertEqual(stats1.stutter, 2)
+        self.assertEqual(stats2.stutter, 0)
+
+    def test_first_starved_state_is_not_an_underrun(self):
+        self.sink._update_starved(True)
+
+        self.assertEqual(self.sink.underruns, 0)
+
+
+def create_alsa_device():
+    device = mock.Mock()
+    device.info.return_value = {"buffer_size": 8192}
+    device.avail.return_value = 8192
+    device.write.return_value = 2048
+    return device
 
 
 class AlsaSinkTest(unittest.TestCase, BaseSinkTest):
@@ -49,7 +118,7 @@ class AlsaSinkTest(unittest.TestCase, BaseSinkTest):
         self.assertIsNone(self.sink._device)
 
     def test_music_delivery_creates_device_if_needed(self):
-        device = mock.Mock()
+        device = create_alsa_device()
         self.alsaaudio.PCM.return_value = device
         audio_format = mock.Mock()
         audio_format.frame_size.return_value = 4
@@ -75,7 +144,7 @@ class AlsaSinkTest(unittest.TestCase, BaseSinkTest):
 
     def test_music_delivery_creates_device_with_alsaaudio_0_7(self):
         del self.alsaaudio.pcms  # Remove pyalsaudio 0.8 version marker
-        device = mock.Mock()
+        device = create_alsa_device()
         self.alsaaudio.PCM.return_value = device
         audio_format = mock.Mock()
         audio_format.frame_size.return_value = 4
@@ -95,7 +164,7 @@ class AlsaSinkTest(unittest.TestCase, BaseSinkTest):
         )
 
     def test_sets_little_endian_format_if_little_endian_system(self):
-        device = mock.Mock()
+        device = create_alsa_device()
         self.alsaaudio.PCM.return_value = device
         audio_format = mock.Mock()
         audio_format.frame_size.return_value = 4
@@ -115,7 +184,7 @@ class AlsaSinkTest(unittest.TestCase, BaseSinkTest):
         device.setformat.assert_called_with(self.alsaaudio.PCM_FORMAT_S16_LE)
 
     def test_sets_big_endian_format_if_big_endian_system(self):
-        device = mock.Mock()
+        device = create_alsa_device()
         self.alsaaudio.PCM.return_value = device
         audio_format = mock.Mock()
         audio_format.frame_size.return_value = 4
@@ -135,19 +204,73 @@ class AlsaSinkTest(unittest.TestCase, BaseSinkTest):
         device.setformat.assert_called_with(self.alsaaudio.PCM_FORMAT_S16_BE)
 
     def test_music_delivery_writes_frames_to_stream(self):
-        self.sink._device = mock.Mock()
+        self.sink._device = create_alsa_device()
         audio_format = mock.Mock()
         audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
 
         num_consumed_frames = self.sink._on_music_delivery(
-            mock.sentinel.session,
-            audio_format,
-            mock.sentinel.frames,
-            mock.sentinel.num_frames,
+            mock.sentinel.session, audio_format, mock.sentinel.frames, 2048
         )
 
         self.sink._device.write.assert_called_with(mock.sentinel.frames)
-        self.assertEqual(num_consumed_frames, self.sink._device.write.return_value)
+        self.assertEqual(num_consumed_frames, 2048)
+        self.assertEqual(self.sink.overruns, 0)
+
+    def test_music_delivery_counts_partly_written_frames_as_overrun(self):
+        self.sink._device = create_alsa_device()
+        self.sink._device.write.return_value = 1000
+        audio_format = mock.Mock()
+        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+
+        num_consumed_frames = self.sink._on_music_delivery(
+            mock.sentinel.session, audio_format, mock.sentinel.frames, 2048
+        )
+
+        self.assertEqual(num_consumed_frames, 1000)
+        self.assertEqual(self.sink.overruns, 1)
+
+    def test_music_delivery_counts_underrun_if_device_ran_dry(self):
+        self.sink._device = create_alsa_device()
+        audio_format = mock.Mock()
+        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+
+        self.sink._device.avail.return_value = 4096
+        self.sink._on_music_delivery(
+            mock.sentinel.session, audio_format, mock.sentinel.frames, 2048
+        )
+        self.sink._device.avail.return_value = 8192
+        self.sink._on_music_delivery(
+            mock.sentinel.session, audio_format, mock.sentinel.frames, 2048
+        )
+
+        self.assertEqual(self.sink.underruns, 1)
+
+    def test_buffered_frames(self):
+        self.assertEqual(self.sink.buffered_frames, 0)
+
+        self.sink._device = create_alsa_device()
+        self.sink._device.avail.return_value = 6000
+
+        self.assertEqual(self.sink.buffered_frames, 8192 - 6000)
+
+    def test_buffered_frames_is_zero_in_underrun_state(self):
+        self.sink._device = create_alsa_device()
+        self.sink._device.avail.return_value = -32  # -EPIPE
+
+        self.assertEqual(self.sink.buffered_frames, 0)
+
+    def test_buffered_frames_is_zero_with_old_pyalsaaudio(self):
+        self.sink._device = create_alsa_device()
+        del self.sink._device.avail
+
+        self.assertEqual(self.sink.buffered_frames, 0)
+
+
+def create_pyaudio_stream():
+    stream = mock.Mock()
+    stream.get_output_latency.return_value = 0.1
+    stream.get_write_available.return_value = 1000
+    return stream
 
 
 class PortAudioSinkTest(unittest.TestCase, BaseSinkTest):
@@ -172,8 +295,10 @@ class PortAudioSinkTest(unittest.TestCase, BaseSinkTest):
         self.assertIsNone(self.sink._stream)
 
     def test_music_delivery_creates_stream_if_needed(self):
+        self.sink._device.open.return_value = create_pyaudio_stream()
         audio_format = mock.Mock()
         audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+        audio_format.sample_rate = 44100
 
         self.sink._on_music_delivery(
             mock.sentinel.session,
@@ -191,7 +316,8 @@ class PortAudioSinkTest(unittest.TestCase, BaseSinkTest):
         self.assertEqual(self.sink._stream, self.sink._device.open.return_value)
 
     def test_music_delivery_writes_frames_to_stream(self):
-        self.sink._stream = mock.Mock()
+        self.sink._stream = create_pyaudio_stream()
+        self.sink._sample_rate = 44100
         audio_format = mock.Mock()
         audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
 
@@ -206,3 +332,473 @@ class PortAudioSinkTest(unittest.TestCase, BaseSinkTest):
             mock.sentinel.frames, num_frames=mock.sentinel.num_frames
         )
         self.assertEqual(num_consumed_frames, mock.sentinel.num_frames)
+
+    def test_buffered_frames_is_estimated_from_output_latency(self):
+        self.assertEqual(self.sink.buffered_frames, 0)
+
+        self.sink._stream = create_pyaudio_stream()
+        self.sink._sample_rate = 44100
+
+        self.assertEqual(self.sink.buffered_frames, 4410 - 1000)
+
+    def test_music_delivery_counts_underrun_if_stream_ran_dry(self):
+        self.sink._stream = create_pyaudio_stream()
+        self.sink._sample_rate = 44100
+        audio_format = mock.Mock()
+        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+
+        self.sink._on_music_delivery(
+            mock.sentinel.session, audio_format, mock.sentinel.frames, 2048
+        )
+        self.sink._stream.get_write_available.return_value = 4410
+        self.sink._on_music_delivery(
+            mock.sentinel.session, audio_format, mock.sentinel.frames, 2048
+        )
+
+        self.assertEqual(self.sink.underruns, 1)
+
+
+class PortAudioSinkCallbackModeTest(unittest.TestCase, BaseSinkTest):
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.pyaudio = mock.Mock()
+        with mock.patch.dict("sys.modules", {"pyaudio": self.pyaudio}):
+            self.sink = spotify.PortAudioSink(
+                self.session, callback_mode=True, buffer_frames=4
+            )
+        self.audio_format = mock.Mock()
+        self.audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+        self.audio_format.frame_size.return_value = 2
+
+    def deliver(self, frames):
+        return self.sink._on_music_delivery(
+            mock.sentinel.session, self.audio_format, frames, len(frames) // 2
+        )
+
+    def test_music_delivery_opens_stream_in_callback_mode(self):
+        self.deliver(b"ab")
+
+        self.sink._device.open.assert_called_with(
+            format=self.pyaudio.paInt16,
+            channels=self.audio_format.channels,
+            rate=self.audio_format.sample_rate,
+            output=True,
+            stream_callback=self.sink._on_stream_callback,
+        )
+        self.assertEqual(self.sink._stream.write.call_count, 0)
+
+    def test_music_delivery_accepts_only_frames_that_fit(self):
+        self.assertEqual(self.deliver(b"aabbcc"), 3)
+        self.assertEqual(self.sink.overruns, 0)
+
+        self.assertEqual(self.deliver(b"ddeeff"), 1)
+        self.assertEqual(self.sink.overruns, 1)
+
+        self.assertEqual(self.deliver(b"gg"), 0)
+        self.assertEqual(self.sink.overruns, 2)
+
+    def test_stream_callback_plays_buffered_frames(self):
+        self.deliver(b"aabbcc")
+
+        result = self.sink._on_stream_callback(None, 2, {}, 0)
+
+        self.assertEqual(result, (b"aabb", self.pyaudio.paContinue))
+
+    def test_stream_callback_reads_across_end_of_buffer(self):
+        self.deliver(b"aabbcc")
+        self.sink._on_stream_callback(None, 2, {}, 0)
+        self.assertEqual(self.deliver(b"ddeeff"), 3)
+
+        (data, _) = self.sink._on_stream_callback(None, 4, {}, 0)
+
+        self.assertEqual(data, b"ccddeeff")
+
+    def test_stream_callback_pads_with_silence_and_counts_underruns(self):
+        self.deliver(b"aabb")
+        self.sink._on_stream_callback(None, 1, {}, 0)
+
+        (data, _) = self.sink._on_stream_callback(None, 2, {}, 0)
+        self.sink._on_stream_callback(None, 2, {}, 0)
+
+        self.assertEqual(data, b"bb\x00\x00")
+        self.assertEqual(self.sink.underruns, 1)
+
+    def test_stream_callback_does_not_count_underruns_before_playback(self):
+        self.deliver(b"")
+
+        (data, _) = self.sink._on_stream_callback(None, 2, {}, 0)
+
+        self.assertEqual(data, b"\x00\x00\x00\x00")
+        self.assertEqual(self.sink.underruns, 0)
+
+    def test_buffered_frames(self):
+        self.assertEqual(self.sink.buffered_frames, 0)
+
+        self.deliver(b"aabbcc")
+
+        self.assertEqual(self.sink.buffered_frames, 3)
+
+    def test_get_audio_buffer_stats_before_playback(self):
+        stats = self.sink._on_get_audio_buffer_stats(mock.sentinel.session)
+
+        self.assertEqual(stats, spotify.AudioBufferStats(0, 0))
+
+    def test_get_audio_buffer_stats_reports_underruns_since_last_query(self):
+        self.deliver(b"aabbcc")
+        self.sink._on_stream_callback(None, 1, {}, 0)
+        self.sink._on_stream_callback(None, 4, {}, 0)
+
+        stats1 = self.sink._on_get_audio_buffer_stats(mock.sentinel.session)
+        self.deliver(b"dd")
+        stats2 = self.sink._on_get_audio_buffer_stats(mock.sentinel.session)
+
+        self.assertEqual(stats1, spotify.AudioBufferStats(0, 1))
+        self.assertEqual(stats2, spotify.AudioBufferStats(1, 0))
+
+    def test_off_closes_stream_and_drops_buffer(self):
+        self.deliver(b"aabb")
+        stream = self.sink._stream
+
+        self.sink.off()
+
+        stream.close.assert_called_with()
+        self.assertIsNone(self.sink._stream)
+        self.assertIsNone(self.sink._buffer)
+
+
+class NullSinkTest(unittest.TestCase, BaseSinkTest):
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.sink = spotify.NullSink(self.session, window=3)
+
+    @mock.patch("spotify.sink._clock")
+    def deliver(self, num_frames, now, clock_mock):
+        clock_mock.return_value = now
+        return self.sink._on_music_delivery(
+            mock.sentinel.session,
+            mock.sentinel.audio_format,
+            b"x" * (num_frames * 4),
+            num_frames,
+        )
+
+    def test_music_delivery_consumes_all_frames(self):
+        self.assertEqual(self.deliver(2048, 10.0), 2048)
+
+    def test_counts_deliveries(self):
+        self.deliver(2048, 10.0)
+        self.deliver(1024, 10.5)
+
+        self.assertEqual(self.sink.deliveries, 2)
+        self.assertEqual(self.sink.frames_delivered, 3072)
+        self.assertEqual(self.sink.bytes_delivered, 3072 * 4)
+
+    def test_records_chunk_sizes_and_intervals_in_window(self):
+        self.deliver(1000, 10.0)
+        self.deliver(2000, 10.5)
+        self.deliver(3000, 11.0)
+        self.deliver(4000, 12.0)
+
+        self.assertEqual(list(self.sink.chunk_sizes.values), [2000, 3000, 4000])
+        self.assertEqual(list(self.sink.intervals.values), [0.5, 0.5, 1.0])
+
+    def test_stats(self):
+        self.deliver(1000, 10.0)
+        self.deliver(1000, 10.5)
+        self.deliver(2000, 11.0)
+
+        stats = self.sink.stats()
+
+        self.assertEqual(stats["deliveries"], 3)
+        self.assertEqual(stats["frames"], 4000)
+        self.assertEqual(stats["bytes"], 16000)
+        self.assertEqual(stats["seconds"], 1.0)
+        self.assertEqual(stats["frames_per_second"], 4000.0)
+        self.assertEqual(stats["bytes_per_second"], 16000.0)
+        self.assertEqual(stats["chunk_sizes"]["max"], 2000)
+        self.assertEqual(stats["intervals"]["mean"], 0.5)
+        self.assertEqual(stats["jitter"], 0.0)
+
+    def test_stats_jitter_is_standard_deviation_of_intervals(self):
+        self.deliver(1000, 10.0)
+        self.deliver(1000, 10.5)
+        self.deliver(1000, 11.5)
+
+        self.assertAlmostEqual(self.sink.stats()["jitter"], 0.25)
+
+    def test_stats_without_deliveries(self):
+        stats = self.sink.stats()
+
+        self.assertEqual(stats["deliveries"], 0)
+        self.assertIsNone(stats["frames_per_second"])
+        self.assertIsNone(stats["bytes_per_second"])
+        self.assertIsNone(stats["jitter"])
+
+    def test_reset(self):
+        self.deliver(1000, 10.0)
+        self.deliver(1000, 10.5)
+
+        self.sink.reset()
+        self.deliver(1000, 20.0)
+
+        self.assertEqual(self.sink.deliveries, 1)
+        self.assertEqual(self.sink.chunk_sizes.count, 1)
+        self.assertEqual(self.sink.intervals.count, 0)
+
+
+class TeeSinkTest(unittest.TestCase, BaseSinkTest):
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.sink = spotify.TeeSink(self.session)
+        self.addCleanup(self.sink._close)
+
+    def deliver(self, frames):
+        return self.sink._on_music_delivery(
+            mock.sentinel.session,
+            mock.sentinel.audio_format,
+            frames,
+            len(frames) // 4,
+        )
+
+    def add_listener(self, branch, block=None, consume=None, done=None):
+        received = []
+
+        def listener(session, audio_format, frames, num_frames):
+            if block is not None:
+                block.wait()
+            received.append((session, audio_format, frames, num_frames))
+            if consume is not None:
+                result = consume.pop(0)
+                if not consume and done is not None:
+                    done.set()
+                return result
+            return num_frames
+
+        branch.on(spotify.SessionEvent.MUSIC_DELIVERY, listener)
+        return received
+
+    def test_music_delivery_is_passed_on_to_all_branches(self):
+        branch1 = self.sink.branch()
+        branch2 = self.sink.branch()
+        received1 = self.add_listener(branch1)
+        received2 = self.add_listener(branch2)
+
+        self.assertEqual(self.deliver(b"aabbccdd"), 2)
+        self.sink._close()
+
+        expected = [
+            (self.session, mock.sentinel.audio_format, b"aabbccdd", 2),
+        ]
+        self.assertEqual(received1, expected)
+        self.assertEqual(received2, expected)
+        self.assertIs(received1[0][2], received2[0][2])
+
+    def test_branch_with_backpressure_limits_accepted_frames(self):
+        block = threading.Event()
+        branch = self.sink.branch(buffer_frames=3, backpressure=True)
+        received = self.add_listener(branch, block=block)
+
+        self.assertEqual(self.deliver(b"aabbccdd"), 2)
+        self.assertEqual(self.deliver(b"eeffgghh"), 1)
+        self.assertEqual(self.deliver(b"iijj"), 0)
+        self.assertEqual(self.sink.overruns, 2)
+        self.assertEqual(self.sink.buffered_frames, 3)
+
+        block.set()
+        self.sink._close()
+
+        self.assertEqual(
+            [frames for (_, _, frames, _) in received], [b"aabbccdd", b"eeff"]
+        )
+        self.assertEqual(branch.dropped_frames, 0)
+
+    def test_branch_without_backpressure_drops_frames_that_dont_fit(self):
+        block = threading.Event()
+        slow_branch = self.sink.branch(buffer_frames=3)
+        fast_branch = self.sink.branch(backpressure=True)
+        slow_received = self.add_listener(slow_branch, block=block)
+        fast_received = self.add_listener(fast_branch)
+
+        self.assertEqual(self.deliver(b"aabbccdd"), 2)
+        self.assertEqual(self.deliver(b"eeffgghh"), 2)
+
+        block.set()
+        self.sink._close()
+
+        self.assertEqual(len(slow_received), 1)
+        self.assertEqual(slow_branch.dropped_frames, 2)
+        self.assertEqual(len(fast_received), 2)
+        self.assertEqual(self.sink.overruns, 0)
+
+    def test_branches_have_no_backpressure_by_default(self):
+        block = threading.Event()
+        self.addCleanup(block.set)
+        branch = self.sink.branch(buffer_frames=1)
+        self.add_listener(branch, block=block)
+
+        self.assertFalse(branch.backpressure)
+        self.assertEqual(self.deliver(b"aabbccdd"), 2)
+        self.assertEqual(self.deliver(b"eeffgghh"), 2)
+        self.assertEqual(self.sink.overruns, 0)
+
+    def test_failing_sink_drops_chunk_and_keeps_accepting_audio(self):
+        branch = self.sink.branch(buffer_frames=2, backpressure=True)
+        received = []
+        done = threading.Event()
+
+        def listener(session, audio_format, frames, num_frames):
+            received.append(frames)
+            if len(received) == 1:
+                raise IOError("disk full")
+            done.set()
+            return num_frames
+
+        branch.on(spotify.SessionEvent.MUSIC_DELIVERY, listener)
+
+        with mock.patch("spotify.sink.logger") as logger_mock:
+            self.assertEqual(self.deliver(b"aabbccdd"), 2)
+            for _ in range(500):
+                if branch.buffered_frames == 0:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(self.deliver(b"eeffgghh"), 2)
+            self.assertTrue(done.wait(5))
+
+        self.sink._close()
+        self.assertEqual(received, [b"aabbccdd", b"eeffgghh"])
+        self.assertEqual(branch.dropped_frames, 2)
+        self.assertEqual(logger_mock.exception.call_count, 1)
+
+    def test_frames_not_consumed_by_sink_are_delivered_again(self):
+        branch = self.sink.branch()
+        branch.retry_delay = 0
+        done = threading.Event()
+        received = self.add_listener(branch, consume=[1, 0, 1], done=done)
+
+        self.deliver(b"aabbccdd")
+        self.assertTrue(done.wait(5))
+        self.sink._close()
+
+        self.assertEqual(
+            [(frames, num_frames) for (_, _, frames, num_frames) in received],
+            [(b"aabbccdd", 2), (b"ccdd", 1), (b"ccdd", 1)],
+        )
+        self.assertEqual(branch.buffered_frames, 0)
+
+    def test_branch_without_sink_discards_audio(self):
+        branch = self.sink.branch()
+
+        self.assertEqual(self.deliver(b"aabbccdd"), 2)
+        self.sink._close()
+
+        self.assertEqual(branch.buffered_frames, 0)
+
+    def test_can_be_turned_on_again(self):
+        branch = self.sink.branch()
+        received = self.add_listener(branch)
+        self.sink.off()
+
+        self.sink.on()
+        self.deliver(b"aabb")
+        self.sink._close()
+
+        self.assertEqual(len(received), 1)
+
+    def test_get_audio_buffer_stats_asks_sinks_on_branches(self):
+        block = threading.Event()
+        self.addCleanup(block.set)
+        branch1 = self.sink.branch(backpressure=True)
+        branch2 = self.sink.branch()
+        self.add_listener(branch1, block=block)
+        branch1.on(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            lambda session: spotify.AudioBufferStats(100, 1),
+        )
+        branch2.on(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            lambda session: spotify.AudioBufferStats(0, 2),
+        )
+        self.deliver(b"aabbccdd")
+
+        stats = self.sink._on_get_audio_buffer_stats(mock.sentinel.session)
+
+        self.assertEqual(stats, spotify.AudioBufferStats(102, 3))
+
+
+class WavSinkTest(unittest.TestCase, BaseSinkTest):
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.file = io.BytesIO()
+        self.sink = spotify.WavSink(self.session, self.file)
+        self.addCleanup(lambda: self.sink._close())
+        self.audio_format = mock.Mock()
+        self.audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+        self.audio_format.sample_rate = 44100
+        self.audio_format.channels = 2
+        self.audio_format.frame_size.return_value = 4
+
+    def deliver(self, frames):
+        return self.sink._on_music_delivery(
+            mock.sentinel.session, self.audio_format, frames, len(frames) // 4
+        )
+
+    def read_wav(self, data):
+        reader = wave.open(io.BytesIO(data), "rb")
+        try:
+            return (
+                reader.getnchannels(),
+                reader.getsampwidth(),
+                reader.getframerate(),
+                reader.readframes(reader.getnframes()),
+            )
+        finally:
+            reader.close()
+
+    def test_music_delivery_consumes_all_frames(self):
+        self.assertEqual(self.deliver(b"aabbccdd"), 2)
+        self.assertEqual(self.deliver(b"eeff"), 1)
+
+        self.assertEqual(self.sink.frames_written, 3)
+
+    def test_off_fixes_up_wav_header(self):
+        self.deliver(b"aabbccdd")
+        self.deliver(b"eeff")
+
+        self.sink.off()
+
+        self.assertEqual(
+            self.read_wav(self.file.getvalue()), (2, 2, 44100, b"aabbccddeeff")
+        )
+        self.assertFalse(self.file.closed)
+
+    def test_off_without_deliveries_writes_nothing(self):
+        self.sink.off()
+
+        self.assertEqual(self.file.getvalue(), b"")
+
+    def test_accepts_memoryview_and_bytearray(self):
+        self.deliver(memoryview(b"aabbccdd"))
+        self.deliver(bytearray(b"eeff"))
+
+        self.sink.off()
+
+        self.assertEqual(self.read_wav(self.file.getvalue())[3], b"aabbccddeeff")
+
+    def test_writes_to_path(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "out.wav")
+        self.sink.off()
+        self.sink = spotify.WavSink(self.session, path, buffer_size=16)
+
+        self.deliver(b"aabbccdd" * 10)
+        self.sink.off()
+
+        with open(path, "rb") as f:
+            self.assertEqual(
+                self.read_wav(f.read()), (2, 2, 44100, b"aabbccdd" * 10)
+            )
+        self.assertIsNone(self.sink._opened_file)
@@ -0,0 +1,458 @@
+from __future__ import unicode_literals
+
+import json
+import threading
+import unittest
+
+import spotify
+from spotify import stats
+from tests import mock
+
+
+class HistogramTest(unittest.TestCase):
+    def test_empty_histogram(self):
+        histogram = stats.Histogram()
+
+        self.assertEqual(histogram.count, 0)
+        self.assertIsNone(histogram.mean)
+        self.assertIsNone(histogram.percentile(50))
+
+    def test_add_tracks_count_total_min_and_max(self):
+        histogram = stats.Histogram()
+
+        histogram.add(0.001)
+        histogram.add(0.003)
+
+        self.assertEqual(histogram.count, 2)
+        self.assertAlmostEqual(histogram.total, 0.004)
+        self.assertAlmostEqual(histogram.mean, 0.002)
+        self.assertEqual(histogram.min, 0.001)
+        self.assertEqual(histogram.max, 0.003)
+
+    def test_add_counts_durations_in_power_of_two_buckets(self):
+        histogram = stats.Histogram()
+
+        histogram.add(0.0000001)  # 0.1us
+        histogram.add(0.000003)  # 3us
+        histogram.add(1000000)  # Way beyond the last bucket
+
+        self.assertEqual(histogram.buckets[0], 1)
+        self.assertEqual(histogram.buckets[2], 1)
+        self.assertEqual(histogram.buckets[-1], 1)
+
+    def test_percentile_is_estimated_from_buckets(self):
+        histogram = stats.Histogram()
+
+        for _ in range(90):
+            histogram.add(0.000003)
+        for _ in range(10):
+            histogram.add(0.1)
+
+        self.assertEqual(histogram.percentile(50), 0.000004)
+        self.assertEqual(histogram.percentile(100), 0.1)
+
+    def test_copy_is_independent(self):
+        histogram = stats.Histogram()
+        histogram.add(1)
+
+        result = histogram.copy()
+        histogram.add(2)
+
+        self.assertEqual(result.count, 1)
+        self.assertEqual(result.max, 1)
+        self.assertEqual(sum(result.buckets), 1)
+
+    def test_as_dict_is_json_serializable(self):
+        histogram = stats.Histogram()
+        histogram.add(0.5)
+
+        result = json.loads(json.dumps(histogram.as_dict()))
+
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["max"], 0.5)
+        self.assertEqual(result["p99"], 0.5)
+
+
+class RollingHistogramTest(unittest.TestCase):
+    def test_empty_histogram(self):
+        histogram = stats.RollingHistogram()
+
+        self.assertEqual(histogram.count, 0)
+        self.assertIsNone(histogram.mean)
+        self.assertIsNone(histogram.min)
+        self.assertIsNone(histogram.max)
+        self.assertIsNone(histogram.percentile(50))
+
+    def test_add_tracks_count_total_min_and_max(self):
+        histogram = stats.RollingHistogram()
+
+        histogram.add(0.001)
+        histogram.add(0.003)
+
+        self.assertEqual(histogram.count, 2)
+        self.assertAlmostEqual(histogram.total, 0.004)
+        self.assertAlmostEqual(histogram.mean, 0.002)
+        self.assertEqual(histogram.min, 0.001)
+        self.assertEqual(histogram.max, 0.003)
+
+    def test_only_keeps_the_most_recent_durations(self):
+        histogram = stats.RollingHistogram(size=3)
+
+        for value in [10, 1, 2, 3]:
+            histogram.add(value)
+
+        self.assertEqual(histogram.count, 3)
+        self.assertEqual(histogram.max, 3)
+
+    def test_percentile_is_exact(self):
+        histogram = stats.RollingHistogram()
+
+        for value in range(1, 101):
+            histogram.add(value / 1000.0)
+
+        self.assertEqual(histogram.percentile(50), 0.05)
+        self.assertEqual(histogram.percentile(99), 0.099)
+        self.assertEqual(histogram.percentile(100), 0.1)
+        self.assertEqual(histogram.percentile(0), 0.001)
+
+    def test_copy_is_independent(self):
+        histogram = stats.RollingHistogram(size=10)
+        histogram.add(1)
+
+        result = histogram.copy()
+        histogram.add(2)
+
+        self.assertEqual(result.count, 1)
+        self.assertEqual(result.size, 10)
+
+    def test_as_dict_is_json_serializable(self):
+        histogram = stats.RollingHistogram()
+        histogram.add(0.5)
+
+        result = json.loads(json.dumps(histogram.as_dict()))
+
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["p99"], 0.5)
+
+
+class LockStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.raw_lock = spotify._lock
+
+    def tearDown(self):
+        stats.disable_lock_stats()
+        spotify._lock = self.raw_lock
+
+    def test_disabled_by_default(self):
+        self.assertIs(spotify._lock, self.raw_lock)
+
+    def test_enable_instruments_the_global_lock(self):
+        stats.enable_lock_stats()
+
+        self.assertIsInstance(spotify._lock, stats._InstrumentedLock)
+        self.assertIs(spotify._lock._lock, self.raw_lock)
+
+    def test_disable_restores_the_global_lock(self):
+        stats.enable_lock_stats()
+        stats.disable_lock_stats()
+
+        self.assertIs(spotify._lock, self.raw_lock)
+
+    def test_records_lib_function_by_libspotify_name(self):
+        stats.enable_lock_stats()
+
+        spotify.lib.sp_error_message(0)
+        stats.disable_lock_stats()
+        result = stats.lock()
+
+        self.assertIn("sp_error_message", result)
+        self.assertEqual(result["sp_error_message"].wait.count, 1)
+        self.assertEqual(result["sp_error_message"].hold.count, 1)
+
+    def test_records_serialized_function_by_qualified_name(self):
+        @spotify.serialized
+        def func():
+            spotify.lib.sp_error_message(0)
+
+        stats.enable_lock_stats()
+        func()
+        stats.disable_lock_stats()
+        result = stats.lock()
+
+        name = stats._qualified_name(func.__wrapped__)
+        self.assertEqual(result[name].hold.count, 1)
+        # Reentrant acquisitions are part of the outer hold time
+        self.assertNotIn("sp_error_message", result)
+
+    def test_records_other_lock_users_by_code_name(self):
+        stats.enable_lock_stats()
+
+        with spotify._lock:
+            pass
+        stats.disable_lock_stats()
+        result = stats.lock()
+
+        self.assertIn("%s.%s" % (__name__, self._testMethodName), result)
+
+    def test_lock_returns_a_snapshot(self):
+        stats.enable_lock_stats()
+        spotify.lib.sp_error_message(0)
+
+        result = stats.lock()
+        spotify.lib.sp_error_message(0)
+
+        self.assertEqual(result["sp_error_message"].hold.count, 1)
+
+    def test_enable_discards_previous_stats(self):
+        stats.enable_lock_stats()
+        spotify.lib.sp_error_message(0)
+        stats.disable_lock_stats()
+
+        stats.enable_lock_stats()
+        stats.disable_lock_stats()
+
+        self.assertNotIn("sp_error_message", stats.lock())
+
+
+class LibProfilingTest(unittest.TestCase):
+    def setUp(self):
+        self.sp_error_message = spotify.lib.sp_error_message
+
+    def tearDown(self):
+        stats.disable_lib_profiling()
+
+    def test_disabled_by_default(self):
+        self.assertIs(
+            spotify.lib.sp_error_message.__wrapped__,
+            spotify._spotify.lib.sp_error_message,
+        )
+
+    def test_counts_and_times_lib_calls(self):
+        stats.enable_lib_profiling()
+
+        spotify.lib.sp_error_message(0)
+        spotify.lib.sp_error_message(0)
+        result = stats.lib()
+
+        self.assertEqual(list(result.keys()), ["sp_error_message"])
+        self.assertEqual(result["sp_error_message"].count, 2)
+        self.assertGreater(result["sp_error_message"].total, 0)
+
+    def test_profiled_functions_return_the_lib_result(self):
+        stats.enable_lib_profiling()
+
+        result = spotify.lib.sp_error_message(0)
+
+        self.assertEqual(
+            spotify.ffi.string(result), spotify.ffi.string(self.sp_error_message(0))
+        )
+
+    def test_profiled_functions_are_still_serialized(self):
+        stats.enable_lib_profiling()
+
+        self.assertIs(
+            spotify.lib.sp_error_message.__code__, spotify.serialized(len).__code__
+        )
+
+    def test_disable_stops_recording_but_keeps_profile(self):
+        stats.enable_lib_profiling()
+        spotify.lib.sp_error_message(0)
+
+        stats.disable_lib_profiling()
+        spotify.lib.sp_error_message(0)
+
+        self.assertEqual(stats.lib()["sp_error_message"].count, 1)
+
+    def test_enable_discards_previous_profile(self):
+        stats.enable_lib_profiling()
+        spotify.lib.sp_error_message(0)
+
+        stats.enable_lib_profiling()
+
+        self.assertEqual(stats.lib(), {})
+
+
+class EventLoopMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.event_loop = spotify.EventLoop(mock.Mock(spec=spotify.Session))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(stats.event_loop(self.event_loop))
+
+    def test_records_notify_and_timeout_wakeups(self):
+        metrics = stats.EventLoopMetrics()
+
+        metrics.record(True, 0.001, 0.01, 0.1)
+        metrics.record(False, None, 0.02, 0.2)
+
+        self.assertEqual(metrics.notify_wakeups, 1)
+        self.assertEqual(metrics.timeout_wakeups, 1)
+        self.assertEqual(metrics.notify_latency.count, 1)
+        self.assertEqual(metrics.process_events.count, 2)
+        self.assertEqual(metrics.process_events.max, 0.02)
+        self.assertEqual(metrics.requested_timeout.max, 0.2)
+
+    def test_histograms_cover_the_window(self):
+        metrics = stats.EventLoopMetrics(window=2)
+
+        for _ in range(5):
+            metrics.record(False, None, 0.01, 0.1)
+
+        self.assertEqual(metrics.timeout_wakeups, 5)
+        self.assertEqual(metrics.process_events.count, 2)
+
+    def test_enable_and_get_snapshot(self):
+        stats.enable_event_loop_metrics(self.event_loop, window=10)
+        self.event_loop._metrics.record(True, 0.001, 0.01, 0.1)
+
+        result = stats.event_loop(self.event_loop)
+        self.event_loop._metrics.record(True, 0.001, 0.01, 0.1)
+
+        self.assertEqual(result.notify_wakeups, 1)
+        self.assertEqual(result.window, 10)
+        self.assertEqual(
+            sorted(result.histograms()),
+            ["notify_latency", "process_events", "requested_timeout"],
+        )
+
+    def test_disable(self):
+        stats.enable_event_loop_metrics(self.event_loop)
+
+        stats.disable_event_loop_metrics(self.event_loop)
+
+        self.assertIsNone(stats.event_loop(self.event_loop))
+
+
+def fast_listener(*args):
+    pass
+
+
+def slow_listener(*args):
+    pass
+
+
+class ListenerWatchdogTest(unittest.TestCase):
+    def setUp(self):
+        self.emitter = spotify.utils.EventEmitter()
+
+    def tearDown(self):
+        stats.disable_listener_watchdog()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(spotify.utils._listener_watchdog)
+        self.assertEqual(stats.running_listeners(), [])
+
+    @mock.patch("spotify.stats._clock")
+    def test_records_listener_calls_per_listener_and_event(self, clock_mock):
+        clock_mock.side_effect = [0, 0.001, 0, 0.002, 0, 0.003]
+        stats.enable_listener_watchdog(log=False)
+        self.emitter.on("foo", fast_listener)
+        self.emitter.on("bar", fast_listener)
+
+        self.emitter.emit("foo")
+        self.emitter.emit("foo")
+        self.emitter.emit("bar")
+
+        result = stats.listeners()
+        foo = result[("tests.test_stats.fast_listener", "foo")]
+        self.assertEqual(foo.calls.count, 2)
+        self.assertEqual(foo.calls.max, 0.002)
+        self.assertEqual(foo.slow.count, 0)
+        bar = result[("tests.test_stats.fast_listener", "bar")]
+        self.assertEqual(bar.calls.count, 1)
+
+    @mock.patch("spotify.stats.logger")
+    @mock.patch("spotify.stats._clock")
+    def test_counts_and_logs_calls_exceeding_budget(self, clock_mock, logger_mock):
+        clock_mock.side_effect = [0, 0.001, 0, 0.5]
+        stats.enable_listener_watchdog(budget=0.1)
+        self.emitter.on("foo", fast_listener)
+        self.emitter.on("foo", slow_listener)
+
+        self.emitter.emit("foo")
+
+        result = stats.listeners()
+        fast = result[("tests.test_stats.fast_listener", "foo")]
+        self.assertEqual(fast.slow.count, 0)
+        slow = result[("tests.test_stats.slow_listener", "foo")]
+        self.assertEqual(slow.slow.count, 1)
+        self.assertEqual(logger_mock.warning.call_count, 1)
+        warning_args = logger_mock.warning.call_args[0]
+        self.assertIn("tests.test_stats.slow_listener", warning_args)
+
+    def test_times_single_listener_calls(self):
+        stats.enable_listener_watchdog()
+        self.emitter.on("foo", lambda x: x * 2)
+
+        result = self.emitter.call("foo", 21)
+
+        self.assertEqual(result, 42)
+        self.assertEqual(len(stats.listeners()), 1)
+
+    def test_listener_can_still_remove_itself(self):
+        stats.enable_listener_watchdog()
+        listener = mock.Mock(return_value=False)
+        self.emitter.on("foo", listener)
+
+        self.emitter.emit("foo")
+
+        self.assertEqual(self.emitter.num_listeners("foo"), 0)
+
+    def test_running_listeners_reports_the_current_listener(self):
+        stats.enable_listener_watchdog()
+        running = []
+
+        def listener():
+            running.extend(stats.running_listeners())
+
+        self.emitter.on("foo", listener)
+        self.emitter.emit("foo")
+
+        self.assertEqual(len(running), 1)
+        self.assertEqual(running[0].thread, threading.current_thread().name)
+        self.assertEqual(running[0].event, "foo")
+        self.assertIn("listener", running[0].listener)
+        self.assertGreaterEqual(running[0].elapsed, 0)
+        self.assertEqual(stats.running_listeners(), [])
+
+    def test_disable_stops_recording_but_keeps_stats(self):
+        stats.enable_listener_watchdog()
+        self.emitter.on("foo", fast_listener)
+        self.emitter.emit("foo")
+
+        stats.disable_listener_watchdog()
+        self.emitter.emit("foo")
+
+        self.assertIsNone(spotify.utils._listener_watchdog)
+        result = stats.listeners()
+        fast = result[("tests.test_stats.fast_listener", "foo")]
+        self.assertEqual(fast.calls.count, 1)
+
+
+class FormatTest(unittest.TestCase):
+    def setUp(self):
+        fast = stats.Histogram()
+        fast.add(0.001)
+        slow = stats.Histogram()
+        slow.add(0.5)
+        slow.add(0.5)
+        self.histograms = {"sp_fast": fast, "sp_slow": slow}
+
+    def test_format_table_sorts_by_total_time(self):
+        lines = stats.format_table(self.histograms).splitlines()
+
+        self.assertEqual(
+            lines[0].split(),
+            ["name", "calls", "total", "mean", "p50", "p90", "p99", "max"],
+        )
+        self.assertEqual(lines[1].split()[:3], ["sp_slow", "2", "1000.000"])
+        self.assertEqual(lines[2].split()[:3], ["sp_fast", "1", "1.000"])
+
+    def test_format_table_with_no_histograms(self):
+        self.assertEqual(len(stats.format_table({}).splitlines()), 1)
+
+    def test_format_json(self):
+        result = json.loads(stats.format_json(self.histograms))
+
+        self.assertEqual(result["sp_slow"]["count"], 2)
+        self.assertEqual(result["sp_fast"]["max"], 0.001)
@@ -107,6 +107,23 @@ class ToplistTest(unittest.TestCase):
         result.loaded_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_toplistbrowse_complete_callback_completes_future(self, lib_mock):
+        lib_mock.sp_toplistbrowse_error.return_value = int(spotify.ErrorType.OK)
+        sp_toplistbrowse = spotify.ffi.cast("sp_toplistbrowse *", 42)
+        lib_mock.sp_toplistbrowse_create.return_value = sp_toplistbrowse
+
+        result = spotify.Toplist(
+            self.session,
+            type=spotify.ToplistType.TRACKS,
+            region=spotify.ToplistRegion.USER,
+        )
+        self.assertFalse(result.future.done())
+        toplistbrowse_complete_cb = lib_mock.sp_toplistbrowse_create.call_args[0][4]
+        userdata = lib_mock.sp_toplistbrowse_create.call_args[0][5]
+        toplistbrowse_complete_cb(sp_toplistbrowse, userdata)
+
+        self.assertEqual(result.future.result(timeout=0), result)
+
     def test_toplist_is_gone_before_callback_is_called(self, lib_mock):
         sp_toplistbrowse = spotify.ffi.cast("sp_toplistbrowse *", 42)
         lib_mock.sp_toplistbrowse_create.return_value = sp_toplistbrowse
@@ -204,6 +221,15 @@ class ToplistTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, toplist, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_toplistbrowse = spotify.ffi.cast("sp_toplistbrowse *", 42)
+        toplist = spotify.Toplist(self.session, sp_toplistbrowse=sp_toplistbrowse)
+
+        toplist.load_async(10)
+
+        load_mock.assert_called_with(self.session, toplist, timeout=10, loop=None)
+
     def test_error(self, lib_mock):
         lib_mock.sp_toplistbrowse_error.return_value = int(
             spotify.ErrorType.OTHER_PERMANENT
@@ -127,6 +127,15 @@ class TrackTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, track, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_track = spotify.ffi.cast("sp_track *", 42)
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        track.load_async(10)
+
+        load_mock.assert_called_with(self.session, track, timeout=10, loop=None)
+
     def test_offline_status(self, lib_mock):
         lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
         lib_mock.sp_track_offline_get_status.return_value = 2
@@ -111,6 +111,15 @@ class UserTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, user, timeout=10)
 
+    @mock.patch("spotify.utils.load_async")
+    def test_load_async(self, load_mock, lib_mock):
+        sp_user = spotify.ffi.cast("sp_user *", 42)
+        user = spotify.User(self.session, sp_user=sp_user)
+
+        user.load_async(10)
+
+        load_mock.assert_called_with(self.session, user, timeout=10, loop=None)
+
     @mock.patch("spotify.Link", spec=spotify.Link)
     def test_link_creates_link_to_user(self, link_mock, lib_mock):
         sp_user = spotify.ffi.cast("sp_user *", 42)
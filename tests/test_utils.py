@@ -2,11 +2,12 @@
 
 from __future__ import unicode_literals
 
+import threading
 import unittest
 
 import spotify
 import tests
-from spotify import utils
+from spotify import compat, utils
 from tests import mock
 
 
@@ -95,6 +96,28 @@ class EventEmitterTest(unittest.TestCase):
         self.assertEqual(listener_mock1.call_count, 1)
         self.assertEqual(listener_mock2.call_count, 2)
 
+    def test_listeners_changed_during_emit_take_effect_on_next_emit(self):
+        listener_mock1 = mock.Mock()
+        listener_mock2 = mock.Mock()
+        emitter = utils.EventEmitter()
+
+        def listener():
+            emitter.off("some_event", listener_mock1)
+            emitter.on("some_event", listener_mock2)
+
+        emitter.on("some_event", listener)
+        emitter.on("some_event", listener_mock1)
+        emitter.emit("some_event")
+
+        self.assertEqual(listener_mock1.call_count, 1)
+        self.assertEqual(listener_mock2.call_count, 0)
+
+        emitter.off("some_event", listener)
+        emitter.emit("some_event")
+
+        self.assertEqual(listener_mock1.call_count, 1)
+        self.assertEqual(listener_mock2.call_count, 1)
+
     def test_num_listeners_returns_total_number_of_listeners(self):
         listener_mock1 = mock.Mock()
         listener_mock2 = mock.Mock()
@@ -151,6 +174,162 @@ class EventEmitterTest(unittest.TestCase):
         self.assertEqual(result, listener_mock.return_value)
 
 
+class FakeExecutor(object):
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, fn):
+        self.tasks.append(fn)
+
+    def run_all(self):
+        while self.tasks:
+            self.tasks.pop(0)()
+
+
+class OffloadedListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.executor = FakeExecutor()
+        self.emitter = utils.EventEmitter()
+
+    def test_listener_is_called_by_executor(self):
+        listener_mock = mock.Mock()
+        self.emitter.on_executor(self.executor, "some_event", listener_mock, 1)
+
+        self.emitter.emit("some_event", "abc")
+
+        self.assertEqual(listener_mock.call_count, 0)
+        self.executor.run_all()
+        listener_mock.assert_called_once_with("abc", 1)
+
+    def test_queued_calls_are_run_in_order_by_a_single_task(self):
+        listener_mock = mock.Mock()
+        self.emitter.on_executor(self.executor, "some_event", listener_mock)
+
+        for i in range(5):
+            self.emitter.emit("some_event", i)
+
+        self.assertEqual(len(self.executor.tasks), 1)
+        self.executor.run_all()
+        self.assertEqual(
+            listener_mock.call_args_list, [mock.call(i) for i in range(5)]
+        )
+
+    @unittest.skipIf(compat.futures is None, "requires concurrent.futures")
+    def test_order_is_preserved_on_a_thread_pool(self):
+        received = []
+        executor = compat.futures.ThreadPoolExecutor(max_workers=4)
+        self.emitter.on_executor(executor, "some_event", received.append)
+
+        for i in range(200):
+            self.emitter.emit("some_event", i)
+        executor.shutdown(wait=True)
+
+        self.assertEqual(received, list(range(200)))
+
+    def test_emit_drops_calls_when_queue_is_full(self):
+        listener_mock = mock.Mock()
+        self.emitter.on_executor(
+            self.executor, "some_event", listener_mock, max_pending=1
+        )
+        self.emitter.emit("some_event", 1)
+
+        with mock.patch("spotify.utils.logger") as logger_mock:
+            self.emitter.emit("some_event", 2)
+
+        self.assertEqual(logger_mock.warning.call_count, 1)
+        self.executor.run_all()
+        self.assertEqual(listener_mock.call_args_list, [mock.call(1)])
+        listener = self.emitter._listeners["some_event"][0].callback
+        self.assertEqual(listener.dropped, 1)
+
+    @unittest.skipIf(compat.futures is None, "requires concurrent.futures")
+    def test_emit_under_global_lock_does_not_deadlock(self):
+        received = []
+
+        def listener(i):
+            with spotify._lock:
+                received.append(i)
+
+        executor = compat.futures.ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        self.emitter.on_executor(executor, "some_event", listener, max_pending=2)
+
+        def emit_all():
+            with spotify._lock:
+                for i in range(10):
+                    self.emitter.emit("some_event", i)
+
+        thread = threading.Thread(target=emit_all)
+        thread.start()
+        thread.join(1)
+
+        self.assertFalse(thread.is_alive())
+        executor.shutdown(wait=True)
+        self.assertEqual(received, sorted(received))
+        self.assertGreaterEqual(len(received), 1)
+
+    @unittest.skipIf(compat.futures is None, "requires concurrent.futures")
+    def test_emit_does_not_fail_if_executor_is_shut_down(self):
+        executor = compat.futures.ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        listener_mock = mock.Mock()
+        other_listener_mock = mock.Mock()
+        self.emitter.on_executor(executor, "some_event", listener_mock)
+        self.emitter.on("some_event", other_listener_mock)
+
+        with mock.patch("spotify.utils.logger") as logger_mock:
+            self.emitter.emit("some_event", 1)
+            self.emitter.emit("some_event", 2)
+
+        self.assertEqual(logger_mock.warning.call_count, 2)
+        self.assertEqual(other_listener_mock.call_count, 2)
+        listener = self.emitter._listeners["some_event"][0].callback
+        self.assertFalse(listener._running)
+        self.assertEqual(len(listener._queue), 0)
+        self.assertEqual(listener.dropped, 2)
+
+    def test_failing_listener_does_not_stop_later_calls(self):
+        listener_mock = mock.Mock(side_effect=[Exception("oops"), None])
+        self.emitter.on_executor(self.executor, "some_event", listener_mock)
+
+        self.emitter.emit("some_event", 1)
+        self.emitter.emit("some_event", 2)
+        with mock.patch("spotify.utils.logger") as logger_mock:
+            self.executor.run_all()
+
+        self.assertEqual(listener_mock.call_count, 2)
+        self.assertEqual(logger_mock.exception.call_count, 1)
+
+    def test_offloaded_listener_can_be_removed(self):
+        listener_mock = mock.Mock()
+        self.emitter.on_executor(self.executor, "some_event", listener_mock)
+
+        self.emitter.off("some_event", listener_mock)
+        self.emitter.emit("some_event")
+
+        self.assertEqual(self.emitter.num_listeners("some_event"), 0)
+        self.assertEqual(self.executor.tasks, [])
+
+    def test_unknown_keyword_arguments_fail(self):
+        with self.assertRaises(TypeError):
+            self.emitter.on_executor(self.executor, "some_event", id, foo=1)
+
+    @unittest.skipIf(compat.PY2, "requires asyncio")
+    def test_listener_is_called_by_asyncio_event_loop(self):
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        listener_mock = mock.Mock()
+        self.emitter.on_executor(loop, "some_event", listener_mock)
+
+        self.emitter.emit("some_event", "abc")
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+
+        listener_mock.assert_called_once_with("abc")
+
+
 class IntEnumTest(unittest.TestCase):
     def setUp(self):
         class Foo(utils.IntEnum):
@@ -175,6 +354,78 @@ class IntEnumTest(unittest.TestCase):
         self.assertIsNot(self.Foo(2), self.Foo.bar)
         self.assertIsNot(self.Foo(1), self.Foo.baz)
 
+    def test_unknown_value_is_cached(self):
+        result = self.Foo(3)
+
+        self.assertEqual(result, 3)
+        self.assertIs(self.Foo(3), result)
+        self.assertEqual(repr(result), "<Unknown Foo: 3>")
+
+    def test_each_enum_has_its_own_values(self):
+        class Bar(utils.IntEnum):
+            pass
+
+        Bar.add("qux", 1)
+
+        self.assertIsNot(Bar(1), self.Foo(1))
+        self.assertEqual(repr(Bar(1)), "<Bar.qux: 1>")
+
+
+class GetLibConstantsTest(unittest.TestCase):
+    def test_returns_constants_with_prefix_sorted_by_name(self):
+        result = utils.get_lib_constants("SP_LINKTYPE_")
+
+        self.assertIn(("SP_LINKTYPE_TRACK", spotify.lib.SP_LINKTYPE_TRACK), result)
+        self.assertEqual(result, sorted(result))
+        self.assertTrue(all(name.startswith("SP_LINKTYPE_") for name, _ in result))
+
+    def test_prefix_not_ending_with_underscore(self):
+        result = utils.get_lib_constants("SP_ERROR_BAD_API")
+
+        self.assertEqual(
+            result, [("SP_ERROR_BAD_API_VERSION", spotify.lib.SP_ERROR_BAD_API_VERSION)]
+        )
+
+    def test_unknown_prefix(self):
+        self.assertEqual(utils.get_lib_constants("SP_NO_SUCH_THING_"), [])
+
+    def test_returns_a_new_list(self):
+        utils.get_lib_constants("SP_ERROR_").append(None)
+
+        self.assertNotIn(None, utils.get_lib_constants("SP_ERROR_"))
+
+
+class FutureTest(unittest.TestCase):
+    def test_create_future(self):
+        future = utils.create_future()
+
+        self.assertFalse(future.done())
+
+    @mock.patch("spotify.utils.compat.futures", None)
+    def test_create_future_without_futures_backport(self):
+        self.assertIsNone(utils.create_future())
+
+    def test_complete_future_with_object(self):
+        obj = mock.Mock(error=spotify.ErrorType.OK)
+        obj.future = utils.create_future()
+
+        utils.complete_future(obj)
+
+        self.assertEqual(obj.future.result(timeout=0), obj)
+
+    def test_complete_future_with_error(self):
+        obj = mock.Mock(error=spotify.ErrorType.OTHER_PERMANENT)
+        obj.future = utils.create_future()
+
+        utils.complete_future(obj)
+
+        self.assertIsInstance(obj.future.exception(timeout=0), spotify.LibError)
+
+    def test_complete_future_without_future(self):
+        obj = mock.Mock(future=None)
+
+        utils.complete_future(obj)
+
 
 @mock.patch("spotify.search.lib", spec=spotify.lib)
 class SequenceTest(unittest.TestCase):